@@ -1,32 +1,185 @@
-import math
+import asyncio
 import os
 import sys
-from contextlib import asynccontextmanager
-from datetime import date, datetime
-from decimal import Decimal
+import time
+from contextlib import aclosing, asynccontextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
-import numpy as np
 import pandas as pd
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 
 load_dotenv()
 
 cli_path = Path(__file__).parent.parent.parent / "cli"
 sys.path.insert(0, str(cli_path))
 
-from nao_core.config import NaoConfig, NaoConfigError
+from nao_core.config import NaoConfigError
+from nao_core.config.databases.base import DatabaseConfig
 from nao_core.context import get_context_provider
+from nao_core.server import (
+    ARROW_STREAM_MEDIA_TYPE,
+    METRICS_CONTENT_TYPE,
+    NDJSON_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE,
+    CachedResponse,
+    ConfigCache,
+    ConnectionPool,
+    CursorNotFoundError,
+    CursorRegistry,
+    MetricsRegistry,
+    QueryCancelledError,
+    QueryExecutor,
+    QueryHandle,
+    QueryTimeoutError,
+    ResultCache,
+    dataframe_to_columns,
+    dataframe_to_ndjson,
+    dataframe_to_records,
+    iterate_in_worker,
+    negotiate_media_type,
+    table_to_bytes,
+)
 
 port = int(os.environ.get("PORT", 8005))
 
 # Global scheduler instance
 scheduler = None
 
+# Parsed nao_config.yaml per project folder, reloaded when the file changes
+config_cache = ConfigCache()
+
+# Warm database connections shared across /execute_sql requests
+connection_pool = ConnectionPool(
+    max_size=int(os.environ.get("NAO_SQL_POOL_SIZE", 4)),
+    idle_timeout_s=float(os.environ.get("NAO_SQL_POOL_IDLE_TIMEOUT", 300)),
+    health_check_interval_s=float(
+        os.environ.get("NAO_SQL_POOL_HEALTH_CHECK_INTERVAL", 30)
+    ),
+)
+
+# Partially read results kept open so clients can fetch further pages
+cursor_registry = CursorRegistry(
+    connection_pool,
+    ttl_s=float(os.environ.get("NAO_SQL_CURSOR_TTL", 120)),
+    max_open=int(os.environ.get("NAO_SQL_MAX_OPEN_CURSORS", 16)),
+)
+
+# Results of repeated read queries, for databases with a query_cache_ttl_s
+result_cache = ResultCache(
+    max_entries=int(os.environ.get("NAO_SQL_RESULT_CACHE_SIZE", 256)),
+    max_entry_rows=int(os.environ.get("NAO_SQL_RESULT_CACHE_MAX_ROWS", 10_000)),
+)
+
+# How often a running query checks whether its client is still connected
+DISCONNECT_POLL_INTERVAL_S = 0.5
+
+# Upper bound on the rows returned by a single /execute_sql response
+sql_max_rows = int(os.environ.get("NAO_SQL_MAX_ROWS", 100_000))
+
+# Rows per chunk when streaming a result as NDJSON
+NDJSON_CHUNK_ROWS = 1_000
+
+# Worker threads running the (blocking) database drivers off the event loop
+query_executor = QueryExecutor(
+    max_workers=int(os.environ.get("NAO_SQL_MAX_WORKERS", 8)),
+    per_key_limit=int(
+        os.environ.get("NAO_SQL_MAX_CONCURRENCY_PER_DATABASE", connection_pool.max_size)
+    ),
+)
+
+
+def _pool_connections() -> dict[tuple[str, ...], float]:
+    usage: dict[tuple[str, ...], float] = {}
+    for (_, database), stats in connection_pool.stats().items():
+        for state, count in stats.items():
+            usage[(database, state)] = usage.get((database, state), 0) + count
+    return usage
+
+
+def _result_cache_hit_ratio() -> dict[tuple[str, ...], float]:
+    lookups = result_cache.hits + result_cache.misses
+    return {(): result_cache.hits / lookups if lookups else 0.0}
+
+
+# Prometheus-style metrics served by /metrics
+metrics = MetricsRegistry()
+sql_query_duration = metrics.histogram(
+    "nao_sql_query_duration_seconds",
+    "Time to answer an /execute_sql request (to the first chunk when streaming)",
+    ["database", "db_type"],
+)
+sql_rows_returned = metrics.counter(
+    "nao_sql_rows_returned_total",
+    "Rows returned by /execute_sql, cursor pages included",
+    ["database", "db_type"],
+)
+sql_response_bytes = metrics.counter(
+    "nao_sql_response_bytes_total",
+    "Bytes of serialized /execute_sql results",
+    ["database", "db_type", "format"],
+)
+sql_errors = metrics.counter(
+    "nao_sql_errors_total",
+    "Failed /execute_sql requests by exception class",
+    ["exception"],
+)
+context_refresh_duration = metrics.histogram(
+    "nao_context_refresh_duration_seconds",
+    "Time to refresh the context",
+    ["trigger", "status"],
+)
+metrics.gauge(
+    "nao_sql_pool_connections",
+    "Pooled database connections by state (idle or in_use)",
+    ["database", "state"],
+    collect=_pool_connections,
+)
+metrics.gauge(
+    "nao_sql_queries_running",
+    "Queries running in worker threads",
+    collect=lambda: {(): query_executor.running},
+)
+metrics.gauge(
+    "nao_sql_queries_queued",
+    "Queries waiting for a worker thread",
+    collect=lambda: {(): query_executor.queue_depth},
+)
+metrics.gauge(
+    "nao_sql_open_cursors",
+    "Paginated results kept open",
+    collect=lambda: {(): len(cursor_registry)},
+)
+metrics.counter(
+    "nao_sql_result_cache_hits_total",
+    "Queries answered from the result cache",
+    collect=lambda: {(): result_cache.hits},
+)
+metrics.counter(
+    "nao_sql_result_cache_misses_total",
+    "Cacheable queries not found in the result cache",
+    collect=lambda: {(): result_cache.misses},
+)
+metrics.gauge(
+    "nao_sql_result_cache_hit_ratio",
+    "Share of cacheable queries answered from the result cache",
+    collect=_result_cache_hit_ratio,
+)
+
+_RESULT_FORMATS = {
+    None: "json",
+    ARROW_STREAM_MEDIA_TYPE: "arrow",
+    PARQUET_MEDIA_TYPE: "parquet",
+    NDJSON_MEDIA_TYPE: "ndjson",
+}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -54,18 +207,41 @@ async def lifespan(app: FastAPI):
         except ValueError as e:
             print(f"[Scheduler] Invalid cron expression '{refresh_schedule}': {e}")
 
+    eviction_task = asyncio.create_task(_evict_idle_connections_task())
+
     yield
 
     # Shutdown scheduler
     if scheduler:
         scheduler.shutdown(wait=False)
 
+    eviction_task.cancel()
+    query_executor.shutdown()
+    cursor_registry.close_all()
+    connection_pool.close_all()
+
+
+async def _refresh_context(trigger: str) -> bool:
+    """Refresh the context and drop what was derived from the previous one."""
+    start = time.perf_counter()
+    status = "error"
+    try:
+        provider = get_context_provider()
+        updated = await run_in_threadpool(provider.refresh)
+        config_cache.invalidate()
+        result_cache.clear()
+        status = "updated" if updated else "unchanged"
+        return updated
+    finally:
+        context_refresh_duration.observe(
+            time.perf_counter() - start, trigger=trigger, status=status
+        )
+
 
 async def _refresh_context_task():
     """Background task for scheduled context refresh."""
     try:
-        provider = get_context_provider()
-        updated = provider.refresh()
+        updated = await _refresh_context("scheduled")
         if updated:
             print(f"[Scheduler] Context refreshed at {datetime.now().isoformat()}")
         else:
@@ -76,6 +252,15 @@ async def _refresh_context_task():
         print(f"[Scheduler] Failed to refresh context: {e}")
 
 
+async def _evict_idle_connections_task():
+    """Background task closing expired cursors and connections idle for too long."""
+    interval = max(min(connection_pool.idle_timeout_s, cursor_registry.ttl_s) / 2, 1)
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(cursor_registry.evict_expired)
+        await run_in_threadpool(connection_pool.evict_idle)
+
+
 app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
@@ -91,16 +276,39 @@ app.add_middleware(
 # =============================================================================
 
 
+ResultOrient = Literal["records", "columns"]
+
+
 class ExecuteSQLRequest(BaseModel):
     sql: str
     nao_project_folder: str
     database_id: str | None = None
+    # "records": list of row objects; "columns": column name -> list of values
+    orient: ResultOrient = "records"
+    # Return at most this many rows (capped by NAO_SQL_MAX_ROWS); the rest is dropped
+    max_rows: int | None = Field(default=None, gt=0)
+    # Return this many rows and a `cursor_id` to fetch the next page with
+    page_size: int | None = Field(default=None, gt=0)
+
+    @model_validator(mode="after")
+    def _check_row_limits(self):
+        if self.max_rows is not None and self.page_size is not None:
+            raise ValueError("Set either max_rows or page_size, not both")
+        return self
+
+
+class FetchCursorRequest(BaseModel):
+    orient: ResultOrient = "records"
 
 
 class ExecuteSQLResponse(BaseModel):
-    data: list[dict]
+    data: list[dict] | dict[str, list]
     row_count: int
     columns: list[str]
+    # More rows exist than were returned
+    truncated: bool = False
+    # Set when truncated and paginating: pass to /execute_sql/cursors/{cursor_id}
+    cursor_id: str | None = None
 
 
 class RefreshResponse(BaseModel):
@@ -114,48 +322,327 @@ class HealthResponse(BaseModel):
     context_source: str
     context_initialized: bool
     refresh_schedule: str | None
+    sql_queries_running: int = 0
+    sql_queries_queued: int = 0
+    sql_open_cursors: int = 0
+
+
+def _record_result(
+    db_config: DatabaseConfig, result_format: str, rows: int, size: int
+) -> None:
+    labels = {"database": db_config.name, "db_type": db_config.type}
+    sql_rows_returned.inc(rows, **labels)
+    sql_response_bytes.inc(size, format=result_format, **labels)
+
+
+def _record_error(e: Exception) -> None:
+    sql_errors.inc(exception=type(e).__name__)
+
+
+def _row_limit(requested: int | None) -> int:
+    return min(requested or sql_max_rows, sql_max_rows)
+
+
+def _build_response(
+    df: pd.DataFrame,
+    orient: ResultOrient,
+    truncated: bool,
+    cursor_id: str | None = None,
+) -> Response:
+    """Encode an `ExecuteSQLResponse`, in the worker thread rather than on the event loop."""
+    if orient == "columns":
+        data = dataframe_to_columns(df)
+    else:
+        data = dataframe_to_records(df)
+
+    result = ExecuteSQLResponse(
+        data=data,
+        row_count=len(df),
+        columns=[str(c) for c in df.columns.tolist()],
+        truncated=truncated,
+        cursor_id=cursor_id,
+    )
+    return Response(
+        content=result.model_dump_json(),
+        media_type="application/json",
+        headers={"X-Row-Count": str(result.row_count)},
+    )
+
+
+def _run_query(
+    handle: QueryHandle,
+    project_folder: str,
+    db_config: DatabaseConfig,
+    sql: str,
+    orient: ResultOrient = "records",
+    max_rows: int | None = None,
+    page_size: int | None = None,
+) -> Response:
+    """Execute a query on a pooled connection. Blocking: runs in a worker thread.
+
+    Only the rows returned are read from the database. When paginating, the
+    cursor (and its connection) is kept open for the next page.
+    """
+    limit = _row_limit(page_size or max_rows)
+    lease = connection_pool.acquire(project_folder, db_config)
+    try:
+        with handle.running(db_config, lease.conn):
+            cursor = db_config.open_cursor(sql, conn=lease.conn)
+            df = cursor.fetch(limit)
+            has_more = cursor.has_more()
+    except BaseException:
+        connection_pool.release(lease, failed=True)
+        raise
+
+    if has_more and page_size:
+        cursor_id = cursor_registry.register(cursor, lease, page_size=limit)
+        return _build_response(df, orient, truncated=True, cursor_id=cursor_id)
 
+    try:
+        cursor.close()
+    finally:
+        connection_pool.release(lease)
+    return _build_response(df, orient, truncated=has_more)
 
-def _convert_value(v: object):
-    """Convert a DataFrame cell to a JSON-serializable Python type."""
-    if v is None:
-        return None
-
-    # Handle float NaN / Infinity early (common in pandas output)
-    if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-        return None
-
-    # Handle pandas NA / NaT sentinels
-    if v is pd.NA or v is pd.NaT:
-        return None
-
-    # Numpy scalar types
-    if isinstance(v, np.bool_):
-        return bool(v)
-    if isinstance(v, np.integer):
-        return int(v)
-    if isinstance(v, np.floating):
-        val = float(v)
-        return None if math.isnan(val) or math.isinf(val) else val
-    if isinstance(v, np.ndarray):
-        return v.tolist()
-
-    # Python / DB types that aren't JSON-serializable by default
-    if isinstance(v, Decimal):
-        if v.is_nan() or v.is_infinite():
-            return None
-        return float(v)
-    if isinstance(v, (datetime, date)):
-        return v.isoformat()
-    if isinstance(v, bytes):
-        return v.decode("utf-8", errors="replace")
-
-    # Catch-all for remaining numpy scalars (e.g. np.str_, np.bytes_)
-    item_method = getattr(v, "item", None)
-    if callable(item_method):
-        return item_method()
-
-    return v
+
+def _fetch_page(handle: QueryHandle, cursor_id: str, orient: ResultOrient) -> Response:
+    """Read the next page of an open cursor. Blocking: runs in a worker thread."""
+    entry = cursor_registry.checkout(cursor_id)
+    db_config = entry.lease.db_config
+    try:
+        with handle.running(db_config, entry.lease.conn):
+            df = entry.cursor.fetch(entry.page_size)
+            has_more = entry.cursor.has_more()
+    except BaseException:
+        cursor_registry.finish(entry, failed=True)
+        raise
+
+    if has_more:
+        cursor_registry.checkin(entry)
+        response = _build_response(df, orient, truncated=True, cursor_id=cursor_id)
+    else:
+        cursor_registry.finish(entry)
+        response = _build_response(df, orient, truncated=False)
+    _record_result(db_config, "json", len(df), len(response.body))
+    return response
+
+
+def _run_binary_query(
+    handle: QueryHandle,
+    project_folder: str,
+    db_config: DatabaseConfig,
+    sql: str,
+    media_type: str,
+    max_rows: int | None = None,
+) -> Response:
+    """Execute a query and encode the Arrow result. Blocking: runs in a worker thread."""
+    limit = _row_limit(max_rows)
+    with connection_pool.connection(project_folder, db_config) as conn:
+        with handle.running(db_config, conn):
+            # One extra row tells whether the result was truncated
+            table = db_config.execute_arrow(sql, conn=conn, limit=limit + 1)
+
+    truncated = table.num_rows > limit
+    table = table.slice(0, limit)
+    return Response(
+        content=table_to_bytes(table, media_type),
+        media_type=media_type,
+        headers={
+            "X-Row-Count": str(table.num_rows),
+            "X-Truncated": str(truncated).lower(),
+        },
+    )
+
+
+def _stream_query(
+    emit,
+    handle: QueryHandle,
+    project_folder: str,
+    db_config: DatabaseConfig,
+    sql: str,
+    max_rows: int | None = None,
+) -> None:
+    """Pass the result to `emit` as NDJSON chunks. Blocking: runs in a worker thread.
+
+    Rows are fetched from the driver in batches while earlier chunks are sent,
+    so only a few chunks of the result are ever held in memory. The query
+    timeout applies to each fetch, not to the time the client takes to read.
+    """
+    remaining = max_rows if max_rows is not None else float("inf")
+    lease = connection_pool.acquire(project_folder, db_config)
+    failed = False
+    try:
+        with handle.running(db_config, lease.conn):
+            cursor = db_config.open_cursor(sql, conn=lease.conn)
+        try:
+            while remaining > 0:
+                with handle.running(db_config, lease.conn):
+                    df = cursor.fetch(int(min(remaining, NDJSON_CHUNK_ROWS)))
+                if df.empty:
+                    break
+                remaining -= len(df)
+                emit(dataframe_to_ndjson(df))
+        finally:
+            cursor.close()
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        connection_pool.release(lease, failed=failed)
+
+
+async def _stream_ndjson(
+    key,
+    project_folder: str,
+    db_config: DatabaseConfig,
+    sql: str,
+    max_rows: int | None = None,
+) -> Response:
+    """Run `_stream_query` and stream its chunks as they are produced.
+
+    The first chunk is awaited before responding, so errors raised while
+    running the query still map to an HTTP error status. Errors after that
+    abort the response mid-stream. A client disconnecting cancels the query.
+    """
+    handle = QueryHandle()
+    chunks = iterate_in_worker(
+        query_executor,
+        key,
+        _stream_query,
+        handle,
+        project_folder,
+        db_config,
+        sql,
+        max_rows,
+        on_close=lambda: handle.cancel("client disconnected"),
+    )
+    try:
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        return Response(
+            content=b"", media_type=NDJSON_MEDIA_TYPE, headers={"X-Row-Count": "0"}
+        )
+
+    async def body():
+        async with aclosing(chunks):
+            chunk = first
+            try:
+                while True:
+                    # One row per line
+                    _record_result(db_config, "ndjson", chunk.count(b"\n"), len(chunk))
+                    yield chunk
+                    chunk = await anext(chunks)
+            except StopAsyncIteration:
+                pass
+            except Exception as e:
+                _record_error(e)
+                raise
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _run_cancellable(http_request: Request, key, fn, *args):
+    """Run `fn(handle, *args)` on the query executor.
+
+    The query is cancelled on the database if the client disconnects before it
+    completes, instead of running to completion for nobody.
+    """
+    handle = QueryHandle()
+    task = asyncio.ensure_future(query_executor.run(key, fn, handle, *args))
+    try:
+        while not task.done():
+            await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL_S)
+            if not task.done() and await http_request.is_disconnected():
+                await run_in_threadpool(handle.cancel, "client disconnected")
+                break
+        return await task
+    except asyncio.CancelledError:
+        asyncio.get_running_loop().run_in_executor(
+            None, handle.cancel, "request cancelled"
+        )
+        raise
+
+
+async def _answer_query(
+    request: ExecuteSQLRequest,
+    http_request: Request,
+    project_folder: str,
+    db_config: DatabaseConfig,
+    media_type: str | None,
+) -> Response:
+    """Answer an `/execute_sql` request in the negotiated format, from cache if possible."""
+    if media_type == NDJSON_MEDIA_TYPE:
+        return await _stream_ndjson(
+            (project_folder, db_config.name),
+            project_folder,
+            db_config,
+            request.sql,
+            request.max_rows,
+        )
+    if media_type is not None:
+        return await _run_cancellable(
+            http_request,
+            (project_folder, db_config.name),
+            _run_binary_query,
+            project_folder,
+            db_config,
+            request.sql,
+            media_type,
+            request.max_rows,
+        )
+
+    cache_key = None
+    if request.page_size is None:
+        cache_key = result_cache.key(
+            project_folder,
+            db_config,
+            request.sql,
+            variant=(request.orient, _row_limit(request.max_rows)),
+        )
+    if cache_key is not None:
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            return Response(
+                content=cached.body,
+                media_type=cached.media_type,
+                headers=cached.headers,
+            )
+
+    response = await _run_cancellable(
+        http_request,
+        (project_folder, db_config.name),
+        _run_query,
+        project_folder,
+        db_config,
+        request.sql,
+        request.orient,
+        request.max_rows,
+        request.page_size,
+    )
+    if cache_key is not None:
+        result_cache.put(
+            cache_key,
+            CachedResponse(
+                body=bytes(response.body),
+                media_type=response.media_type,
+                # Content-Length and Content-Type are set again from the body and media type
+                headers={
+                    name: value
+                    for name, value in response.headers.items()
+                    if name not in ("content-length", "content-type")
+                },
+            ),
+            ttl_s=db_config.query_cache_ttl_s,
+            rows=int(response.headers["x-row-count"]),
+        )
+    return response
+
+
+def _cancelled_error(e: QueryCancelledError) -> HTTPException:
+    if isinstance(e, QueryTimeoutError):
+        return HTTPException(status_code=504, detail=str(e))
+    # 499: client closed the request (nobody is left to read the response)
+    return HTTPException(status_code=499, detail=str(e))
 
 
 # =============================================================================
@@ -174,6 +661,9 @@ async def health_check():
             context_source=context_source,
             context_initialized=provider.is_initialized(),
             refresh_schedule=os.environ.get("NAO_REFRESH_SCHEDULE"),
+            sql_queries_running=query_executor.running,
+            sql_queries_queued=query_executor.queue_depth,
+            sql_open_cursors=len(cursor_registry),
         )
     except Exception:
         return HealthResponse(
@@ -184,6 +674,12 @@ async def health_check():
         )
 
 
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus metrics: query latency, rows and bytes returned, errors, pool and cache usage."""
+    return Response(content=metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.post("/api/refresh", response_model=RefreshResponse)
 async def refresh_context():
     """Trigger a context refresh (git pull if using git source).
@@ -192,10 +688,11 @@ async def refresh_context():
     - CI/CD pipelines after pushing new context
     - Webhooks when data schemas change
     - Manual triggers for immediate updates
+
+    Cached SQL results are dropped, since the underlying data may have changed.
     """
     try:
-        provider = get_context_provider()
-        updated = provider.refresh()
+        updated = await _refresh_context("api")
 
         if updated:
             return RefreshResponse(
@@ -216,14 +713,44 @@ async def refresh_context():
         )
 
 
-@app.post("/execute_sql", response_model=ExecuteSQLResponse)
-async def execute_sql(request: ExecuteSQLRequest):
+@app.post(
+    "/execute_sql",
+    response_model=ExecuteSQLResponse,
+    responses={
+        200: {
+            "content": {
+                ARROW_STREAM_MEDIA_TYPE: {},
+                PARQUET_MEDIA_TYPE: {},
+                NDJSON_MEDIA_TYPE: {},
+            }
+        }
+    },
+)
+async def execute_sql(
+    request: ExecuteSQLRequest,
+    http_request: Request,
+    accept: str | None = Header(None),
+):
+    """Run SQL against a configured database.
+
+    At most NAO_SQL_MAX_ROWS rows are returned (fewer with `max_rows`), and
+    `truncated` tells whether the result had more. With `page_size`, the rest
+    of the result can be read page by page from `/execute_sql/cursors/{cursor_id}`.
+
+    JSON results of read queries are served from cache for databases with a
+    `query_cache_ttl_s`, until the TTL expires or `/api/refresh` is called.
+
+    The result is JSON by default. Send `Accept: application/vnd.apache.arrow.stream`
+    (or `application/vnd.apache.parquet`) to receive it as Arrow IPC (or Parquet).
+
+    With `Accept: application/x-ndjson`, rows are streamed as they are fetched,
+    one JSON object per line. Streams are not capped by NAO_SQL_MAX_ROWS (only
+    by `max_rows`), since the result is never held in memory as a whole.
+    """
     try:
         # Load the nao config from the project folder
-        project_path = Path(request.nao_project_folder)
-        os.chdir(project_path)
-        config = NaoConfig.try_load(project_path, raise_on_error=True)
-        assert config is not None
+        project_path = Path(request.nao_project_folder).resolve()
+        config = config_cache.get(project_path)
 
         if len(config.databases) == 0:
             raise HTTPException(
@@ -260,26 +787,74 @@ async def execute_sql(request: ExecuteSQLRequest):
                 },
             )
 
-        df = db_config.execute_sql(request.sql)
-
-        data = [
-            {k: _convert_value(v) for k, v in row.items()}
-            for row in df.to_dict(orient="records")
-        ]
-
-        return ExecuteSQLResponse(
-            data=data,
-            row_count=len(data),
-            columns=[str(c) for c in df.columns.tolist()],
-        )
+        media_type = negotiate_media_type(accept)
+        if media_type is not None and request.page_size is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="page_size is only supported for JSON results",
+            )
+        with sql_query_duration.time(database=db_config.name, db_type=db_config.type):
+            response = await _answer_query(
+                request, http_request, str(project_path), db_config, media_type
+            )
+        if not isinstance(response, StreamingResponse):
+            # Streams count their rows and bytes as they are sent
+            _record_result(
+                db_config,
+                _RESULT_FORMATS[media_type],
+                int(response.headers["x-row-count"]),
+                len(response.body),
+            )
+        return response
     except HTTPException:
         raise
     except NaoConfigError as e:
+        _record_error(e)
         raise HTTPException(status_code=400, detail=str(e))
+    except QueryCancelledError as e:
+        _record_error(e)
+        raise _cancelled_error(e)
     except Exception as e:
+        _record_error(e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/execute_sql/cursors/{cursor_id}", response_model=ExecuteSQLResponse)
+async def fetch_cursor(
+    cursor_id: str,
+    http_request: Request,
+    request: FetchCursorRequest | None = None,
+):
+    """Fetch the next page of a paginated `/execute_sql` result.
+
+    The cursor is closed once its last page has been returned.
+    """
+    orient = request.orient if request else "records"
+    try:
+        key = cursor_registry.key(cursor_id)
+        return await _run_cancellable(http_request, key, _fetch_page, cursor_id, orient)
+    except CursorNotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Cursor '{cursor_id}' not found or expired"
+        )
+    except QueryCancelledError as e:
+        _record_error(e)
+        raise _cancelled_error(e)
+    except Exception as e:
+        _record_error(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.delete("/execute_sql/cursors/{cursor_id}", status_code=204)
+async def close_cursor(cursor_id: str):
+    """Close a paginated result before reading all of its pages."""
+    if not await run_in_threadpool(cursor_registry.close, cursor_id):
+        raise HTTPException(
+            status_code=404, detail=f"Cursor '{cursor_id}' not found or expired"
+        )
+    return Response(status_code=204)
+
+
 if __name__ == "__main__":
     nao_project_folder = os.getenv("NAO_DEFAULT_PROJECT_PATH")
     if nao_project_folder:
@@ -1,14 +1,26 @@
+import asyncio
+import io
+import json
 import tempfile
+import time
+from decimal import Decimal
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import yaml
 from fastapi.testclient import TestClient
 
-from main import app
+from main import _run_cancellable, app, result_cache
+from nao_core.server import QueryCancelledError, QueryHandle
 
 
-def assert_sql_result(data: dict, *, row_count: int, columns: list[str], expected_data: list[dict]):
+def assert_sql_result(
+    data: dict, *, row_count: int, columns: list[str], expected_data: list[dict]
+):
     """Assert that SQL response data matches expected values."""
     assert data["row_count"] == row_count
     assert data["columns"] == columns
@@ -78,8 +90,345 @@ def test_execute_sql_with_cte_duckdb(duckdb_project_folder):
     )
 
 
+def _write_duckdb_file_project(tmpdir: str, **settings) -> Path:
+    """Write a project whose database is a DuckDB file holding an `events` table, return the file path."""
+    db_path = Path(tmpdir) / "warehouse.duckdb"
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE TABLE events AS SELECT 1 AS id")
+    config = {
+        "project_name": "test-project",
+        "databases": [
+            {"name": "file-duckdb", "type": "duckdb", "path": str(db_path), **settings}
+        ],
+    }
+    with (Path(tmpdir) / "nao_config.yaml").open("w") as f:
+        yaml.dump(config, f)
+    return db_path
+
+
+def _count_events(
+    client: TestClient,
+    project_folder: str,
+    sql: str = "SELECT count(*) AS n FROM events",
+) -> int:
+    response = client.post(
+        "/execute_sql", json={"sql": sql, "nao_project_folder": project_folder}
+    )
+    assert response.status_code == 200
+    return response.json()["data"][0]["n"]
+
+
+def test_execute_sql_releases_file_lock_duckdb():
+    """Test that DuckDB files are not kept open between requests, so writers are not locked out."""
+    client = TestClient(app)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = _write_duckdb_file_project(tmpdir)
+        assert _count_events(client, tmpdir) == 1
+
+        with duckdb.connect(str(db_path)) as writer:
+            writer.execute("INSERT INTO events VALUES (2)")
+
+        assert _count_events(client, tmpdir) == 2
+
+
+def test_execute_sql_columns_orient_duckdb(duckdb_project_folder):
+    """Test execute_sql endpoint returning a column-oriented result."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT * FROM (VALUES (1, 'a', 1.5), (2, NULL, 'NaN'::DOUBLE)) AS t(id, name, score)",
+            "nao_project_folder": duckdb_project_folder,
+            "orient": "columns",
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["row_count"] == 2
+    assert data["columns"] == ["id", "name", "score"]
+    assert data["data"] == {"id": [1, 2], "name": ["a", None], "score": [1.5, None]}
+
+
+@pytest.mark.parametrize(
+    "media_type",
+    ["application/vnd.apache.arrow.stream", "application/vnd.apache.parquet"],
+)
+def test_execute_sql_binary_output_duckdb(duckdb_project_folder, media_type):
+    """Test execute_sql endpoint returning Arrow IPC or Parquet when requested."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        headers={"Accept": media_type},
+        json={
+            "sql": "SELECT 1 AS id, 'hello' AS message, 1.50::DECIMAL(5, 2) AS amount",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert response.headers["x-row-count"] == "1"
+    assert response.headers["x-truncated"] == "false"
+    if media_type == "application/vnd.apache.parquet":
+        table = pq.read_table(io.BytesIO(response.content))
+    else:
+        table = pa.ipc.open_stream(response.content).read_all()
+    assert table.to_pylist() == [
+        {"id": 1, "message": "hello", "amount": Decimal("1.50")}
+    ]
+
+
+def test_execute_sql_ndjson_stream_duckdb(duckdb_project_folder):
+    """Test streaming a result larger than one chunk as NDJSON."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        headers={"Accept": "application/x-ndjson"},
+        json={
+            "sql": "SELECT range AS id FROM range(2500)",
+            "nao_project_folder": duckdb_project_folder,
+            "max_rows": 2100,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == [{"id": i} for i in range(2100)]
+
+
+def test_execute_sql_ndjson_errors_duckdb(duckdb_project_folder):
+    """Test that empty streams succeed and failing queries keep an HTTP error status."""
+    client = TestClient(app)
+
+    empty = client.post(
+        "/execute_sql",
+        headers={"Accept": "application/x-ndjson"},
+        json={
+            "sql": "SELECT range AS id FROM range(0)",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+    invalid = client.post(
+        "/execute_sql",
+        headers={"Accept": "application/x-ndjson"},
+        json={
+            "sql": "SELECT * FROM missing_table",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+
+    assert empty.status_code == 200
+    assert empty.text == ""
+    assert invalid.status_code == 500
+    assert "missing_table" in invalid.json()["detail"]
+
+
+def test_metrics_after_queries_duckdb(duckdb_project_folder):
+    """Test that /metrics reports latency, rows, bytes and errors per database."""
+    client = TestClient(app)
+
+    client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT range AS id FROM range(7)",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+    client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT * FROM missing_table",
+            "nao_project_folder": duckdb_project_folder,
+        },
+    )
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    samples = dict(
+        line.rsplit(" ", 1)
+        for line in response.text.splitlines()
+        if not line.startswith("#")
+    )
+    labels = '{database="test-duckdb",db_type="duckdb"}'
+    assert int(samples[f"nao_sql_query_duration_seconds_count{labels}"]) >= 2
+    assert int(samples[f"nao_sql_rows_returned_total{labels}"]) >= 7
+    json_labels = '{database="test-duckdb",db_type="duckdb",format="json"}'
+    assert int(samples[f"nao_sql_response_bytes_total{json_labels}"]) > 0
+    assert int(samples['nao_sql_errors_total{exception="CatalogException"}']) >= 1
+    assert "nao_sql_result_cache_hit_ratio" in samples
+
+
+def test_execute_sql_max_rows_truncates_duckdb(duckdb_project_folder):
+    """Test that execute_sql only returns max_rows rows and flags the truncation."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT range AS id FROM range(10)",
+            "nao_project_folder": duckdb_project_folder,
+            "max_rows": 3,
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert data["truncated"] is True
+    assert data["cursor_id"] is None
+
+
+def test_execute_sql_pagination_duckdb(duckdb_project_folder):
+    """Test reading a result page by page through a cursor."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT range AS id FROM range(5)",
+            "nao_project_folder": duckdb_project_folder,
+            "page_size": 2,
+        },
+    )
+    pages = [response.json()]
+    while pages[-1]["cursor_id"]:
+        response = client.post(f"/execute_sql/cursors/{pages[-1]['cursor_id']}")
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    assert [page["row_count"] for page in pages] == [2, 2, 1]
+    assert [row["id"] for page in pages for row in page["data"]] == [0, 1, 2, 3, 4]
+    assert pages[-1]["truncated"] is False
+
+    # The cursor is closed once exhausted
+    response = client.post(f"/execute_sql/cursors/{pages[0]['cursor_id']}")
+    assert response.status_code == 404
+
+
+def test_execute_sql_close_cursor_duckdb(duckdb_project_folder):
+    """Test closing a cursor before reading all of its pages."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT range AS id FROM range(5)",
+            "nao_project_folder": duckdb_project_folder,
+            "page_size": 2,
+        },
+    )
+    cursor_id = response.json()["cursor_id"]
+
+    assert client.delete(f"/execute_sql/cursors/{cursor_id}").status_code == 204
+    assert client.delete(f"/execute_sql/cursors/{cursor_id}").status_code == 404
+
+
+def test_execute_sql_rejects_max_rows_with_page_size_duckdb(duckdb_project_folder):
+    """Test that max_rows and page_size cannot be combined."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute_sql",
+        json={
+            "sql": "SELECT 1",
+            "nao_project_folder": duckdb_project_folder,
+            "max_rows": 1,
+            "page_size": 1,
+        },
+    )
+
+    assert response.status_code == 422
+
+
+def test_execute_sql_result_cache_duckdb():
+    """Test that repeated read queries are served from the result cache."""
+    client = TestClient(app)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = _write_duckdb_file_project(tmpdir, query_cache_ttl_s=60)
+        assert _count_events(client, tmpdir) == 1
+
+        with duckdb.connect(str(db_path)) as writer:
+            writer.execute("INSERT INTO events VALUES (2)")
+
+        # Served from cache, for the same query written differently too
+        assert (
+            _count_events(client, tmpdir, "SELECT count(*) AS n\n  FROM events;") == 1
+        )
+        hits = [
+            client.post(
+                "/execute_sql",
+                json={
+                    "sql": "SELECT count(*) AS n FROM events",
+                    "nao_project_folder": tmpdir,
+                },
+            )
+            for _ in range(2)
+        ]
+        assert [hit.content for hit in hits] == [hits[0].content] * 2
+        assert [hit.headers["x-row-count"] for hit in hits] == ["1", "1"]
+
+        result_cache.clear()
+        assert _count_events(client, tmpdir) == 2
+
+
+def test_execute_sql_query_timeout_duckdb():
+    """Test that queries running past query_timeout_s are cancelled."""
+    client = TestClient(app)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = {
+            "project_name": "test-project",
+            "databases": [
+                {
+                    "name": "slow-duckdb",
+                    "type": "duckdb",
+                    "path": ":memory:",
+                    "query_timeout_s": 0.2,
+                }
+            ],
+        }
+        with (Path(tmpdir) / "nao_config.yaml").open("w") as f:
+            yaml.dump(config, f)
+
+        response = client.post(
+            "/execute_sql",
+            json={
+                "sql": "SELECT sum(a.range * b.range) "
+                "FROM range(100000000) a, range(100000) b",
+                "nao_project_folder": tmpdir,
+            },
+        )
+
+    assert response.status_code == 504
+    assert "0.2s query timeout" in response.json()["detail"]
+
+
+def test_run_cancellable_cancels_query_on_client_disconnect():
+    """Test that a running query is cancelled once the client goes away."""
+
+    class DisconnectedRequest:
+        async def is_disconnected(self):
+            return True
+
+    def slow_query(handle: QueryHandle):
+        with handle.running(MagicMock(query_timeout_s=None), MagicMock()):
+            while not handle.cancelled:
+                time.sleep(0.01)
+            raise RuntimeError("interrupted by the driver")
+
+    with pytest.raises(QueryCancelledError, match="client disconnected"):
+        asyncio.run(_run_cancellable(DisconnectedRequest(), "db", slow_query))
+
+
 # BigQuery tests (requires SSO authentication)
 
+
 @pytest.fixture
 def bigquery_project_folder():
     """Create a temporary project folder with a BigQuery config using SSO."""
@@ -153,4 +502,4 @@ def test_execute_sql_with_cte_bigquery(bigquery_project_folder):
             {"id": 2, "name": "Bob"},
             {"id": 3, "name": "Charlie"},
         ],
-    )
\ No newline at end of file
+    )
@@ -40,6 +40,9 @@ export const ExecuteSqlOutput = ({ output, maxRows = MAX_ROWS }: { output: execu
 			</Block>
 
 			{remainingRows > 0 && <Span>...({remainingRows} more)</Span>}
+			{output.truncated && (
+				<Span>The result was truncated to its first {output.row_count} rows by the server row limit.</Span>
+			)}
 		</Block>
 	);
 };
@@ -118,4 +118,21 @@ name: Bob
 ...(1 more)`,
 		);
 	});
+
+	it('mentions results truncated by the server', () => {
+		const result = renderToMarkdown(
+			<ExecuteSqlOutput
+				output={{
+					id: 'query_1',
+					columns: ['id'],
+					row_count: 1,
+					truncated: true,
+					data: [{ id: 1 }],
+				}}
+			/>,
+		);
+		printOutput('execute_sql', 'truncated', result);
+
+		expect(result).toContain('The result was truncated to its first 1 rows by the server row limit.');
+	});
 });
@@ -14,6 +14,8 @@ export const OutputSchema = z.object({
 	data: z.array(z.any()),
 	row_count: z.number(),
 	columns: z.array(z.string()),
+	/** Set when the SQL service capped the result: the query returned more rows than `data` holds. */
+	truncated: z.boolean().optional(),
 	/** The id of the query result. May be referenced by the `display_chart` tool call. */
 	id: z.custom<`query_${string}`>(),
 });
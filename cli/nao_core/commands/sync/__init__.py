@@ -14,6 +14,8 @@ from nao_core.tracking import track_command
 from .providers import (
     PROVIDER_CHOICES,
     ProviderSelection,
+    SyncEngine,
+    SyncOptions,
     SyncResult,
     get_all_providers,
     get_providers_by_names,
@@ -34,6 +36,35 @@ def sync(
     ] = None,
     output_dirs: Annotated[dict[str, str] | None, Parameter(show=False)] = None,
     _providers: Annotated[list[ProviderSelection] | None, Parameter(show=False)] = None,
+    jobs: Annotated[
+        int | None,
+        Parameter(
+            name=["-j", "--jobs"],
+            help="Number of tables to render in parallel per database. Overrides each database's `sync_concurrency`.",
+        ),
+    ] = None,
+    parallel_databases: Annotated[
+        int,
+        Parameter(
+            name=["--parallel-databases"],
+            help="Maximum number of databases synced at the same time.",
+        ),
+    ] = 4,
+    full: Annotated[
+        bool,
+        Parameter(
+            name=["--full"],
+            help="Re-render every table and template, even those unchanged since the previous sync.",
+        ),
+    ] = False,
+    engine: Annotated[
+        SyncEngine,
+        Parameter(
+            name=["--engine"],
+            help="Engine syncing databases: a thread pool per database, or an asyncio event loop overlapping "
+            "metadata queries across schemas (`async`).",
+        ),
+    ] = "threads",
     render_templates: bool = True,
 ):
     """Sync resources using configured providers.
@@ -56,6 +87,11 @@ def sync(
 
     console.print(f"[dim]Project:[/dim] {config.project_name}")
 
+    if (jobs is not None and jobs < 1) or parallel_databases < 1:
+        console.print("[red]Error:[/red] --jobs and --parallel-databases must be at least 1")
+        sys.exit(1)
+    options = SyncOptions(jobs=jobs, database_concurrency=parallel_databases, full=full, engine=engine)
+
     # Resolve providers: CLI names > programmatic providers > all providers
     if provider:
         try:
@@ -96,7 +132,7 @@ def sync(
                     )
                     continue
 
-            result = sync_provider.sync(items, output_path, project_path=project_path)
+            result = sync_provider.sync(items, output_path, project_path=project_path, options=options)
             results.append(result)
         except Exception as e:
             # Capture error but continue with other providers
@@ -107,7 +143,7 @@ def sync(
     template_result = None
     if render_templates:
         console.print("\n[bold cyan]📝 Rendering templates[/bold cyan]\n")
-        template_result = render_all_templates(project_path, config, console)
+        template_result = render_all_templates(project_path, config, console, full=full)
 
     # Separate successful and failed results
     successful_results = [r for r in results if r.success]
@@ -131,7 +167,11 @@ def sync(
             console.print(f"  [dim]{result.provider_name}:[/dim] {result.get_summary()}")
 
     # Show template results
-    if template_result and (template_result.templates_rendered > 0 or template_result.templates_failed > 0):
+    if template_result and (
+        template_result.templates_rendered > 0
+        or template_result.templates_unchanged > 0
+        or template_result.templates_failed > 0
+    ):
         has_results = True
         console.print(f"  [dim]Templates:[/dim] {template_result.get_summary()}")
 
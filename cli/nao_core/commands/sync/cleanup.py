@@ -8,6 +8,8 @@ from typing import Dict, List
 
 from rich.console import Console
 
+from .manifest import DatabaseManifest, PathManifest, SyncManifest
+
 console = Console()
 
 
@@ -33,6 +35,18 @@ class DatabaseSyncState:
     tables_synced: int = 0
     """Count of tables synced"""
 
+    tables_unchanged: int = 0
+    """Count of synced tables skipped because their fingerprint did not change"""
+
+    files_written: int = 0
+    """Count of rendered files written because their content changed"""
+
+    files_unchanged: int = 0
+    """Count of rendered files left untouched because their content was the same"""
+
+    manifest: DatabaseManifest | None = None
+    """Fingerprints of the tables up to date after this sync, saved for the next one"""
+
     def add_table(self, schema: str, table: str) -> None:
         """Record that a table was synced.
 
@@ -56,7 +70,9 @@ class DatabaseSyncState:
         self.schemas_synced += 1
 
 
-def cleanup_stale_paths(state: DatabaseSyncState, verbose: bool = False) -> int:
+def cleanup_stale_paths(
+    state: DatabaseSyncState, verbose: bool = False, previous: DatabaseManifest | None = None
+) -> int:
     """Remove directories that exist on disk but weren't synced.
 
     This function cleans up:
@@ -66,10 +82,15 @@ def cleanup_stale_paths(state: DatabaseSyncState, verbose: bool = False) -> int:
     Args:
         state: The sync state tracking what was synced
         verbose: Whether to print cleanup messages
+        previous: Manifest of the previous sync of the database. When it records the synced
+            tables, only those missing from `state` are removed, without listing the directories.
 
     Returns:
         Number of stale paths removed
     """
+    if previous is not None and previous.synced is not None:
+        return _cleanup_unsynced_paths(state, previous.synced, verbose)
+
     removed_count = 0
 
     if not state.db_path.exists():
@@ -107,8 +128,38 @@ def cleanup_stale_paths(state: DatabaseSyncState, verbose: bool = False) -> int:
     return removed_count
 
 
+def _cleanup_unsynced_paths(state: DatabaseSyncState, previous: dict[str, list[str]], verbose: bool) -> int:
+    """Remove the schemas and tables of the previous sync that `state` did not sync."""
+    removed_count = 0
+
+    for schema_name, tables in previous.items():
+        schema_path = state.db_path / f"schema={schema_name}"
+        if schema_name not in state.synced_schemas:
+            if schema_path.is_dir():
+                if verbose:
+                    console.print(f"  [dim red]removing stale schema:[/dim red] {schema_name}")
+                shutil.rmtree(schema_path)
+                removed_count += 1
+            continue
+
+        synced_tables_for_schema = state.synced_tables.get(schema_name, set())
+        for table_name in tables:
+            table_path = schema_path / f"table={table_name}"
+            if table_name not in synced_tables_for_schema and table_path.is_dir():
+                if verbose:
+                    console.print(f"  [dim red]removing stale table:[/dim red] {schema_name}.{table_name}")
+                shutil.rmtree(table_path)
+                removed_count += 1
+
+    return removed_count
+
+
 def cleanup_stale_databases(active_databases: List, base_path: Path, verbose: bool = False):
-    """Remove databases that are not present in the config file."""
+    """Remove databases that are not present in the config file.
+
+    Databases recorded by the sync manifest are diffed against the config;
+    the output directory is only listed when there is no manifest yet.
+    """
 
     valid_db_folders_by_type: Dict[str, set] = defaultdict(set)
 
@@ -119,6 +170,11 @@ def cleanup_stale_databases(active_databases: List, base_path: Path, verbose: bo
 
         valid_db_folders_by_type[type_folder].add(db_folder)
 
+    manifest = SyncManifest.load(base_path)
+    if manifest.loaded:
+        _cleanup_unrecorded_databases(manifest, valid_db_folders_by_type, verbose)
+        return
+
     for type_dir in base_path.iterdir():
         if not type_dir.is_dir():
             continue
@@ -145,12 +201,49 @@ def cleanup_stale_databases(active_databases: List, base_path: Path, verbose: bo
                     console.print(f"\n[yellow] Removed unused database:[/yellow] {type_folder_name}/{db_dir.name}")
 
 
+def _cleanup_unrecorded_databases(
+    manifest: SyncManifest, valid_db_folders_by_type: Dict[str, set], verbose: bool = False
+) -> None:
+    """Remove the databases recorded by `manifest` that are not in the config, and forget them."""
+    for db_dir in manifest.paths():
+        type_dir = db_dir.parent
+        if db_dir.name in valid_db_folders_by_type.get(type_dir.name, ()):
+            continue
+
+        manifest.remove(db_dir)
+        # Remove entire type directory if it doesn't exist in nao_config
+        if type_dir.name not in valid_db_folders_by_type:
+            if type_dir.is_dir():
+                shutil.rmtree(type_dir)
+                if verbose:
+                    console.print(f"\n[yellow] Removed unused database type:[/yellow] {type_dir}")
+        elif db_dir.is_dir():
+            shutil.rmtree(db_dir)
+            if verbose:
+                console.print(f"\n[yellow] Removed unused database:[/yellow] {type_dir.name}/{db_dir.name}")
+
+    manifest.save()
+
+
 def cleanup_stale_repos(config_repos: list, base_path: Path, verbose: bool = False) -> None:
-    """Remove repositories that are not present in the config file."""
+    """Remove repositories that are not present in the config file.
+
+    Repositories recorded by the previous sync are diffed against the config;
+    the output directory is only listed when there is no manifest yet.
+    """
 
     repo_names = {repo.name for repo in config_repos}
-    for repo_dir in base_path.iterdir():
-        if repo_dir.is_dir() and repo_dir.name not in repo_names:
+    manifest = PathManifest.load(base_path, "repos")
+    if manifest.names is None:
+        repo_dirs = [d for d in base_path.iterdir() if d.is_dir()]
+    else:
+        repo_dirs = [base_path / name for name in sorted(manifest.names)]
+
+    for repo_dir in repo_dirs:
+        if repo_dir.name not in repo_names and repo_dir.is_dir():
             shutil.rmtree(repo_dir)
             if verbose:
                 console.print(f"\n[yellow] Removed unused repo:[/yellow] {repo_dir.name}")
+
+    if manifest.names is not None:
+        manifest.save(manifest.names & repo_names)
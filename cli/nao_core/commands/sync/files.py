@@ -0,0 +1,62 @@
+"""File writing utilities for sync outputs."""
+
+import os
+import secrets
+import stat
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write `content` to `path` through a temporary file renamed over it.
+
+    Readers (file watchers, the agent, git) never see a partially written file,
+    and an interrupted sync leaves the previous version in place. The file
+    keeps its permissions, or gets those of `open()` when created.
+    """
+    try:
+        mode: int | None = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_name = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _create_temp_file(path: Path) -> tuple[int, str]:
+    """Create an empty file next to `path`, returning its descriptor and name.
+
+    Unlike `tempfile.mkstemp()`, which restricts the file to its owner, the file is
+    created with mode 0o666 so that the process umask applies as it does for `open()`.
+    """
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write `content` to `path` unless the file already holds it.
+
+    Leaving unchanged files untouched keeps their mtime, so watchers, caches
+    and git don't see churn on every sync.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_text_atomic(path, content)
+    return True
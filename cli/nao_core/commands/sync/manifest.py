@@ -0,0 +1,126 @@
+"""Persisted state of syncs, used to skip tables that did not change and to clean up stale outputs."""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .files import write_if_changed
+
+SYNC_STATE_FILENAME = ".nao-sync-state"
+"""Manifest file, stored at the root of the databases output directory"""
+
+_MANIFEST_VERSION = 2
+
+
+@dataclass
+class DatabaseManifest:
+    """Fingerprints of the tables rendered by the last sync of a database."""
+
+    render_key: str
+    """Hash of the templates and accessors used: any change re-renders every table"""
+
+    tables: dict[str, dict[str, str]] = field(default_factory=dict)
+    """Dict mapping schema names to table names to fingerprints"""
+
+    synced: dict[str, list[str]] | None = None
+    """Dict mapping every synced schema to its synced tables, whether fingerprinted or not"""
+
+    def fingerprint(self, schema: str, table: str) -> str | None:
+        return self.tables.get(schema, {}).get(table)
+
+    def set_fingerprint(self, schema: str, table: str, fingerprint: str) -> None:
+        self.tables.setdefault(schema, {})[table] = fingerprint
+
+    def set_synced(self, synced_tables: dict[str, set[str]], synced_schemas: set[str]) -> None:
+        self.synced = {schema: sorted(synced_tables.get(schema, ())) for schema in synced_schemas}
+
+
+class SyncManifest:
+    """The `.nao-sync-state` file: one `DatabaseManifest` per synced database directory."""
+
+    def __init__(self, path: Path, databases: dict[str, DatabaseManifest] | None = None, loaded: bool = False):
+        self.path = path
+        self.databases = databases or {}
+        # Read from disk: every database synced since the manifest was created is recorded
+        self.loaded = loaded
+
+    @classmethod
+    def load(cls, output_path: Path) -> "SyncManifest":
+        """Load the manifest of `output_path`. A missing or unreadable manifest is empty."""
+        path = output_path / SYNC_STATE_FILENAME
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != _MANIFEST_VERSION:
+                return cls(path)
+            databases = {
+                key: DatabaseManifest(render_key=entry["render_key"], tables=entry["tables"], synced=entry["synced"])
+                for key, entry in data["databases"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(path)
+        return cls(path, databases, loaded=True)
+
+    def get(self, db_path: Path) -> DatabaseManifest | None:
+        return self.databases.get(self._key(db_path))
+
+    def set(self, db_path: Path, manifest: DatabaseManifest) -> None:
+        self.databases[self._key(db_path)] = manifest
+
+    def paths(self) -> list[Path]:
+        """Return the directories of the recorded databases."""
+        return [self.path.parent / key for key in self.databases]
+
+    def remove(self, db_path: Path) -> None:
+        self.databases.pop(self._key(db_path), None)
+
+    def save(self) -> None:
+        """Write the manifest atomically, dropping databases whose directory was removed."""
+        databases = {key: entry for key, entry in self.databases.items() if (self.path.parent / key).is_dir()}
+        data = {
+            "version": _MANIFEST_VERSION,
+            "databases": {
+                key: {"render_key": entry.render_key, "tables": entry.tables, "synced": entry.synced}
+                for key, entry in sorted(databases.items())
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+    def _key(self, db_path: Path) -> str:
+        try:
+            return db_path.relative_to(self.path.parent).as_posix()
+        except ValueError:
+            return db_path.as_posix()
+
+
+class PathManifest:
+    """Names of the entries a provider wrote to its output directory, recorded by the last sync.
+
+    Cleanup diffs them against the entries of the current sync, so that only
+    stale entries touch the disk. `names` is None until a sync records them:
+    cleanup then lists the output directory instead.
+    """
+
+    def __init__(self, path: Path, names: set[str] | None = None):
+        self.path = path
+        self.names = names
+
+    @classmethod
+    def load(cls, output_path: Path, provider: str) -> "PathManifest":
+        """Load the manifest of `provider` in `output_path`. A missing or unreadable manifest records nothing."""
+        path = output_path / f".nao-sync-{provider}"
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != _MANIFEST_VERSION:
+                return cls(path)
+            names = {str(name) for name in data["names"]}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(path)
+        return cls(path, names)
+
+    def save(self, names: set[str]) -> None:
+        """Record `names` as the entries of the output directory."""
+        self.names = set(names)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": _MANIFEST_VERSION, "names": sorted(self.names)}
+        write_if_changed(self.path, json.dumps(data, indent=2) + "\n")
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-from .base import SyncProvider, SyncResult
+from .base import SyncEngine, SyncOptions, SyncProvider, SyncResult
 from .databases.provider import DatabaseSyncProvider
 from .notion.provider import NotionSyncProvider
 from .repositories.provider import RepositorySyncProvider
@@ -69,6 +69,8 @@ def get_providers_by_names(names: list[str]) -> list[ProviderSelection]:
 
 
 __all__ = [
+    "SyncEngine",
+    "SyncOptions",
     "SyncProvider",
     "SyncResult",
     "ProviderSelection",
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from nao_core.config import NaoConfig
 
@@ -41,6 +41,27 @@ class SyncResult:
         )
 
 
+SyncEngine = Literal["threads", "async"]
+"""How `nao sync` drives database queries: a thread pool per database, or an asyncio event loop"""
+
+
+@dataclass
+class SyncOptions:
+    """Options of a `nao sync` run, passed to every provider."""
+
+    jobs: int | None = None
+    """Tables rendered in parallel per database (overrides each database's `sync_concurrency`)"""
+
+    database_concurrency: int = 4
+    """Maximum number of databases synced at the same time"""
+
+    full: bool = False
+    """Re-render every table, instead of skipping those unchanged since the previous sync"""
+
+    engine: SyncEngine = "threads"
+    """Engine rendering the tables of each database"""
+
+
 class SyncProvider(ABC):
     """Abstract base class for sync providers.
 
@@ -79,13 +100,20 @@ class SyncProvider(ABC):
         ...
 
     @abstractmethod
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync the items to the output path.
 
         Args:
                 items: List of items to sync
                 output_path: Path where synced data should be written
                 project_path: Path to the nao project root (for template resolution)
+                options: Options of the sync run (defaults apply if omitted)
 
         Returns:
                 SyncResult with statistics about what was synced
@@ -0,0 +1,97 @@
+"""Asyncio engine for database sync, for warehouses where sync time is mostly network latency."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from ibis import BaseBackend
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from .provider import _DatabaseSync, _TableJob
+
+console = Console()
+
+_T = TypeVar("_T")
+
+
+class _PooledConnection:
+    """A connection of the pool, running one query at a time on its own thread.
+
+    Ibis drivers are blocking, so calls are offloaded to a single-thread
+    executor: the event loop stays free to schedule work on the other
+    connections, and the connection is only ever used from one thread.
+    """
+
+    def __init__(self, index: int, connect: Callable[[], BaseBackend]):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"nao-sync-conn-{index}")
+        self._connect = connect
+        self._conn: BaseBackend | None = None
+
+    async def run(self, fn: Callable[[BaseBackend], _T]) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._call, fn)
+
+    def _call(self, fn: Callable[[BaseBackend], _T]) -> _T:
+        if self._conn is None:
+            self._conn = self._connect()
+        return fn(self._conn)
+
+    def close(self, disconnect: bool) -> None:
+        self._executor.shutdown(wait=True)
+        if disconnect and self._conn is not None:
+            try:
+                self._conn.disconnect()
+            except Exception:
+                pass
+
+
+async def _sync(run: _DatabaseSync, conn: BaseBackend, schemas: list[str], concurrency: int) -> None:
+    # The first connection of the pool is `conn`; the others are opened when first needed
+    connections = [_PooledConnection(0, lambda: conn)] + [
+        _PooledConnection(i, lambda: run.db_config.connect_for_thread(conn)) for i in range(1, concurrency)
+    ]
+    idle: asyncio.Queue[_PooledConnection] = asyncio.Queue()
+    for connection in connections:
+        idle.put_nowait(connection)
+
+    async def on_connection(fn: Callable[[BaseBackend], _T]) -> _T:
+        # At most one query per connection, so at most `concurrency` queries against the warehouse
+        connection = await idle.get()
+        try:
+            return await connection.run(fn)
+        finally:
+            idle.put_nowait(connection)
+
+    async def render(job: _TableJob) -> None:
+        result = await on_connection(lambda c: run.render(c, job))
+        run.complete(job, result)
+
+    async def sync_schema(schema: str) -> None:
+        try:
+            listed = await on_connection(lambda c: run.list_schema(c, schema))
+        except Exception as e:
+            run.skip_schema(schema, e)
+            return
+        # Tables are rendered as soon as their schema is listed, while other schemas are still being listed
+        await asyncio.gather(*(render(job) for job in run.plan_schema(listed)))
+
+    try:
+        await asyncio.gather(*(sync_schema(schema) for schema in schemas))
+    finally:
+        for i, connection in enumerate(connections):
+            connection.close(disconnect=i > 0)
+
+
+def sync_with_asyncio(run: _DatabaseSync, conn: BaseBackend, schemas: list[str], concurrency: int) -> None:
+    """List schemas and render tables concurrently on an event loop, over a pool of `concurrency` connections.
+
+    Unlike the threads engine, which lists every schema before rendering any
+    table, metadata queries and renders of all schemas overlap. Planning and
+    bookkeeping run on the event loop thread only.
+    """
+    if concurrency > 1:
+        console.print(f"  [dim]Syncing with the async engine over {concurrency} connections[/dim]")
+    asyncio.run(_sync(run, conn, schemas, concurrency))
@@ -1,31 +1,46 @@
 """Database sync provider implementation."""
 
+import hashlib
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ibis import BaseBackend
 from rich.console import Console
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeElapsedColumn,
 )
 
+from nao_core import __version__
 from nao_core.commands.sync.cleanup import DatabaseSyncState, cleanup_stale_databases, cleanup_stale_paths
+from nao_core.commands.sync.files import write_if_changed
+from nao_core.commands.sync.manifest import DatabaseManifest, SyncManifest
 from nao_core.config import AnyDatabaseConfig, NaoConfig
-from nao_core.config.databases.base import DatabaseConfig
-from nao_core.templates.engine import get_template_engine
+from nao_core.config.databases.base import CatalogTable, DatabaseConfig
+from nao_core.config.databases.context import SchemaMetadata
+from nao_core.templates.engine import TEMPLATE_CACHE_DIR, FrozenTemplates, TemplateEngine, get_template_engine
 
-from ..base import SyncProvider, SyncResult
+from ..base import SyncEngine, SyncOptions, SyncProvider, SyncResult
+from .async_engine import sync_with_asyncio
 
 console = Console()
 
 TEMPLATE_PREFIX = "databases"
 
+_TableJob = tuple[str, str, Path]
+"""(schema, table, output directory of the table)"""
+
 
 def _filter_templates_by_accessor(templates: list[str], db_config: DatabaseConfig) -> list[str]:
     """Keep only templates whose stem matches the configured accessors."""
@@ -33,6 +48,15 @@ def _filter_templates_by_accessor(templates: list[str], db_config: DatabaseConfi
     return [t for t in templates if Path(t).stem.replace(".md", "") in allowed]
 
 
+def _render_key(engine: TemplateEngine, templates: list[str]) -> str:
+    """Hash everything besides table metadata that affects the rendered files."""
+    digest = hashlib.sha256(__version__.encode())
+    for template_name in templates:
+        digest.update(template_name.encode())
+        digest.update(engine.get_source(template_name).encode())
+    return digest.hexdigest()
+
+
 def _fmt_duration(seconds: float) -> str:
     """Format seconds into a human-readable duration."""
     if seconds < 1:
@@ -44,15 +68,397 @@ def _fmt_duration(seconds: float) -> str:
     return f"{minutes}m{secs:.0f}s"
 
 
+@dataclass
+class _SchemaProgress:
+    """Rendering progress of the tables of one schema."""
+
+    task_id: TaskID
+    tables: int
+    pending: int
+    errors: int = 0
+    started_at: float | None = None
+
+
+@dataclass
+class _TableResult:
+    """Outcome of rendering the templates of one table."""
+
+    errors: int = 0
+    files_written: int = 0
+    files_unchanged: int = 0
+
+
+class _ThreadConnections:
+    """One connection per worker thread, as Ibis backends are not safe for concurrent use."""
+
+    def __init__(self, db_config: DatabaseConfig, conn: BaseBackend):
+        self._db_config = db_config
+        self._conn = conn
+        self._local = threading.local()
+        self._opened: list[BaseBackend] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> BaseBackend:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._db_config.connect_for_thread(self._conn)
+            self._local.conn = conn
+            with self._lock:
+                self._opened.append(conn)
+        return conn
+
+    def close(self) -> None:
+        for conn in self._opened:
+            try:
+                conn.disconnect()
+            except Exception:
+                pass
+
+
+def _render_table(
+    engine: FrozenTemplates,
+    templates: list[str],
+    db_config: DatabaseConfig,
+    conn: BaseBackend,
+    schema: str,
+    table: str,
+    table_path: Path,
+    metadata: SchemaMetadata | None = None,
+) -> _TableResult:
+    """Render every database template for a table, only writing the files whose content changed."""
+    result = _TableResult()
+    try:
+        ctx = db_config.create_context(conn, schema, table, metadata)
+    except Exception as e:
+        # Only this table fails: every template gets an error stub, the rest of the database still syncs
+        console.print(f"    [bold red]✗[/bold red] [dim]{schema}.{table}[/dim] [red]failed:[/red] {e}")
+        for template_name in templates:
+            result.errors += 1
+            _write_table_file(result, table_path / Path(template_name).stem, _error_content(table, e))
+        return result
+
+    for template_name in templates:
+        output_filename = Path(template_name).stem
+        accessor_name = output_filename.replace(".md", "")
+
+        t_render = time.monotonic()
+        try:
+            content = engine.render(template_name, db=ctx, table_name=table, dataset=schema)
+            render_dur = time.monotonic() - t_render
+            if render_dur > 5:
+                console.print(
+                    f"    [yellow]⏱[/yellow] [dim]{schema}.{table}[/dim] "
+                    f"[yellow]{accessor_name}[/yellow] [dim]took {_fmt_duration(render_dur)}[/dim]"
+                )
+        except Exception as e:
+            render_dur = time.monotonic() - t_render
+            result.errors += 1
+            console.print(
+                f"    [bold red]✗[/bold red] [dim]{schema}.{table}[/dim] "
+                f"[red]{accessor_name}[/red] [dim]failed after "
+                f"{_fmt_duration(render_dur)}:[/dim] {e}"
+            )
+            content = _error_content(table, e)
+
+        _write_table_file(result, table_path / output_filename, content)
+
+    return result
+
+
+def _error_content(table: str, error: Exception) -> str:
+    """Stub written in place of a table file that could not be rendered."""
+    return f"# {table}\n\nError generating content: {error}"
+
+
+def _write_table_file(result: _TableResult, path: Path, content: str) -> None:
+    if write_if_changed(path, content):
+        result.files_written += 1
+    else:
+        result.files_unchanged += 1
+
+
+def _run_table_jobs(
+    jobs: list[_TableJob], concurrency: int, render: Callable[[_TableJob], _TableResult]
+) -> Iterator[tuple[_TableJob, _TableResult]]:
+    """Render tables on `concurrency` threads, yielding (job, result) as each table completes."""
+    if concurrency <= 1:
+        for job in jobs:
+            yield job, render(job)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nao-sync")
+    try:
+        futures = {executor.submit(render, job): job for job in jobs}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class _ListedSchema:
+    """Tables of a schema matching the include/exclude patterns, with the schema's prefetched metadata."""
+
+    schema: str
+    tables: list[str]
+    metadata: SchemaMetadata | None = None
+
+
+class _DatabaseSync:
+    """Planning and bookkeeping of one database sync, shared by the sync engines.
+
+    `list_schema` and `render` query the database and may run on any thread,
+    each with its own connection. `plan_schema` and `complete` update the sync
+    state and progress, and must be called from one thread at a time.
+    """
+
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        engine: FrozenTemplates,
+        templates: list[str],
+        db_path: Path,
+        render_key: str,
+        previous: DatabaseManifest | None,
+        progress: Progress,
+        schema_task: TaskID,
+        catalog: dict[str, list[CatalogTable]] | None = None,
+    ):
+        self.db_config = db_config
+        self.engine = engine
+        self.templates = templates
+        self.db_path = db_path
+        self.previous = previous
+        self.progress = progress
+        self.schema_task = schema_task
+        self.catalog = catalog
+        self.up_to_date = DatabaseManifest(render_key=render_key)
+        self.state = DatabaseSyncState(db_path=db_path, manifest=self.up_to_date)
+        self.total_errors = 0
+        self._schema_progress: dict[str, _SchemaProgress] = {}
+        self._schema_metadata: dict[str, SchemaMetadata | None] = {}
+        self._fingerprints: dict[tuple[str, str], str] = {}
+
+    def list_schema(self, conn: BaseBackend, schema: str) -> _ListedSchema:
+        """List the tables of `schema` to sync and prefetch their metadata. Raises if tables can't be listed.
+
+        Tables come from the database's catalog when it was listed up front.
+        """
+        t_list = time.monotonic()
+        catalog_tables = self.catalog.get(schema, []) if self.catalog is not None else None
+        all_tables = (
+            [t.table for t in catalog_tables] if catalog_tables is not None else conn.list_tables(database=schema)
+        )
+        tables = [t for t in all_tables if self.db_config.matches_pattern(schema, t)]
+        if not tables:
+            return _ListedSchema(schema, tables)
+
+        list_dur = _fmt_duration(time.monotonic() - t_list)
+        console.print(
+            f"  [cyan]▸ {schema}[/cyan] [dim]— {len(tables)} tables "
+            f"(of {len(all_tables)} total, listed in {list_dur})[/dim]"
+        )
+
+        # One query per kind of metadata for the whole schema, rather than per table
+        try:
+            metadata = self.db_config.fetch_schema_metadata(conn, schema)
+        except Exception as e:
+            console.print(f"  [yellow]⚠[/yellow] [dim]Querying metadata table by table in[/dim] {schema}: {e}")
+            metadata = None
+
+        if catalog_tables:
+            metadata = metadata or SchemaMetadata()
+            metadata.table_types = {t.table: t.table_type for t in catalog_tables}
+            metadata.last_altered = {t.table: t.last_altered for t in catalog_tables if t.last_altered is not None}
+        return _ListedSchema(schema, tables, metadata)
+
+    def skip_schema(self, schema: str, error: Exception) -> None:
+        """Record a schema whose tables could not be listed."""
+        console.print(f"  [yellow]⚠[/yellow] [dim]Skipping schema[/dim] {schema}: {error}")
+        self.progress.update(self.schema_task, advance=1)
+
+    def plan_schema(self, listed: _ListedSchema) -> list[_TableJob]:
+        """Create the output directories of a listed schema and return its tables to render.
+
+        Tables whose fingerprint matches the previous sync are recorded as
+        synced without being rendered again.
+        """
+        schema, tables, metadata = listed.schema, listed.tables, listed.metadata
+        if not tables:
+            self.progress.update(self.schema_task, advance=1)
+            return []
+
+        self._schema_metadata[schema] = metadata
+        schema_path = self.db_path / f"schema={schema}"
+        schema_path.mkdir(parents=True, exist_ok=True)
+        self.state.add_schema(schema)
+
+        schema_jobs: list[_TableJob] = []
+        for table in tables:
+            table_path = schema_path / f"table={table}"
+            fingerprint = metadata.fingerprint(table) if metadata is not None else None
+            if fingerprint is None:
+                schema_jobs.append((schema, table, table_path))
+                continue
+
+            self._fingerprints[(schema, table)] = fingerprint
+            if (
+                self.previous is not None
+                and self.previous.fingerprint(schema, table) == fingerprint
+                and all((table_path / Path(t).stem).exists() for t in self.templates)
+            ):
+                self.state.add_table(schema, table)
+                self.state.tables_unchanged += 1
+                self.up_to_date.set_fingerprint(schema, table, fingerprint)
+            else:
+                schema_jobs.append((schema, table, table_path))
+
+        if not schema_jobs:
+            console.print(f"  [green]✓ {schema}[/green] [dim]— {len(tables)} tables unchanged[/dim]")
+            self.progress.update(self.schema_task, advance=1)
+            return []
+
+        table_task = self.progress.add_task(
+            f"    [cyan]{schema}[/cyan]",
+            total=len(schema_jobs),
+        )
+        self._schema_progress[schema] = _SchemaProgress(
+            task_id=table_task, tables=len(schema_jobs), pending=len(schema_jobs)
+        )
+
+        for _, _, table_path in schema_jobs:
+            table_path.mkdir(parents=True, exist_ok=True)
+        return schema_jobs
+
+    def render(self, conn: BaseBackend, job: _TableJob) -> _TableResult:
+        """Render the templates of a planned table on `conn`."""
+        schema, table, table_path = job
+        current = self._schema_progress[schema]
+        if current.started_at is None:
+            current.started_at = time.monotonic()
+        self.progress.update(
+            current.task_id,
+            description=f"    [cyan]{schema}[/cyan] [dim]→ {table}[/dim]",
+        )
+        return _render_table(
+            self.engine,
+            self.templates,
+            self.db_config,
+            conn,
+            schema,
+            table,
+            table_path,
+            self._schema_metadata[schema],
+        )
+
+    def complete(self, job: _TableJob, result: _TableResult) -> None:
+        """Record a rendered table, and report its schema once all of the schema's tables are done."""
+        schema, table, _ = job
+        current = self._schema_progress[schema]
+        current.errors += result.errors
+        self.total_errors += result.errors
+        self.state.add_table(schema, table)
+        self.state.files_written += result.files_written
+        self.state.files_unchanged += result.files_unchanged
+        # Tables that failed to render are retried by the next sync
+        if not result.errors and (schema, table) in self._fingerprints:
+            self.up_to_date.set_fingerprint(schema, table, self._fingerprints[(schema, table)])
+        self.progress.update(current.task_id, advance=1)
+
+        current.pending -= 1
+        if current.pending:
+            return
+
+        self.progress.update(
+            current.task_id,
+            description=f"    [cyan]{schema}[/cyan]",
+        )
+        schema_dur = _fmt_duration(time.monotonic() - (current.started_at or time.monotonic()))
+        error_suffix = f" [red]({current.errors} errors)[/red]" if current.errors else ""
+        unchanged = len(self.state.synced_tables[schema]) - current.tables
+        unchanged_suffix = f", {unchanged} unchanged" if unchanged else ""
+        console.print(
+            f"  [green]✓ {schema}[/green] [dim]— {current.tables} tables synced in {schema_dur}"
+            f"{unchanged_suffix}{error_suffix}[/dim]"
+        )
+
+        self.progress.update(self.schema_task, advance=1)
+
+
+def _sync_with_threads(run: _DatabaseSync, conn: BaseBackend, schemas: list[str], concurrency: int) -> None:
+    """List every schema on `conn`, then render the tables on `concurrency` threads."""
+    # List every schema first, so that worker threads never wait for the next schema
+    table_jobs: list[_TableJob] = []
+    for schema in schemas:
+        try:
+            listed = run.list_schema(conn, schema)
+        except Exception as e:
+            run.skip_schema(schema, e)
+            continue
+        table_jobs.extend(run.plan_schema(listed))
+
+    if concurrency > 1 and len(table_jobs) > 1:
+        console.print(f"  [dim]Rendering {len(table_jobs)} tables with {concurrency} parallel jobs[/dim]")
+
+    connections = _ThreadConnections(run.db_config, conn) if concurrency > 1 else None
+
+    def render(job: _TableJob) -> _TableResult:
+        return run.render(connections.get() if connections is not None else conn, job)
+
+    try:
+        # Progress and error counts are only updated from this thread, as tables complete
+        for job, result in _run_table_jobs(table_jobs, concurrency, render):
+            run.complete(job, result)
+    finally:
+        if connections is not None:
+            connections.close()
+
+
+def _list_catalog(db_config: DatabaseConfig, conn: BaseBackend) -> dict[str, list[CatalogTable]] | None:
+    """List every table of the database in one catalog query, grouped by schema, or None if it can't be."""
+    try:
+        tables = db_config.list_catalog(conn)
+    except Exception as e:
+        console.print(f"  [yellow]⚠[/yellow] [dim]Listing tables schema by schema:[/dim] {e}")
+        return None
+    if tables is None:
+        return None
+
+    catalog: dict[str, list[CatalogTable]] = {}
+    for table in tables:
+        catalog.setdefault(table.schema, []).append(table)
+    return catalog
+
+
 def sync_database(
     db_config: DatabaseConfig,
     base_path: Path,
     progress: Progress,
     project_path: Path | None = None,
+    jobs: int | None = None,
+    manifest: SyncManifest | None = None,
+    sync_engine: SyncEngine = "threads",
+    engine: TemplateEngine | None = None,
 ) -> DatabaseSyncState:
-    """Sync a single database by rendering all database templates for each table."""
-    engine = get_template_engine(project_path)
+    """Sync a single database by rendering all database templates for each table.
+
+    Tables are rendered by `jobs` threads (defaults to the database's
+    `sync_concurrency`, else 1), each with its own connection. The `async`
+    engine instead overlaps listing schemas and rendering tables over a pool
+    of `jobs` connections; both write the same files. Tables whose
+    fingerprint matches the one recorded in `manifest` by the previous sync
+    are skipped; without a manifest, every table is rendered. Templates are
+    compiled once per sync, and not reloaded when their files change.
+
+    `engine` defaults to the project's template engine; pass it explicitly
+    when syncing several databases from different threads.
+    """
+    engine = engine or get_template_engine(project_path)
     templates = _filter_templates_by_accessor(engine.list_templates(TEMPLATE_PREFIX), db_config)
+    concurrency = jobs or db_config.sync_concurrency or 1
+    render_key = _render_key(engine, templates)
+    # Compiled once for every table of this run, and kept on disk for the next runs
+    frozen = engine.freeze(templates, bytecode_cache_dir=TEMPLATE_CACHE_DIR)
 
     t_connect = time.monotonic()
     conn = db_config.connect()
@@ -63,10 +469,17 @@ def sync_database(
 
     db_name = db_config.get_database_name()
     db_path = base_path / f"type={db_config.type}" / f"database={db_name}"
-    state = DatabaseSyncState(db_path=db_path)
+
+    previous = manifest.get(db_path) if manifest is not None else None
+    if previous is not None and previous.render_key != render_key:
+        previous = None
 
     t_schemas = time.monotonic()
-    schemas = db_config.get_schemas(conn)
+    catalog = _list_catalog(db_config, conn)
+    if catalog is not None:
+        schemas = [schema for schema in sorted(catalog) if db_config.schema_matches(schema)]
+    else:
+        schemas = db_config.get_schemas(conn)
     console.print(
         f"  [dim]Found[/dim] [bold]{len(schemas)}[/bold] "
         f"[dim]schemas ({_fmt_duration(time.monotonic() - t_schemas)})[/dim]"
@@ -76,99 +489,17 @@ def sync_database(
         f"[dim]{db_config.name}[/dim]",
         total=len(schemas),
     )
+    run = _DatabaseSync(db_config, frozen, templates, db_path, render_key, previous, progress, schema_task, catalog)
 
-    total_errors = 0
+    if sync_engine == "async":
+        sync_with_asyncio(run, conn, schemas, concurrency)
+    else:
+        _sync_with_threads(run, conn, schemas, concurrency)
 
-    for schema in schemas:
-        try:
-            t_list = time.monotonic()
-            all_tables = conn.list_tables(database=schema)
-        except Exception as e:
-            console.print(f"  [yellow]⚠[/yellow] [dim]Skipping schema[/dim] {schema}: {e}")
-            progress.update(schema_task, advance=1)
-            continue
+    if run.total_errors:
+        console.print(f"  [yellow]⚠ {run.total_errors} total errors during sync[/yellow]")
 
-        tables = [t for t in all_tables if db_config.matches_pattern(schema, t)]
-
-        if not tables:
-            progress.update(schema_task, advance=1)
-            continue
-
-        list_dur = _fmt_duration(time.monotonic() - t_list)
-        console.print(
-            f"  [cyan]▸ {schema}[/cyan] [dim]— {len(tables)} tables "
-            f"(of {len(all_tables)} total, listed in {list_dur})[/dim]"
-        )
-
-        schema_path = db_path / f"schema={schema}"
-        schema_path.mkdir(parents=True, exist_ok=True)
-        state.add_schema(schema)
-
-        table_task = progress.add_task(
-            f"    [cyan]{schema}[/cyan]",
-            total=len(tables),
-        )
-
-        schema_errors = 0
-        schema_start = time.monotonic()
-
-        for table in tables:
-            table_path = schema_path / f"table={table}"
-            table_path.mkdir(parents=True, exist_ok=True)
-
-            progress.update(
-                table_task,
-                description=f"    [cyan]{schema}[/cyan] [dim]→ {table}[/dim]",
-            )
-
-            ctx = db_config.create_context(conn, schema, table)
-
-            for template_name in templates:
-                output_filename = Path(template_name).stem
-                accessor_name = output_filename.replace(".md", "")
-
-                t_render = time.monotonic()
-                try:
-                    content = engine.render(template_name, db=ctx, table_name=table, dataset=schema)
-                    render_dur = time.monotonic() - t_render
-                    if render_dur > 5:
-                        console.print(
-                            f"    [yellow]⏱[/yellow] [dim]{schema}.{table}[/dim] "
-                            f"[yellow]{accessor_name}[/yellow] [dim]took {_fmt_duration(render_dur)}[/dim]"
-                        )
-                except Exception as e:
-                    render_dur = time.monotonic() - t_render
-                    schema_errors += 1
-                    total_errors += 1
-                    console.print(
-                        f"    [bold red]✗[/bold red] [dim]{schema}.{table}[/dim] "
-                        f"[red]{accessor_name}[/red] [dim]failed after "
-                        f"{_fmt_duration(render_dur)}:[/dim] {e}"
-                    )
-                    content = f"# {table}\n\nError generating content: {e}"
-
-                output_file = table_path / output_filename
-                output_file.write_text(content)
-
-            state.add_table(schema, table)
-            progress.update(table_task, advance=1)
-
-        progress.update(
-            table_task,
-            description=f"    [cyan]{schema}[/cyan]",
-        )
-        schema_dur = _fmt_duration(time.monotonic() - schema_start)
-        error_suffix = f" [red]({schema_errors} errors)[/red]" if schema_errors else ""
-        console.print(
-            f"  [green]✓ {schema}[/green] [dim]— {len(tables)} tables synced in {schema_dur}{error_suffix}[/dim]"
-        )
-
-        progress.update(schema_task, advance=1)
-
-    if total_errors:
-        console.print(f"  [yellow]⚠ {total_errors} total errors during sync[/yellow]")
-
-    return state
+    return run.state
 
 
 class DatabaseSyncProvider(SyncProvider):
@@ -192,15 +523,25 @@ class DatabaseSyncProvider(SyncProvider):
     def get_items(self, config: NaoConfig) -> list[AnyDatabaseConfig]:
         return config.databases
 
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
+        options = options or SyncOptions()
         if not items:
             console.print("\n[dim]No databases configured[/dim]")
             return SyncResult(provider_name=self.name, items_synced=0)
 
         total_datasets = 0
         total_tables = 0
+        total_unchanged = 0
         total_removed = 0
-        sync_states: list[DatabaseSyncState] = []
+        files_written = 0
+        files_unchanged = 0
+        manifest = SyncManifest.load(output_path)
 
         console.print(f"\n[bold cyan]{self.emoji}  Syncing {self.name}[/bold cyan]")
         console.print(f"[dim]Location:[/dim] {output_path.absolute()}")
@@ -211,6 +552,8 @@ class DatabaseSyncProvider(SyncProvider):
         console.print()
 
         sync_start = time.monotonic()
+        # Created before the worker threads start: get_template_engine() swaps a global without locking
+        engine = get_template_engine(project_path)
 
         with Progress(
             SpinnerColumn(style="dim"),
@@ -222,21 +565,56 @@ class DatabaseSyncProvider(SyncProvider):
             console=console,
             transient=False,
         ) as progress:
-            for db in items:
-                try:
-                    state = sync_database(db, output_path, progress, project_path)
-                    sync_states.append(state)
-                    total_datasets += state.schemas_synced
-                    total_tables += state.tables_synced
-                except Exception as e:
-                    console.print(f"[bold red]✗[/bold red] Failed to sync {db.name}: {e}")
+            # Databases are independent: sync them concurrently, so wall time is that of the slowest one
+            states: list[DatabaseSyncState | None] = [None] * len(items)
+            with ThreadPoolExecutor(
+                max_workers=min(options.database_concurrency, len(items)), thread_name_prefix="nao-sync-db"
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        sync_database,
+                        db,
+                        output_path,
+                        progress,
+                        project_path,
+                        jobs=options.jobs,
+                        manifest=None if options.full else manifest,
+                        sync_engine=options.engine,
+                        engine=engine,
+                    ): i
+                    for i, db in enumerate(items)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        states[index] = future.result()
+                    except Exception as e:
+                        console.print(f"[bold red]✗[/bold red] Failed to sync {items[index].name}: {e}")
+
+        # Kept in config order, so that cleanup output is stable
+        sync_states = [state for state in states if state is not None]
+        for state in sync_states:
+            total_datasets += state.schemas_synced
+            total_tables += state.tables_synced
+            total_unchanged += state.tables_unchanged
+            files_written += state.files_written
+            files_unchanged += state.files_unchanged
 
         for state in sync_states:
-            removed = cleanup_stale_paths(state, verbose=True)
+            # Only paths recorded by the previous sync are checked, unless --full asks to list every directory
+            previous = None if options.full else manifest.get(state.db_path)
+            removed = cleanup_stale_paths(state, verbose=True, previous=previous)
             total_removed += removed
+            if state.manifest is not None:
+                state.manifest.set_synced(state.synced_tables, state.synced_schemas)
+                manifest.set(state.db_path, state.manifest)
+
+        manifest.save()
 
         total_dur = _fmt_duration(time.monotonic() - sync_start)
         summary = f"{total_tables} tables across {total_datasets} datasets in {total_dur}"
+        if total_unchanged > 0:
+            summary += f" ({total_unchanged} unchanged)"
         if total_removed > 0:
             summary += f", {total_removed} stale removed"
 
@@ -246,7 +624,10 @@ class DatabaseSyncProvider(SyncProvider):
             details={
                 "datasets": total_datasets,
                 "tables": total_tables,
+                "unchanged": total_unchanged,
                 "removed": total_removed,
+                "files_written": files_written,
+                "files_unchanged": files_unchanged,
             },
             summary=summary,
         )
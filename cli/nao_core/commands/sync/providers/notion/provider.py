@@ -7,10 +7,11 @@ from notion_client import Client
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
+from nao_core.commands.sync.manifest import PathManifest
 from nao_core.config.base import NaoConfig
 from nao_core.config.notion import NotionConfig
 
-from ..base import SyncProvider, SyncResult
+from ..base import SyncOptions, SyncProvider, SyncResult
 
 console = Console()
 
@@ -21,6 +22,10 @@ NOTION_PAGE_ID_PATTERN = re.compile(r"[a-f0-9]{32}")
 def cleanup_stale_pages(synced_files: set[str], output_path: Path, verbose: bool = False) -> int:
     """Remove markdown files that were not synced.
 
+    Only the pages recorded by the previous sync are checked; the output
+    directory is listed when there is no record yet. The synced files are
+    then recorded for the next sync.
+
     Args:
         synced_files: Set of filenames that were synced in this run.
         output_path: Path where synced markdown files are stored.
@@ -32,15 +37,21 @@ def cleanup_stale_pages(synced_files: set[str], output_path: Path, verbose: bool
     if not output_path.exists():
         return 0
 
-    removed_count = 0
-    for file_path in output_path.iterdir():
-        if file_path.is_file() and file_path.suffix == ".md":
-            if file_path.name not in synced_files:
-                file_path.unlink()
-                removed_count += 1
-                if verbose:
-                    console.print(f"  [dim red]removing stale page:[/dim red] {file_path.name}")
+    manifest = PathManifest.load(output_path, "notion")
+    if manifest.names is None:
+        page_files = [p for p in output_path.iterdir() if p.suffix == ".md"]
+    else:
+        page_files = [output_path / name for name in sorted(manifest.names)]
 
+    removed_count = 0
+    for file_path in page_files:
+        if file_path.name not in synced_files and file_path.is_file():
+            file_path.unlink()
+            removed_count += 1
+            if verbose:
+                console.print(f"  [dim red]removing stale page:[/dim red] {file_path.name}")
+
+    manifest.save(synced_files)
     return removed_count
 
 
@@ -133,13 +144,20 @@ class NotionSyncProvider(SyncProvider):
     def get_items(self, config: NaoConfig) -> list[NotionConfig]:
         return [config.notion] if config.notion else []
 
-    def sync(self, items: list[NotionConfig], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[NotionConfig],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync Notion pages to local filesystem as markdown files.
 
         Args:
             items: Notion configuration with pages to sync.
             output_path: Path where synced markdown files should be written.
             project_path: Path to the nao project root.
+            options: Options of the sync run (unused for Notion).
 
         Returns:
             SyncResult with statistics about what was synced.
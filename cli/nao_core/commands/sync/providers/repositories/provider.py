@@ -7,10 +7,11 @@ from typing import Any
 from rich.console import Console
 
 from nao_core.commands.sync.cleanup import cleanup_stale_repos
+from nao_core.commands.sync.manifest import PathManifest
 from nao_core.config import NaoConfig
 from nao_core.config.repos import RepoConfig
 
-from ..base import SyncProvider, SyncResult
+from ..base import SyncOptions, SyncProvider, SyncResult
 
 console = Console()
 
@@ -106,13 +107,20 @@ class RepositorySyncProvider(SyncProvider):
     def get_items(self, config: NaoConfig) -> list[RepoConfig]:
         return config.repos
 
-    def sync(self, items: list[Any], output_path: Path, project_path: Path | None = None) -> SyncResult:
+    def sync(
+        self,
+        items: list[Any],
+        output_path: Path,
+        project_path: Path | None = None,
+        options: SyncOptions | None = None,
+    ) -> SyncResult:
         """Sync all configured repositories.
 
         Args:
                 items: List of repository configurations
                 output_path: Base path where repositories are stored
                 project_path: Path to the nao project root (unused for repos)
+                options: Options of the sync run (unused for repos)
 
         Returns:
                 SyncResult with number of successfully synced repositories
@@ -131,4 +139,12 @@ class RepositorySyncProvider(SyncProvider):
                 success_count += 1
                 console.print(f"  [green]✓[/green] {repo.name}")
 
+        # Record the repositories on disk, so that the next cleanup doesn't need to list the output directory
+        manifest = PathManifest.load(output_path, "repos")
+        if manifest.names is None:
+            recorded = {d.name for d in output_path.iterdir() if d.is_dir()}
+        else:
+            recorded = manifest.names
+        manifest.save(recorded | {repo.name for repo in items if (output_path / repo.name).is_dir()})
+
         return SyncResult(provider_name=self.name, items_synced=success_count)
@@ -225,6 +225,12 @@ class NaoConfig(BaseModel):
         data = yaml.safe_load(content)
         return cls.model_validate(data)
 
+    def resolve_relative_paths(self, project_path: Path) -> "NaoConfig":
+        """Return a copy where relative file paths (DuckDB files, key files, ...) are anchored at project_path."""
+        return self.model_copy(
+            update={"databases": [db.resolve_relative_paths(project_path) for db in self.databases]},
+        )
+
     def get_connection(self, name: str) -> BaseBackend:
         """Get an Ibis connection by database name."""
         for db in self.databases:
@@ -243,6 +249,7 @@ class NaoConfig(BaseModel):
         *,
         exit_on_error: bool = False,
         raise_on_error: bool = False,
+        chdir: bool = True,
     ) -> "NaoConfig | None":
         """Try to load config from path.
 
@@ -251,6 +258,9 @@ class NaoConfig(BaseModel):
                   environment variable if set, otherwise current directory.
             exit_on_error: If True, prints error message and calls sys.exit(1) on failure.
             raise_on_error: If True, raises NaoConfigError on failure.
+            chdir: If True, changes the working directory to the project so relative paths
+                   in the config resolve against it. Long-running processes serving several
+                   projects should pass False and use `resolve_relative_paths` instead.
         Returns:
             NaoConfig if loaded successfully, None if failed and both flags are False.
         """
@@ -273,7 +283,8 @@ class NaoConfig(BaseModel):
             return None
 
         try:
-            os.chdir(path)
+            if chdir:
+                os.chdir(path)
             return cls.load(path)
         except yaml.YAMLError as e:
             handle_error(f"Failed to load nao_config.yaml: Invalid YAML syntax: {e}")
@@ -3,7 +3,7 @@ from typing import Annotated, Union
 from pydantic import Discriminator, Tag
 
 from .athena import AthenaConfig
-from .base import DatabaseAccessor, DatabaseConfig, DatabaseType
+from .base import DatabaseAccessor, DatabaseConfig, DatabaseType, ResultCursor
 from .bigquery import BigQueryConfig
 from .databricks import DatabricksConfig
 from .duckdb import DuckDBConfig
@@ -82,6 +82,7 @@ __all__ = [
     "DatabaseType",
     "DuckDBConfig",
     "DatabricksConfig",
+    "ResultCursor",
     "MssqlConfig",
     "SnowflakeConfig",
     "PostgresConfig",
@@ -84,8 +84,12 @@ class AthenaConfig(DatabaseConfig):
     def get_database_name(self) -> str:
         return self.schema_name or "default"
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
-        """Return the list of schemas to sync."""
+    def ping(self, conn: BaseBackend) -> bool:
+        # Athena queries are billed and slow to start; the client itself holds no session to go stale
+        return True
+
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
+        """Return the schemas of the database."""
         if self.schema_name:
             return [self.schema_name]
 
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-import fnmatch
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import pandas as pd
+import pyarrow as pa
 import questionary
 from ibis import BaseBackend
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .patterns import TablePatterns
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from .context import SchemaMetadata
 
 
 class DatabaseType(str, Enum):
@@ -37,6 +48,95 @@ class DatabaseAccessor(str, Enum):
     PREVIEW = "preview"
 
 
+@dataclass
+class CatalogTable:
+    """A table or view listed from the catalog of a database."""
+
+    schema: str
+    table: str
+    table_type: str
+    """'table', 'view' or 'materialized view'"""
+    last_altered: Any = None
+    """When the table was last altered, for backends whose catalog records it"""
+
+
+def _normalize_table_type(table_type: object) -> str:
+    """Map a catalog table type (BASE TABLE, VIEW, MATERIALIZED_VIEW, MANAGED, ...) to a portable one."""
+    kind = str(table_type or "").upper().replace("_", " ")
+    if "MATERIALIZED VIEW" in kind:
+        return "materialized view"
+    if "VIEW" in kind:
+        return "view"
+    return "table"
+
+
+FETCH_BATCH_SIZE = 10_000
+"""Rows requested from the driver per round-trip when reading a result incrementally."""
+
+
+class ResultCursor:
+    """Incremental reader over the result of a query.
+
+    Wraps an iterator of DataFrame batches produced by the driver. Batches are
+    pulled lazily, so only the rows handed out (plus at most one batch of
+    read-ahead) are ever held in memory.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        batches: Iterator[pd.DataFrame],
+        close: Callable[[], object] | None = None,
+    ):
+        self.columns = columns
+        self._batches = batches
+        self._buffer: pd.DataFrame | None = None
+        self._close = close
+
+    def fetch(self, max_rows: int) -> pd.DataFrame:
+        """Return the next `max_rows` rows at most (fewer once the result is exhausted)."""
+        frames: list[pd.DataFrame] = []
+        remaining = max_rows
+        while remaining > 0:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            if len(batch) > remaining:
+                self._buffer = batch.iloc[remaining:].reset_index(drop=True)
+                batch = batch.iloc[:remaining]
+            frames.append(batch)
+            remaining -= len(batch)
+
+        if not frames:
+            return pd.DataFrame(columns=pd.Index(self.columns))
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+        return pd.concat(frames, ignore_index=True)
+
+    def has_more(self) -> bool:
+        """Whether rows remain to be fetched. May read one batch ahead."""
+        if self._buffer is None:
+            self._buffer = self._next_batch()
+        return self._buffer is not None
+
+    def close(self) -> None:
+        """Release the driver cursor. Unread rows are discarded."""
+        self._buffer = None
+        self._batches = iter(())
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def _next_batch(self) -> pd.DataFrame | None:
+        if self._buffer is not None:
+            batch, self._buffer = self._buffer, None
+            return batch
+        for batch in self._batches:
+            if len(batch):
+                return batch
+        return None
+
+
 class DatabaseConfig(BaseModel, ABC):
     """Base configuration for all database backends."""
 
@@ -55,6 +155,43 @@ class DatabaseConfig(BaseModel, ABC):
         default_factory=lambda: list(DatabaseAccessor),
         description="Which default templates to render per table (e.g., ['columns', 'description']). Defaults to all.",
     )
+    query_timeout_s: float | None = Field(
+        default=None,
+        gt=0,
+        description="Cancel queries running longer than this many seconds (enforced by the database where supported)",
+    )
+    query_cache_ttl_s: float = Field(
+        default=0,
+        ge=0,
+        description="Seconds the SQL service may serve cached results for a repeated read query (0 disables caching)",
+    )
+    exact_row_count: bool = Field(
+        default=False,
+        description="Count rows with COUNT(*) during sync instead of estimating them from catalog statistics",
+    )
+    preview_strategy: Literal["limit", "tablesample", "partition-pruned"] = Field(
+        default="limit",
+        description="How `nao sync` picks preview rows: the first rows, a block sample (TABLESAMPLE), "
+        "or the first rows of the latest partition",
+    )
+    preview_timeout_s: float | None = Field(
+        default=None,
+        gt=0,
+        description="Cancel preview queries of `nao sync` running longer than this many seconds",
+    )
+    sync_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Number of tables rendered in parallel by `nao sync` (overridden by --jobs). Defaults to 1.",
+    )
+
+    ignore_case_patterns: ClassVar[bool] = False
+    """Whether include/exclude patterns match identifiers case-insensitively"""
+
+    keep_connections_open: ClassVar[bool] = True
+    """Whether the SQL service may keep idle connections open for reuse"""
+
+    _patterns: TablePatterns | None = PrivateAttr(default=None)
 
     @classmethod
     @abstractmethod
@@ -67,9 +204,14 @@ class DatabaseConfig(BaseModel, ABC):
         """Create an Ibis connection for this database."""
         ...
 
-    def execute_sql(self, sql: str) -> pd.DataFrame:
-        """Execute arbitrary SQL and return results as a DataFrame."""
-        conn = self.connect()
+    def execute_sql(self, sql: str, conn: BaseBackend | None = None) -> pd.DataFrame:
+        """Execute arbitrary SQL and return results as a DataFrame.
+
+        Args:
+            sql: The SQL statement to run
+            conn: An already open connection to reuse (e.g. from a pool). A new one is opened if omitted.
+        """
+        conn = conn or self.connect()
         cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
 
         if hasattr(cursor, "fetchdf"):
@@ -77,8 +219,106 @@ class DatabaseConfig(BaseModel, ABC):
         if hasattr(cursor, "to_dataframe"):
             return cursor.to_dataframe()
 
+        # Generic DB-API cursor: convert the rows one batch at a time rather than
+        # materializing the whole result as Python tuples first
+        columns: list[str] = [desc[0] for desc in cursor.description]
+        frames = list(_fetchmany_batches(cursor, columns, FETCH_BATCH_SIZE))
+        if not frames:
+            return pd.DataFrame(columns=pd.Index(columns))
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def execute_arrow(self, sql: str, conn: BaseBackend | None = None, limit: int | None = None) -> pa.Table:
+        """Execute arbitrary SQL and return results as an Arrow table, without going through pandas.
+
+        Args:
+            sql: The SQL statement to run
+            conn: An already open connection to reuse (e.g. from a pool). A new one is opened if omitted.
+            limit: Read at most this many rows; the rest of the result is never fetched from the database.
+        """
+        conn = conn or self.connect()
+        cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
+
+        if cursor.description is None:
+            # Nothing to fetch: DB-API drivers raise when fetching from a statement without a result set
+            return _rows_to_arrow(None, [])
+
+        if limit is not None:
+            return _fetch_arrow_limited(cursor, limit)
+
+        # Drivers with native Arrow fetch: DuckDB, Snowflake, Databricks
+        for method in ("to_arrow_table", "fetch_arrow_all", "fetchall_arrow"):
+            fetch = getattr(cursor, method, None)
+            if callable(fetch):
+                table = fetch()
+                # Snowflake returns None instead of an empty table
+                return table if table is not None else _rows_to_arrow(cursor.description, [])
+
+        return _rows_to_arrow(cursor.description, cursor.fetchall())
+
+    def open_cursor(
+        self, sql: str, conn: BaseBackend | None = None, batch_size: int = FETCH_BATCH_SIZE
+    ) -> ResultCursor:
+        """Execute arbitrary SQL and return a cursor reading the result incrementally.
+
+        Unlike `execute_sql`, rows are only pulled from the database as they are
+        fetched from the cursor, so memory stays bounded for large results.
+
+        Args:
+            sql: The SQL statement to run
+            conn: An already open connection to reuse (e.g. from a pool). A new one is opened if omitted.
+            batch_size: Number of rows requested from the driver at a time.
+        """
+        conn = conn or self.connect()
+        cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
+
+        if cursor.description is None:
+            # Statement without a result set (DDL, DML on some drivers)
+            return ResultCursor([], iter(()))
+
         columns: list[str] = [desc[0] for desc in cursor.description]
-        return pd.DataFrame(cursor.fetchall(), columns=columns)  # type: ignore[arg-type]
+        if hasattr(cursor, "fetch_df_chunk"):
+            # DuckDB: chunks keep the same dtypes as fetchdf(). The cursor is the connection itself, never close it.
+            return ResultCursor(columns, _duckdb_batches(cursor))
+        return ResultCursor(columns, _fetchmany_batches(cursor, columns, batch_size), close=cursor.close)
+
+    def connect_for_thread(self, conn: BaseBackend) -> BaseBackend:
+        """Open a connection for use by another thread than the one using `conn`.
+
+        Ibis backends are not safe for concurrent use, so each worker thread of
+        a parallel sync gets its own connection. Override where a connection
+        can be derived from `conn` instead (e.g. to share an in-memory database).
+        """
+        return self.connect()
+
+    def resolve_relative_paths(self, project_path: Path) -> DatabaseConfig:
+        """Return a copy with relative file paths anchored at project_path. Override for file-based settings."""
+        return self
+
+    def cancel(self, conn: BaseBackend) -> bool:
+        """Interrupt the query running on an open connection. Called from another thread.
+
+        Returns:
+            False if the backend has no way to cancel a running query.
+        """
+        return False
+
+    def ping(self, conn: BaseBackend) -> bool:
+        """Check that an open connection is still usable. Override for backends where `SELECT 1` is costly."""
+        conn.raw_sql("SELECT 1").close()  # type: ignore[union-attr]
+        return True
+
+    @property
+    def patterns(self) -> TablePatterns:
+        """The include/exclude patterns, compiled on first use."""
+        if self._patterns is None:
+            self._patterns = TablePatterns(self.include, self.exclude, ignore_case=self.ignore_case_patterns)
+        return self._patterns
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, compiling the patterns of the copy anew as `update` may change them."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._patterns = None
+        return copy
 
     def matches_pattern(self, schema: str, table: str) -> bool:
         """Check if a schema.table matches the include/exclude patterns.
@@ -90,21 +330,19 @@ class DatabaseConfig(BaseModel, ABC):
         Returns:
             True if the table should be included, False if excluded
         """
-        full_name = f"{schema}.{table}"
-
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.include)
-            if not included:
-                return False
+        return self.patterns.matches(schema, table)
 
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch.fnmatch(full_name, pattern) for pattern in self.exclude)
-            if excluded:
-                return False
+    def schema_matches(self, schema: str) -> bool:
+        """Check if a schema could have any tables matching the include/exclude patterns."""
+        return self.patterns.matches_schema(schema)
 
-        return True
+    @staticmethod
+    def _anchor_path(path: str, project_path: Path) -> str:
+        """Anchor a relative (or ~-prefixed) file path at the project folder."""
+        expanded = Path(path).expanduser()
+        if expanded.is_absolute():
+            return str(expanded)
+        return str(project_path / expanded)
 
     @abstractmethod
     def get_database_name(self) -> str:
@@ -112,17 +350,60 @@ class DatabaseConfig(BaseModel, ABC):
         ...
 
     def get_schemas(self, conn: BaseBackend) -> list[str]:
-        """Return the list of schemas to sync. Override in subclasses for custom behavior."""
+        """Return the list of schemas to sync, leaving out those excluded by the include/exclude patterns."""
+        return [schema for schema in self.list_schemas(conn) if self.schema_matches(schema)]
+
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
+        """Return the user schemas of the database. Override in subclasses for custom behavior."""
         list_databases = getattr(conn, "list_databases", None)
         if list_databases:
             return list_databases()
         return []
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str):
+    def catalog_query(self) -> str | None:
+        """SQL listing (schema, table, table type, last altered) for every table of the schemas to sync.
+
+        Returns None when the backend has no such query, and tables are listed
+        schema by schema instead. Override in subclasses with an information schema.
+        """
+        return None
+
+    def list_catalog(self, conn: BaseBackend) -> list[CatalogTable] | None:
+        """List the tables of every schema to sync in one catalog query, or None if the backend can't.
+
+        Tables are not filtered by the include/exclude patterns.
+        """
+        sql = self.catalog_query()
+        if sql is None:
+            return None
+        rows = conn.raw_sql(sql).fetchall()  # type: ignore[union-attr]
+        return [
+            CatalogTable(str(schema), str(table), _normalize_table_type(table_type), last_altered)
+            for schema, table, table_type, last_altered in rows
+        ]
+
+    def fetch_schema_metadata(self, conn: BaseBackend, schema: str) -> SchemaMetadata | None:
+        """Fetch the metadata of every table in `schema` at once, to share between their contexts.
+
+        Returns None when the backend has nothing to prefetch. Override in
+        subclasses whose contexts otherwise query metadata table by table.
+        """
+        return None
+
+    def create_context(self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None):
         """Create a DatabaseContext for this table. Override in subclasses for custom metadata."""
         from nao_core.config.databases.context import DatabaseContext
 
-        return DatabaseContext(conn, schema, table_name)
+        return DatabaseContext(conn, schema, table_name, metadata, **self.context_options())
+
+    def context_options(self) -> dict[str, Any]:
+        """Options of this database passed to every DatabaseContext created by `create_context`."""
+        return {
+            "exact_row_count": self.exact_row_count,
+            "preview_strategy": self.preview_strategy,
+            "preview_timeout_s": self.preview_timeout_s,
+            "cancel": self.cancel,
+        }
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to the database. Override in subclasses for custom behavior."""
@@ -134,3 +415,61 @@ class DatabaseConfig(BaseModel, ABC):
             return True, "Connected successfully"
         except Exception as e:
             return False, str(e)
+
+
+def _rows_to_arrow(description, rows: list) -> pa.Table:
+    """Build an Arrow table from DB-API rows, letting Arrow infer the column types."""
+    if description is None:
+        # Statement without a result set (DDL, DML on some drivers)
+        return pa.table({})
+    names: list[str] = [desc[0] for desc in description]
+    return pa.Table.from_arrays([_values_to_arrow([row[i] for row in rows]) for i in range(len(names))], names=names)
+
+
+def _values_to_arrow(values: list) -> pa.Array:
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type column (e.g. a variant/JSON column): fall back to strings
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _fetchmany_batches(cursor, columns: list[str], batch_size: int) -> Iterator[pd.DataFrame]:
+    while rows := cursor.fetchmany(batch_size):
+        yield pd.DataFrame(rows, columns=columns)  # type: ignore[arg-type]
+
+
+def _duckdb_batches(cursor) -> Iterator[pd.DataFrame]:
+    while len(chunk := cursor.fetch_df_chunk()):
+        yield chunk
+
+
+def _fetch_arrow_limited(cursor, limit: int) -> pa.Table:
+    """Read at most `limit` rows from a driver cursor as an Arrow table."""
+    if hasattr(cursor, "fetch_record_batch"):  # DuckDB (to_arrow_reader since 1.4)
+        to_reader = getattr(cursor, "to_arrow_reader", cursor.fetch_record_batch)
+        reader = to_reader(min(limit, FETCH_BATCH_SIZE) or 1)
+        return collect_arrow_batches(reader, limit, reader.schema)
+    if hasattr(cursor, "fetch_arrow_batches"):  # Snowflake
+        table = collect_arrow_batches(cursor.fetch_arrow_batches(), limit)
+        return table if table is not None else _rows_to_arrow(cursor.description, [])
+    if hasattr(cursor, "fetchmany_arrow"):  # Databricks
+        return cursor.fetchmany_arrow(limit)
+    return _rows_to_arrow(cursor.description, cursor.fetchmany(limit) if limit else [])
+
+
+def collect_arrow_batches(
+    batches: Iterable[pa.RecordBatch | pa.Table], limit: int, schema: pa.Schema | None = None
+) -> pa.Table | None:
+    """Concatenate Arrow batches until `limit` rows are collected. Returns None if there are no batches."""
+    tables: list[pa.Table] = []
+    remaining = limit
+    for batch in batches:
+        if remaining <= 0:
+            break
+        table = batch if isinstance(batch, pa.Table) else pa.Table.from_batches([batch])
+        tables.append(table.slice(0, remaining))
+        remaining -= tables[-1].num_rows
+    if tables:
+        return pa.concat_tables(tables)
+    return schema.empty_table() if schema is not None else None
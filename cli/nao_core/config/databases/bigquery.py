@@ -1,16 +1,18 @@
 import json
 import logging
+from pathlib import Path
 from typing import Any, Literal
 
 import ibis
 import pandas as pd
+import pyarrow as pa
 from ibis import BaseBackend
 from pydantic import Field, field_validator
 
 from nao_core.ui import ask_select, ask_text
 
-from .base import DatabaseConfig
-from .context import DatabaseContext
+from .base import FETCH_BATCH_SIZE, DatabaseConfig, ResultCursor, collect_arrow_batches
+from .context import DatabaseContext, SchemaMetadata, memoize
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +20,32 @@ logger = logging.getLogger(__name__)
 class BigQueryDatabaseContext(DatabaseContext):
     """BigQuery context with partition, clustering, and description discovery."""
 
-    def __init__(self, conn: BaseBackend, schema: str, table_name: str, project_id: str):
-        super().__init__(conn, schema, table_name)
+    def __init__(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        project_id: str,
+        metadata: SchemaMetadata | None = None,
+        **options: Any,
+    ):
+        super().__init__(conn, schema, table_name, metadata, **options)
         self._project_id = project_id
 
+    @memoize
     def partition_columns(self) -> list[str]:
+        if (partitions := self._prefetched("partition_columns")) is not None:
+            return partitions.get(self._table_name, [])
         try:
             return _get_bq_partition_columns(self._conn, self._schema, self._table_name)
         except Exception:
             logger.debug("Failed to fetch partition columns for %s.%s", self._schema, self._table_name)
             return []
 
+    @memoize
     def description(self) -> str | None:
+        if (descriptions := self._prefetched("descriptions")) is not None:
+            return descriptions.get(self._table_name)
         try:
             query = f"""
                 SELECT option_value
@@ -43,6 +59,7 @@ class BigQueryDatabaseContext(DatabaseContext):
             pass
         return None
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         cols = super().columns()
         try:
@@ -55,6 +72,8 @@ class BigQueryDatabaseContext(DatabaseContext):
         return cols
 
     def _fetch_column_descriptions(self) -> dict[str, str]:
+        if (col_descs := self._prefetched("column_descriptions")) is not None:
+            return col_descs.get(self._table_name, {})
         query = f"""
             SELECT column_name, description
             FROM `{self._project_id}.{self._schema}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS`
@@ -86,6 +105,82 @@ def _get_bq_partition_columns(conn: BaseBackend, schema: str, table: str) -> lis
     return columns
 
 
+def _fetch_bq_schema_metadata(conn: BaseBackend, project_id: str, schema: str) -> SchemaMetadata:
+    """Fetch descriptions, partitioning and clustering of every table in the dataset from INFORMATION_SCHEMA."""
+    options_query = f"""
+        SELECT table_name, option_value
+        FROM `{project_id}.{schema}.INFORMATION_SCHEMA.TABLE_OPTIONS`
+        WHERE option_name = 'description'
+    """
+    field_paths_query = f"""
+        SELECT table_name, column_name, description
+        FROM `{project_id}.{schema}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS`
+        WHERE description IS NOT NULL AND description != ''
+    """
+    partition_query = f"""
+        SELECT table_name, column_name, is_partitioning_column, clustering_ordinal_position
+        FROM `{schema}.INFORMATION_SCHEMA.COLUMNS`
+        WHERE is_partitioning_column = 'YES' OR clustering_ordinal_position IS NOT NULL
+    """
+    descriptions: dict[str, str] = {}
+    for table, value in conn.raw_sql(options_query):  # type: ignore[union-attr]
+        if value and (text := str(value).strip().strip('"')):
+            descriptions[table] = text
+
+    column_descriptions: dict[str, dict[str, str]] = {}
+    for table, column, description in conn.raw_sql(field_paths_query):  # type: ignore[union-attr]
+        if description:
+            column_descriptions.setdefault(table, {})[column] = str(description)
+
+    # Partitioning columns first, then clustering columns in clustering order (as _get_bq_partition_columns)
+    partitioning: dict[str, list[str]] = {}
+    clustering: dict[str, list[tuple[int, str]]] = {}
+    for table, column, is_partitioning, clustering_position in conn.raw_sql(partition_query):  # type: ignore[union-attr]
+        if is_partitioning == "YES":
+            partitioning.setdefault(table, []).append(column)
+        if clustering_position is not None:
+            clustering.setdefault(table, []).append((clustering_position, column))
+
+    partition_columns: dict[str, list[str]] = {}
+    for table in partitioning.keys() | clustering.keys():
+        columns = list(partitioning.get(table, []))
+        columns.extend(col for _, col in sorted(clustering.get(table, [])) if col not in columns)
+        partition_columns[table] = columns
+
+    try:
+        fingerprints, row_counts = _fetch_bq_table_stats(conn, project_id, schema)
+    except Exception:
+        logger.debug("Failed to fetch table statistics for %s", schema)
+        fingerprints, row_counts = None, None
+
+    return SchemaMetadata(
+        descriptions=descriptions,
+        column_descriptions=column_descriptions,
+        partition_columns=partition_columns,
+        row_counts=row_counts,
+        fingerprints=fingerprints,
+    )
+
+
+def _fetch_bq_table_stats(conn: BaseBackend, project_id: str, schema: str) -> tuple[dict[str, str], dict[str, int]]:
+    """Return the fingerprint and row count of every table in the dataset, from `__TABLES__`.
+
+    last_modified_time changes with both schema and data. Views (type 2) have no statistics.
+    """
+    query = f"""
+        SELECT table_id, last_modified_time, row_count, size_bytes
+        FROM `{project_id}.{schema}.__TABLES__`
+        WHERE type = 1
+    """
+    fingerprints: dict[str, str] = {}
+    row_counts: dict[str, int] = {}
+    for table, modified, rows, size in conn.raw_sql(query):  # type: ignore[union-attr]
+        fingerprints[table] = f"{modified}|{rows}|{size}"
+        if rows is not None:
+            row_counts[table] = int(rows)
+    return fingerprints, row_counts
+
+
 class BigQueryConfig(DatabaseConfig):
     """BigQuery-specific configuration."""
 
@@ -150,13 +245,41 @@ class BigQueryConfig(DatabaseConfig):
             sso=sso,
         )
 
-    def execute_sql(self, sql: str) -> pd.DataFrame:
-        conn = self.connect()
+    def execute_sql(self, sql: str, conn: BaseBackend | None = None) -> pd.DataFrame:
+        conn = conn or self.connect()
         cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
         # Disable BigQuery Storage Read API (gRPC) — it deadlocks when an
         # asyncio event loop is running in the same process (e.g. FastAPI).
         return cursor.to_dataframe(create_bqstorage_client=False)
 
+    def execute_arrow(self, sql: str, conn: BaseBackend | None = None, limit: int | None = None) -> pa.Table:
+        conn = conn or self.connect()
+        cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
+        # Same Storage Read API caveat as execute_sql
+        if limit is not None:
+            table = collect_arrow_batches(cursor.to_arrow_iterable(bqstorage_client=None), limit)
+            if table is not None:
+                return table
+        return cursor.to_arrow(create_bqstorage_client=False)
+
+    def open_cursor(
+        self, sql: str, conn: BaseBackend | None = None, batch_size: int = FETCH_BATCH_SIZE
+    ) -> ResultCursor:
+        conn = conn or self.connect()
+        cursor = conn.raw_sql(sql)  # type: ignore[union-attr]
+        # Result pages are downloaded over REST as the cursor is read
+        columns = [field.name for field in cursor.schema or []]
+        return ResultCursor(columns, iter(cursor.to_dataframe_iterable(bqstorage_client=None)))
+
+    def resolve_relative_paths(self, project_path: Path) -> "BigQueryConfig":
+        if not self.credentials_path:
+            return self
+        return self.model_copy(update={"credentials_path": self._anchor_path(self.credentials_path, project_path)})
+
+    def ping(self, conn: BaseBackend) -> bool:
+        # The BigQuery client is stateless HTTP: a probe query would only add a job round-trip
+        return True
+
     def connect(self) -> BaseBackend:
         """Create an Ibis BigQuery connection."""
         kwargs: dict = {"project_id": self.project_id}
@@ -184,20 +307,42 @@ class BigQueryConfig(DatabaseConfig):
             )
             kwargs["credentials"] = credentials
 
-        return ibis.bigquery.connect(**kwargs)
+        conn = ibis.bigquery.connect(**kwargs)
+
+        if self.query_timeout_s:
+            from google.cloud import bigquery
+
+            # Merged into the job config of every query run by this client
+            job_config = conn.client.default_query_job_config or bigquery.QueryJobConfig()
+            job_config.job_timeout_ms = int(self.query_timeout_s * 1000)
+            conn.client.default_query_job_config = job_config
+
+        return conn
 
     def get_database_name(self) -> str:
         """Get the database name for BigQuery."""
         return self.project_id
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.dataset_id:
             return [self.dataset_id]
         list_databases = getattr(conn, "list_databases", None)
         return list_databases() if list_databases else []
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> BigQueryDatabaseContext:
-        return BigQueryDatabaseContext(conn, schema, table_name, project_id=self.project_id)
+    def fetch_schema_metadata(self, conn: BaseBackend, schema: str) -> SchemaMetadata:
+        return _fetch_bq_schema_metadata(conn, self.project_id, schema)
+
+    def create_context(
+        self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None
+    ) -> BigQueryDatabaseContext:
+        return BigQueryDatabaseContext(
+            conn,
+            schema,
+            table_name,
+            project_id=self.project_id,
+            metadata=metadata,
+            **self.context_options(),
+        )
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to BigQuery."""
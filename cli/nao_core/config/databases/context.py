@@ -1,9 +1,88 @@
 """Base database context exposing methods available in templates during sync."""
 
-from typing import Any
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal, TypeVar
 
+import pandas as pd
 from ibis import BaseBackend
 
+PreviewStrategy = Literal["limit", "tablesample", "partition-pruned"]
+
+TABLESAMPLE_OVERSAMPLING = 10
+"""Sample about this many times the preview limit, as block sampling returns uneven row counts"""
+
+_JSON_TYPES = (str, int, float, bool, list, dict)
+
+_Accessor = TypeVar("_Accessor", bound=Callable[..., Any])
+
+
+def memoize(method: _Accessor) -> _Accessor:
+    """Cache the result of a context accessor per instance and arguments.
+
+    Templates of a table share one context, so metadata fetched by one
+    accessor template is not queried again by the next. Subclasses decorate
+    their overrides too; results are cached per defining class, so calling
+    `super()` from a memoized override is fine. Errors are not cached.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__qualname__, *list(bound.arguments.items())[1:])
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+
+    return wrapper  # type: ignore[return-value]
+
+
+@dataclass
+class SchemaMetadata:
+    """Metadata of every table in a schema, prefetched with one query per kind.
+
+    Each mapping is keyed by table name. A mapping left to None was not
+    prefetched, and contexts fall back to querying it table by table.
+    """
+
+    descriptions: dict[str, str] | None = None
+    column_descriptions: dict[str, dict[str, str]] | None = None
+    partition_columns: dict[str, list[str]] | None = None
+    columns: dict[str, list[tuple]] | None = None
+    """Raw column rows, for backends building column metadata from information_schema."""
+    row_counts: dict[str, int] | None = None
+    """Row counts estimated from catalog statistics, for tables that have them."""
+    fingerprints: dict[str, str] | None = None
+    """Cheap catalog statistics (last altered time, row-count estimate, ...) that change with the table."""
+    table_types: dict[str, str] | None = None
+    """'table', 'view' or 'materialized view', for tables listed from the catalog."""
+    last_altered: dict[str, Any] | None = None
+    """When each table was last altered, for catalogs that record it."""
+
+    def fingerprint(self, table: str) -> str | None:
+        """Return a hash of everything known about `table`, or None if it has no catalog fingerprint.
+
+        Tables without one (views, backends without catalog statistics) can't be
+        told unchanged and are always re-rendered.
+        """
+        if not self.fingerprints or table not in self.fingerprints:
+            return None
+        parts = [
+            self.fingerprints[table],
+            (self.descriptions or {}).get(table),
+            (self.column_descriptions or {}).get(table),
+            (self.partition_columns or {}).get(table),
+            (self.columns or {}).get(table),
+        ]
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
 
 class DatabaseContext:
     """Context object passed to Jinja2 templates during database sync.
@@ -12,14 +91,32 @@ class DatabaseContext:
     column metadata, row previews, table descriptions, etc.
 
     Subclasses override description(), columns(), and partition_columns()
-    to fetch warehouse-specific metadata (e.g. BigQuery partition info).
+    to fetch warehouse-specific metadata (e.g. BigQuery partition info),
+    reading it from the schema's prefetched `SchemaMetadata` when available.
+    Accessors are `@memoize`d: their results are computed once per table.
     """
 
-    def __init__(self, conn: BaseBackend, schema: str, table_name: str):
+    def __init__(
+        self,
+        conn: BaseBackend,
+        schema: str,
+        table_name: str,
+        metadata: SchemaMetadata | None = None,
+        exact_row_count: bool = False,
+        preview_strategy: PreviewStrategy = "limit",
+        preview_timeout_s: float | None = None,
+        cancel: Callable[[BaseBackend], bool] | None = None,
+    ):
         self._conn = conn
         self._schema = schema
         self._table_name = table_name
+        self._metadata = metadata
+        self._exact_row_count = exact_row_count
+        self._preview_strategy = preview_strategy
+        self._preview_timeout_s = preview_timeout_s
+        self._cancel = cancel
         self._table_ref = None
+        self._cache: dict[tuple, Any] = {}
 
     @property
     def table(self):
@@ -27,6 +124,7 @@ class DatabaseContext:
             self._table_ref = self._conn.table(self._table_name, database=self._schema)
         return self._table_ref
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         """Return column metadata: name, type, nullable, description."""
         schema = self.table.schema()
@@ -40,6 +138,12 @@ class DatabaseContext:
             for name, dtype in schema.items()
         ]
 
+    def _prefetched(self, kind: str) -> dict[str, Any] | None:
+        """Return the schema's prefetched `kind` mapping, or None if it must be queried per table."""
+        if self._metadata is None:
+            return None
+        return getattr(self._metadata, kind)
+
     @staticmethod
     def _format_type(dtype) -> str:
         """Convert Ibis type to a human-readable string (e.g. !int32 -> int32 NOT NULL)."""
@@ -48,30 +152,125 @@ class DatabaseContext:
             return f"{raw[1:]} NOT NULL"
         return raw
 
+    @memoize
     def preview(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Return the first N rows as a list of dictionaries."""
-        df = self.table.limit(limit).execute()
-        rows = []
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
-            for key, val in row_dict.items():
-                if val is not None and not isinstance(val, (str, int, float, bool, list, dict)):
-                    row_dict[key] = str(val)
-            rows.append(row_dict)
-        return rows
+        """Return the first N rows as a list of dictionaries.
 
+        Rows are selected according to the database's `preview_strategy`:
+        the first rows (`limit`), a block sample (`tablesample`), or the rows
+        of the latest partition (`partition-pruned`).
+        """
+        table = self.table
+        if self._preview_strategy == "tablesample":
+            rows = self.estimated_row_count()
+            if rows and (fraction := limit * TABLESAMPLE_OVERSAMPLING / rows) < 1:
+                sampled = self._with_preview_timeout(table.sample(fraction, method="block").limit(limit).execute)
+                # Block sampling may pick only empty blocks of a small table
+                if len(sampled):
+                    return dataframe_to_rows(sampled)
+        elif self._preview_strategy == "partition-pruned" and (partitions := self.partition_columns()):
+            column = table[partitions[0]]
+            latest = self._with_preview_timeout(column.max().execute)
+            if latest is not None:
+                table = table.filter(column == latest)
+        return dataframe_to_rows(self._with_preview_timeout(table.limit(limit).execute))
+
+    def _with_preview_timeout(self, fn: Callable[[], Any]) -> Any:
+        """Call `fn`, cancelling its query if it runs longer than `preview_timeout_s`.
+
+        Backends that can't cancel queries (see `DatabaseConfig.cancel`) let it complete.
+        """
+        if self._preview_timeout_s is None:
+            return fn()
+
+        timed_out = threading.Event()
+
+        def cancel() -> None:
+            timed_out.set()
+            if self._cancel is not None:
+                try:
+                    self._cancel(self._conn)
+                except Exception:
+                    pass
+
+        timer = threading.Timer(self._preview_timeout_s, cancel)
+        timer.daemon = True
+        timer.start()
+        try:
+            return fn()
+        except Exception as e:
+            if timed_out.is_set():
+                raise TimeoutError(f"Preview query exceeded the {self._preview_timeout_s:g}s preview timeout") from e
+            raise
+        finally:
+            timer.cancel()
+
+    @memoize
     def row_count(self) -> int:
-        """Return the total number of rows in the table."""
+        """Return the number of rows in the table.
+
+        Estimated from catalog statistics when the backend has them, unless
+        the database is configured with `exact_row_count` (see row_count_is_approximate()).
+        """
+        if not self._exact_row_count and (estimate := self.estimated_row_count()) is not None:
+            return estimate
+        return self.count_rows()
+
+    def row_count_is_approximate(self) -> bool:
+        """Return True if row_count() is an estimate rather than an exact count."""
+        return not self._exact_row_count and self.estimated_row_count() is not None
+
+    @memoize
+    def count_rows(self) -> int:
+        """Return the exact number of rows in the table, which may scan the whole table."""
         return self.table.count().execute()
 
+    @memoize
+    def estimated_row_count(self) -> int | None:
+        """Return the row count from catalog statistics, or None if there are none."""
+        if (row_counts := self._prefetched("row_counts")) is not None:
+            return row_counts.get(self._table_name)
+        return None
+
     def column_count(self) -> int:
         """Return the number of columns in the table."""
         return len(self.table.schema())
 
+    @memoize
     def partition_columns(self) -> list[str]:
         """Return partition/clustering column names if available."""
         return []
 
+    @memoize
     def description(self) -> str | None:
         """Return the table description if available."""
         return None
+
+    def table_type(self) -> str | None:
+        """Return 'table', 'view' or 'materialized view' if the table was listed from the catalog."""
+        if (table_types := self._prefetched("table_types")) is not None:
+            return table_types.get(self._table_name)
+        return None
+
+    def last_altered(self) -> Any:
+        """Return when the table was last altered, if the catalog records it."""
+        if (last_altered := self._prefetched("last_altered")) is not None:
+            return last_altered.get(self._table_name)
+        return None
+
+
+def dataframe_to_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to JSON-friendly row dicts, one column at a time.
+
+    Nulls (None, NaN, NaT) become None, numpy scalars become Python numbers,
+    and values JSON can't represent (timestamps, decimals, ...) become strings.
+    """
+    columns: list[list[Any]] = []
+    for name in df.columns:
+        series = df[name]
+        values = series.astype(object).where(series.notna(), None).tolist()
+        if series.dtype == object or not (pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series)):
+            values = [v if v is None or isinstance(v, _JSON_TYPES) else str(v) for v in values]
+        columns.append(values)
+    names = [str(name) for name in df.columns]
+    return [dict(zip(names, row)) for row in zip(*columns)]
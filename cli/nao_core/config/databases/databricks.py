@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 from typing import Any, Literal
 
 import certifi
@@ -10,7 +11,7 @@ from pydantic import Field
 from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
-from .context import DatabaseContext
+from .context import DatabaseContext, SchemaMetadata, memoize
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 class DatabricksDatabaseContext(DatabaseContext):
     """Databricks context with partition and description discovery."""
 
+    @memoize
     def partition_columns(self) -> list[str]:
         try:
             return _get_databricks_partition_columns(self._conn, self._schema, self._table_name)
@@ -25,6 +27,22 @@ class DatabricksDatabaseContext(DatabaseContext):
             logger.debug("Failed to fetch partition columns for %s.%s", self._schema, self._table_name)
             return []
 
+    @memoize
+    def estimated_row_count(self) -> int | None:
+        # DESCRIBE DETAIL has sizes but no row count: use the "Statistics" row of DESCRIBE TABLE EXTENDED
+        # (e.g. "1024 bytes, 42 rows"), which is only there once ANALYZE TABLE computed it
+        try:
+            query = f"DESCRIBE TABLE EXTENDED `{self._schema}`.`{self._table_name}`"
+            rows = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
+        except Exception:
+            logger.debug("Failed to fetch statistics for %s.%s", self._schema, self._table_name)
+            return None
+        for row in rows:
+            if row[0] == "Statistics" and (match := re.search(r"(\d+) rows", str(row[1]))):
+                return int(match.group(1))
+        return None
+
+    @memoize
     def description(self) -> str | None:
         try:
             query = f"""
@@ -38,6 +56,7 @@ class DatabricksDatabaseContext(DatabaseContext):
             pass
         return None
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         cols = super().columns()
         try:
@@ -121,20 +140,35 @@ class DatabricksConfig(DatabaseConfig):
         if self.schema_name:
             kwargs["schema"] = self.schema_name
 
+        if self.query_timeout_s:
+            kwargs["session_configuration"] = {"STATEMENT_TIMEOUT": str(max(int(self.query_timeout_s), 1))}
+
         return ibis.databricks.connect(**kwargs)
 
     def get_database_name(self) -> str:
         """Get the database name for Databricks."""
         return self.catalog or "main"
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
         list_databases = getattr(conn, "list_databases", None)
         return list_databases() if list_databases else []
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> DatabricksDatabaseContext:
-        return DatabricksDatabaseContext(conn, schema, table_name)
+    def catalog_query(self) -> str:
+        schema_filter = (
+            f"table_schema = '{self.schema_name}'" if self.schema_name else "table_schema <> 'information_schema'"
+        )
+        return f"""
+            SELECT table_schema, table_name, table_type, last_altered
+            FROM information_schema.tables
+            WHERE {schema_filter}
+        """
+
+    def create_context(
+        self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None
+    ) -> DatabricksDatabaseContext:
+        return DatabricksDatabaseContext(conn, schema, table_name, metadata, **self.context_options())
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Databricks."""
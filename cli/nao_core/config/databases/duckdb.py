@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Literal
+from typing import ClassVar, Literal
 
 import ibis
 from ibis import BaseBackend
@@ -16,6 +16,10 @@ class DuckDBConfig(DatabaseConfig):
     type: Literal["duckdb"] = "duckdb"
     path: str = Field(description="Path to the DuckDB database file", default=":memory:")
 
+    # An idle connection would hold the file lock, blocking writers and `nao sync`,
+    # and every `:memory:` connection is a separate empty database
+    keep_connections_open: ClassVar[bool] = False
+
     @classmethod
     def promptConfig(cls) -> "DuckDBConfig":
         """Interactively prompt the user for DuckDB configuration."""
@@ -31,6 +35,32 @@ class DuckDBConfig(DatabaseConfig):
             read_only=False if self.path == ":memory:" else True,
         )
 
+    def connect_for_thread(self, conn: BaseBackend) -> BaseBackend:
+        # A cursor is a new connection to the same database instance: it sees in-memory tables too
+        return ibis.duckdb.from_connection(conn.con.cursor())  # type: ignore[attr-defined]
+
+    def cancel(self, conn: BaseBackend) -> bool:
+        # DuckDB has no statement timeout: `query_timeout_s` is enforced by interrupting the query
+        conn.con.interrupt()  # type: ignore[attr-defined]
+        return True
+
+    def ping(self, conn: BaseBackend) -> bool:
+        # raw_sql() returns the connection itself rather than a cursor: it must not be closed
+        conn.raw_sql("SELECT 1")  # type: ignore[union-attr]
+        return True
+
+    def resolve_relative_paths(self, project_path: Path) -> "DuckDBConfig":
+        if self.path == ":memory:" or self.path.startswith("md:"):
+            return self
+        return self.model_copy(update={"path": self._anchor_path(self.path, project_path)})
+
+    def catalog_query(self) -> str:
+        return """
+            SELECT table_schema, table_name, table_type, NULL
+            FROM information_schema.tables
+            WHERE table_catalog = current_database()
+        """
+
     def get_database_name(self) -> str:
         """Get the database name for DuckDB."""
         if self.path == ":memory:":
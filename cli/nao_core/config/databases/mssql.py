@@ -93,7 +93,7 @@ class MssqlConfig(DatabaseConfig):
 
     def connect(self) -> BaseBackend:
         """Create an Ibis MSSQL connection."""
-        return ibis.mssql.connect(
+        conn = ibis.mssql.connect(
             host=self.host,
             port=self.port,
             database=self.database,
@@ -102,11 +102,17 @@ class MssqlConfig(DatabaseConfig):
             driver=self.driver,
         )
 
+        if self.query_timeout_s:
+            # pyodbc query timeout, applied to every statement run on the connection
+            conn.con.timeout = max(int(self.query_timeout_s), 1)
+
+        return conn
+
     def get_database_name(self) -> str:
         """Get the database name for MSSQL."""
         return self.database
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
         list_databases = getattr(conn, "list_databases", None)
@@ -115,6 +121,20 @@ class MssqlConfig(DatabaseConfig):
             return [s for s in schemas if s not in MSSQL_SYSTEM_SCHEMAS]
         return []
 
+    def catalog_query(self) -> str:
+        if self.schema_name:
+            schema_filter = f"t.TABLE_SCHEMA = '{self.schema_name}'"
+        else:
+            system_schemas = ", ".join(f"'{s}'" for s in sorted(MSSQL_SYSTEM_SCHEMAS))
+            schema_filter = f"t.TABLE_SCHEMA NOT IN ({system_schemas})"
+        return f"""
+            SELECT t.TABLE_SCHEMA, t.TABLE_NAME, t.TABLE_TYPE, o.modify_date
+            FROM INFORMATION_SCHEMA.TABLES t
+            LEFT JOIN sys.objects o
+                ON o.object_id = OBJECT_ID(QUOTENAME(t.TABLE_SCHEMA) + '.' + QUOTENAME(t.TABLE_NAME))
+            WHERE {schema_filter}
+        """
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to MSSQL."""
         conn = None
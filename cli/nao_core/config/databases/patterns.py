@@ -0,0 +1,53 @@
+"""Include/exclude glob patterns of a database, compiled once for matching many tables."""
+
+import fnmatch
+import re
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+def _compile(patterns: list[str], flags: int) -> re.Pattern[str] | None:
+    """Compile glob patterns into one regex matching any of them, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in dict.fromkeys(patterns)), flags)
+
+
+def _schema_part(pattern: str) -> str:
+    """Return a glob matching every schema that could hold a table matched by a `schema.table` pattern."""
+    if "." in pattern:
+        return pattern.split(".", 1)[0]
+    # Without a dot, a wildcard may also match the dot between schema and table (e.g. 'prod_*')
+    if wildcard := _WILDCARDS.search(pattern):
+        return pattern[: wildcard.start()] + "*"
+    return pattern
+
+
+class TablePatterns:
+    """Matcher for `schema.table` names against include/exclude glob patterns.
+
+    All include patterns are compiled into a single regex, and so are the
+    exclude patterns, so matching a table costs one regex search per list
+    however many patterns there are.
+    """
+
+    def __init__(self, include: list[str], exclude: list[str], ignore_case: bool = False):
+        flags = re.IGNORECASE if ignore_case else 0
+        self._include = _compile(include, flags)
+        self._exclude = _compile(exclude, flags)
+        self._include_schemas = _compile([_schema_part(p) for p in include], flags)
+        # Only patterns excluding every table of a schema (e.g. 'temp_*.*') prune whole schemas
+        self._exclude_schemas = _compile([p[:-2] for p in exclude if p.endswith(".*") and "." not in p[:-2]], flags)
+
+    def matches(self, schema: str, table: str) -> bool:
+        """Check if `schema.table` is included and not excluded."""
+        full_name = f"{schema}.{table}"
+        if self._include is not None and not self._include.match(full_name):
+            return False
+        return self._exclude is None or not self._exclude.match(full_name)
+
+    def matches_schema(self, schema: str) -> bool:
+        """Check if any table of `schema` could match, so that excluded schemas need not be listed."""
+        if self._include_schemas is not None and not self._include_schemas.match(schema):
+            return False
+        return self._exclude_schemas is None or not self._exclude_schemas.match(schema)
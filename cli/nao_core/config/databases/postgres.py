@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Literal
 
 import ibis
@@ -8,13 +9,18 @@ from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_text
 
 from .base import DatabaseConfig
-from .context import DatabaseContext
+from .context import DatabaseContext, SchemaMetadata, memoize
+
+logger = logging.getLogger(__name__)
 
 
 class PostgresDatabaseContext(DatabaseContext):
     """Postgres context with pg_catalog description discovery."""
 
+    @memoize
     def description(self) -> str | None:
+        if (descriptions := self._prefetched("descriptions")) is not None:
+            return descriptions.get(self._table_name)
         try:
             query = f"""
                 SELECT d.description
@@ -30,6 +36,7 @@ class PostgresDatabaseContext(DatabaseContext):
             pass
         return None
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         cols = super().columns()
         try:
@@ -42,6 +49,8 @@ class PostgresDatabaseContext(DatabaseContext):
         return cols
 
     def _fetch_column_descriptions(self) -> dict[str, str]:
+        if (col_descs := self._prefetched("column_descriptions")) is not None:
+            return col_descs.get(self._table_name, {})
         query = f"""
             SELECT a.attname, d.description
             FROM pg_catalog.pg_description d
@@ -54,6 +63,63 @@ class PostgresDatabaseContext(DatabaseContext):
         return {row[0]: str(row[1]) for row in rows if row[1]}
 
 
+def _fetch_pg_descriptions(conn: BaseBackend, schema: str) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
+    """Fetch the table and column comments of every table in `schema` with a single pg_catalog query."""
+    query = f"""
+        SELECT c.relname, d.objsubid, a.attname, d.description
+        FROM pg_catalog.pg_description d
+        JOIN pg_catalog.pg_class c ON c.oid = d.objoid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum = d.objsubid
+        WHERE n.nspname = '{schema}'
+    """
+    descriptions: dict[str, str] = {}
+    column_descriptions: dict[str, dict[str, str]] = {}
+    for table, objsubid, column, description in conn.raw_sql(query).fetchall():  # type: ignore[union-attr]
+        if not description:
+            continue
+        if objsubid == 0:
+            if text := str(description).strip():
+                descriptions[table] = text
+        elif column:
+            column_descriptions.setdefault(table, {})[column] = str(description)
+    return descriptions, column_descriptions
+
+
+def _fetch_pg_table_stats(conn: BaseBackend, schema: str) -> tuple[dict[str, str], dict[str, int]]:
+    """Return the fingerprint and estimated row count of every table in `schema`.
+
+    Fingerprints combine the row estimate, write counters and column definitions.
+    Views have no statistics of their own, so they are left out and always re-rendered.
+    """
+    query = f"""
+        SELECT
+            c.relname,
+            c.reltuples,
+            s.n_tup_ins,
+            s.n_tup_upd,
+            s.n_tup_del,
+            md5(string_agg(
+                a.attname || ' ' || format_type(a.atttypid, a.atttypmod) || CASE WHEN a.attnotnull THEN '!' ELSE '' END,
+                ',' ORDER BY a.attnum
+            ))
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        LEFT JOIN pg_catalog.pg_stat_all_tables s ON s.relid = c.oid
+        WHERE n.nspname = '{schema}' AND c.relkind IN ('r', 'm')
+        GROUP BY c.relname, c.reltuples, s.n_tup_ins, s.n_tup_upd, s.n_tup_del
+    """
+    fingerprints: dict[str, str] = {}
+    row_counts: dict[str, int] = {}
+    for row in conn.raw_sql(query).fetchall():  # type: ignore[union-attr]
+        fingerprints[row[0]] = "|".join(str(value) for value in row[1:])
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        if row[1] is not None and row[1] >= 0:
+            row_counts[row[0]] = int(row[1])
+    return fingerprints, row_counts
+
+
 class PostgresConfig(DatabaseConfig):
     """PostgreSQL-specific configuration."""
 
@@ -104,15 +170,22 @@ class PostgresConfig(DatabaseConfig):
         if self.schema_name:
             kwargs["schema"] = self.schema_name
 
+        if self.query_timeout_s:
+            kwargs["options"] = f"-c statement_timeout={int(self.query_timeout_s * 1000)}"
+
         return ibis.postgres.connect(
             **kwargs,
         )
 
+    def cancel(self, conn: BaseBackend) -> bool:
+        conn.con.cancel()  # type: ignore[attr-defined]
+        return True
+
     def get_database_name(self) -> str:
         """Get the database name for Postgres."""
         return self.database
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
         list_databases = getattr(conn, "list_databases", None)
@@ -122,8 +195,37 @@ class PostgresConfig(DatabaseConfig):
             return [s for s in schemas if s not in ("pg_catalog", "information_schema") and not s.startswith("pg_")]
         return []
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> PostgresDatabaseContext:
-        return PostgresDatabaseContext(conn, schema, table_name)
+    def catalog_query(self) -> str:
+        schema_filter = (
+            f"table_schema = '{self.schema_name}'"
+            if self.schema_name
+            else "table_schema NOT IN ('pg_catalog', 'information_schema') AND table_schema NOT LIKE 'pg\\_%'"
+        )
+        # Postgres doesn't record when a table was last altered
+        return f"""
+            SELECT table_schema, table_name, table_type, NULL
+            FROM information_schema.tables
+            WHERE {schema_filter} AND table_type <> 'LOCAL TEMPORARY'
+        """
+
+    def fetch_schema_metadata(self, conn: BaseBackend, schema: str) -> SchemaMetadata:
+        descriptions, column_descriptions = _fetch_pg_descriptions(conn, schema)
+        try:
+            fingerprints, row_counts = _fetch_pg_table_stats(conn, schema)
+        except Exception:
+            logger.debug("Failed to fetch table statistics for %s", schema)
+            fingerprints, row_counts = None, None
+        return SchemaMetadata(
+            descriptions=descriptions,
+            column_descriptions=column_descriptions,
+            row_counts=row_counts,
+            fingerprints=fingerprints,
+        )
+
+    def create_context(
+        self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None
+    ) -> PostgresDatabaseContext:
+        return PostgresDatabaseContext(conn, schema, table_name, metadata, **self.context_options())
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to PostgreSQL."""
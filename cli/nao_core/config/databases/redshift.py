@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 from typing import Any, Literal
 
@@ -10,30 +11,37 @@ from nao_core.config.exceptions import InitError
 from nao_core.ui import ask_confirm, ask_text
 
 from .base import DatabaseConfig
-from .context import DatabaseContext
+from .context import DatabaseContext, SchemaMetadata, memoize
+from .postgres import _fetch_pg_descriptions
+
+logger = logging.getLogger(__name__)
 
 
 class RedshiftDatabaseContext(DatabaseContext):
     """Redshift-specific context that bypasses Ibis's problematic pg_enum queries."""
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         """Return column metadata by querying information_schema directly."""
         col_descs = self._fetch_column_descriptions()
 
-        query = f"""
-            SELECT 
-                column_name,
-                data_type,
-                is_nullable,
-                character_maximum_length,
-                numeric_precision,
-                numeric_scale
-            FROM information_schema.columns
-            WHERE table_schema = '{self._schema}'
-              AND table_name = '{self._table_name}'
-            ORDER BY ordinal_position
-        """
-        result = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
+        if (prefetched := self._prefetched("columns")) is not None:
+            result = prefetched.get(self._table_name, [])
+        else:
+            query = f"""
+                SELECT 
+                    column_name,
+                    data_type,
+                    is_nullable,
+                    character_maximum_length,
+                    numeric_precision,
+                    numeric_scale
+                FROM information_schema.columns
+                WHERE table_schema = '{self._schema}'
+                  AND table_name = '{self._table_name}'
+                ORDER BY ordinal_position
+            """
+            result = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
 
         columns = []
         for row in result:
@@ -89,11 +97,15 @@ class RedshiftDatabaseContext(DatabaseContext):
             return f"{ibis_type} NOT NULL"
         return ibis_type
 
+    @memoize
     def preview(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Return the first N rows as a list of dictionaries."""
+        """Return the first N rows as a list of dictionaries.
+
+        Redshift has neither TABLESAMPLE nor partitions: every preview strategy reads the first rows.
+        """
         # Use raw SQL to avoid Ibis's pg_enum queries
         query = f'SELECT * FROM "{self._schema}"."{self._table_name}" LIMIT {limit}'
-        result = self._conn.raw_sql(query).fetchall()  # type: ignore[union-attr]
+        result = self._with_preview_timeout(lambda: self._conn.raw_sql(query).fetchall())  # type: ignore[union-attr]
 
         # Get column names from the columns metadata
         columns = self.columns()
@@ -111,8 +123,9 @@ class RedshiftDatabaseContext(DatabaseContext):
             rows.append(row_dict)
         return rows
 
-    def row_count(self) -> int:
-        """Return the total number of rows in the table."""
+    @memoize
+    def count_rows(self) -> int:
+        """Return the exact number of rows in the table."""
         # Use raw SQL to avoid Ibis's pg_enum queries
         query = f'SELECT COUNT(*) FROM "{self._schema}"."{self._table_name}"'
         result = self._conn.raw_sql(query).fetchone()  # type: ignore[union-attr]
@@ -124,6 +137,8 @@ class RedshiftDatabaseContext(DatabaseContext):
 
     def _fetch_column_descriptions(self) -> dict[str, str]:
         """Fetch column descriptions from pg_catalog."""
+        if (col_descs := self._prefetched("column_descriptions")) is not None:
+            return col_descs.get(self._table_name, {})
         try:
             query = f"""
                 SELECT a.attname, d.description
@@ -138,8 +153,11 @@ class RedshiftDatabaseContext(DatabaseContext):
         except Exception:
             return {}
 
+    @memoize
     def description(self) -> str | None:
         """Return the table description from pg_catalog."""
+        if (descriptions := self._prefetched("descriptions")) is not None:
+            return descriptions.get(self._table_name)
         try:
             query = f"""
                 SELECT d.description
@@ -229,6 +247,14 @@ class RedshiftConfig(DatabaseConfig):
             ssh_tunnel=ssh_tunnel,
         )
 
+    def resolve_relative_paths(self, project_path: Path) -> "RedshiftConfig":
+        if not self.ssh_tunnel:
+            return self
+        ssh_tunnel = self.ssh_tunnel.model_copy(
+            update={"ssh_private_key_path": self._anchor_path(self.ssh_tunnel.ssh_private_key_path, project_path)}
+        )
+        return self.model_copy(update={"ssh_tunnel": ssh_tunnel})
+
     def connect(self) -> BaseBackend:
         """Create an Ibis Redshift connection."""
 
@@ -267,15 +293,25 @@ class RedshiftConfig(DatabaseConfig):
         if self.schema_name:
             kwargs["schema"] = self.schema_name
 
-        return ibis.postgres.connect(
+        conn = ibis.postgres.connect(
             **kwargs,
         )
 
+        if self.query_timeout_s:
+            # Redshift rejects libpq startup options, set the timeout on the session instead
+            conn.raw_sql(f"SET statement_timeout TO {int(self.query_timeout_s * 1000)}").close()
+
+        return conn
+
+    def cancel(self, conn: BaseBackend) -> bool:
+        conn.con.cancel()  # type: ignore[attr-defined]
+        return True
+
     def get_database_name(self) -> str:
         """Get the database name for Redshift."""
         return self.database
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         """Get all schemas in the current database."""
         if self.schema_name:
             return [self.schema_name]
@@ -296,9 +332,67 @@ class RedshiftConfig(DatabaseConfig):
             list_databases = getattr(conn, "list_databases", None)
             return list_databases() if list_databases else ["public"]
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> RedshiftDatabaseContext:
+    def catalog_query(self) -> str:
+        schema_filter = (
+            f"table_schema = '{self.schema_name}'"
+            if self.schema_name
+            else "table_schema NOT LIKE 'pg_%' AND table_schema <> 'information_schema'"
+        )
+        return f"""
+            SELECT table_schema, table_name, table_type, NULL
+            FROM information_schema.tables
+            WHERE {schema_filter}
+        """
+
+    def fetch_schema_metadata(self, conn: BaseBackend, schema: str) -> SchemaMetadata:
+        """Fetch the comments and columns of every table in the schema, instead of querying them per table."""
+        descriptions, column_descriptions = _fetch_pg_descriptions(conn, schema)
+
+        query = f"""
+            SELECT
+                table_name,
+                column_name,
+                data_type,
+                is_nullable,
+                character_maximum_length,
+                numeric_precision,
+                numeric_scale
+            FROM information_schema.columns
+            WHERE table_schema = '{schema}'
+            ORDER BY table_name, ordinal_position
+        """
+        columns: dict[str, list[tuple]] = {}
+        for row in conn.raw_sql(query).fetchall():  # type: ignore[union-attr]
+            columns.setdefault(row[0], []).append(tuple(row[1:]))
+
+        # svv_table_info only lists tables (not views), with their row count and size estimates
+        stats_query = f"""
+            SELECT "table", tbl_rows, estimated_visible_rows, size
+            FROM svv_table_info
+            WHERE "schema" = '{schema}'
+        """
+        try:
+            rows = conn.raw_sql(stats_query).fetchall()  # type: ignore[union-attr]
+            fingerprints = {row[0]: "|".join(str(value) for value in row[1:]) for row in rows}
+            # tbl_rows includes rows marked for deletion but not yet vacuumed
+            row_counts = {row[0]: int(row[2]) for row in rows if row[2] is not None}
+        except Exception:
+            logger.debug("Failed to fetch table statistics for %s", schema)
+            fingerprints, row_counts = None, None
+
+        return SchemaMetadata(
+            descriptions=descriptions,
+            column_descriptions=column_descriptions,
+            columns=columns,
+            row_counts=row_counts,
+            fingerprints=fingerprints,
+        )
+
+    def create_context(
+        self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None
+    ) -> RedshiftDatabaseContext:
         """Create a Redshift-specific database context that avoids pg_enum queries."""
-        return RedshiftDatabaseContext(conn, schema, table_name)
+        return RedshiftDatabaseContext(conn, schema, table_name, metadata, **self.context_options())
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Redshift."""
@@ -1,7 +1,8 @@
 import logging
 import os
 import re
-from typing import Any, Literal
+from pathlib import Path
+from typing import Any, ClassVar, Literal
 
 import ibis
 from cryptography.hazmat.backends import default_backend
@@ -13,7 +14,7 @@ from nao_core.config.exceptions import InitError
 from nao_core.ui import UI, ask_confirm, ask_text
 
 from .base import DatabaseConfig
-from .context import DatabaseContext
+from .context import DatabaseContext, SchemaMetadata, memoize
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +22,20 @@ logger = logging.getLogger(__name__)
 class SnowflakeDatabaseContext(DatabaseContext):
     """Snowflake context with clustering key and description discovery."""
 
+    @memoize
     def partition_columns(self) -> list[str]:
+        if (clustering := self._prefetched("partition_columns")) is not None:
+            return clustering.get(self._table_name, [])
         try:
             return _get_snowflake_clustering_columns(self._conn, self._schema, self._table_name)
         except Exception:
             logger.debug("Failed to fetch clustering keys for %s.%s", self._schema, self._table_name)
             return []
 
+    @memoize
     def description(self) -> str | None:
+        if (descriptions := self._prefetched("descriptions")) is not None:
+            return descriptions.get(self._table_name)
         try:
             query = f"""
                 SELECT COMMENT FROM INFORMATION_SCHEMA.TABLES
@@ -41,6 +48,7 @@ class SnowflakeDatabaseContext(DatabaseContext):
             pass
         return None
 
+    @memoize
     def columns(self) -> list[dict[str, Any]]:
         cols = super().columns()
         try:
@@ -53,6 +61,8 @@ class SnowflakeDatabaseContext(DatabaseContext):
         return cols
 
     def _fetch_column_descriptions(self) -> dict[str, str]:
+        if (col_descs := self._prefetched("column_descriptions")) is not None:
+            return col_descs.get(self._table_name, {})
         query = f"""
             SELECT COLUMN_NAME, COMMENT FROM INFORMATION_SCHEMA.COLUMNS
             WHERE TABLE_SCHEMA = '{self._schema}' AND TABLE_NAME = '{self._table_name}'
@@ -74,6 +84,47 @@ def _get_snowflake_clustering_columns(conn: BaseBackend, schema: str, table: str
     return _parse_clustering_key(result[0])
 
 
+def _fetch_snowflake_schema_metadata(conn: BaseBackend, schema: str) -> SchemaMetadata:
+    """Fetch comments, clustering keys and statistics of every table in `schema` from INFORMATION_SCHEMA."""
+    tables_query = f"""
+        SELECT TABLE_NAME, COMMENT, CLUSTERING_KEY, TABLE_TYPE, LAST_ALTERED, ROW_COUNT, BYTES
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = '{schema}'
+    """
+    columns_query = f"""
+        SELECT TABLE_NAME, COLUMN_NAME, COMMENT FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = '{schema}' AND COMMENT IS NOT NULL AND COMMENT != ''
+    """
+    descriptions: dict[str, str] = {}
+    clustering: dict[str, list[str]] = {}
+    fingerprints: dict[str, str] = {}
+    row_counts: dict[str, int] = {}
+    rows = conn.raw_sql(tables_query).fetchall()  # type: ignore[union-attr]
+    for table, comment, clustering_key, table_type, last_altered, row_count, size in rows:
+        if comment and (text := str(comment).strip()):
+            descriptions[table] = text
+        if clustering_key:
+            clustering[table] = _parse_clustering_key(clustering_key)
+        # LAST_ALTERED changes with both DDL and DML on tables, but only with the definition of views
+        if table_type == "BASE TABLE":
+            fingerprints[table] = f"{last_altered}|{row_count}|{size}"
+        if row_count is not None:
+            row_counts[table] = int(row_count)
+
+    column_descriptions: dict[str, dict[str, str]] = {}
+    for table, column, comment in conn.raw_sql(columns_query).fetchall():  # type: ignore[union-attr]
+        if comment:
+            column_descriptions.setdefault(table, {})[column] = str(comment)
+
+    return SchemaMetadata(
+        descriptions=descriptions,
+        column_descriptions=column_descriptions,
+        partition_columns=clustering,
+        row_counts=row_counts,
+        fingerprints=fingerprints,
+    )
+
+
 def _parse_clustering_key(clustering_key: str) -> list[str]:
     """Parse Snowflake clustering key string like 'LINEAR(col1, col2)' into column names."""
     match = re.search(r"\((.+)\)", clustering_key)
@@ -108,6 +159,9 @@ class SnowflakeConfig(DatabaseConfig):
         description="Authentication method (e.g., 'externalbrowser' for SSO)",
     )
 
+    # Snowflake identifier matching is case-insensitive
+    ignore_case_patterns: ClassVar[bool] = True
+
     @classmethod
     def promptConfig(cls) -> "SnowflakeConfig":
         """Interactively prompt the user for Snowflake configuration."""
@@ -148,6 +202,11 @@ class SnowflakeConfig(DatabaseConfig):
             authenticator=authenticator,
         )
 
+    def resolve_relative_paths(self, project_path: Path) -> "SnowflakeConfig":
+        if not self.private_key_path:
+            return self
+        return self.model_copy(update={"private_key_path": self._anchor_path(self.private_key_path, project_path)})
+
     def connect(self) -> BaseBackend:
         """Create an Ibis Snowflake connection."""
         kwargs: dict = {"user": self.username}
@@ -182,64 +241,46 @@ class SnowflakeConfig(DatabaseConfig):
         elif self.password:
             kwargs["password"] = self.password
 
+        if self.query_timeout_s:
+            kwargs["session_parameters"] = {"STATEMENT_TIMEOUT_IN_SECONDS": max(int(self.query_timeout_s), 1)}
+
         return ibis.snowflake.connect(**kwargs, create_object_udfs=False)
 
+    def cancel(self, conn: BaseBackend) -> bool:
+        session_id = conn.con.session_id  # type: ignore[attr-defined]
+        conn.con.cursor().execute(f"SELECT SYSTEM$CANCEL_ALL_QUERIES({session_id})")  # type: ignore[attr-defined]
+        return True
+
     def get_database_name(self) -> str:
         """Get the database name for Snowflake."""
         return self.database
 
-    def matches_pattern(self, schema: str, table: str) -> bool:
-        """Check if a schema.table matches the include/exclude patterns.
-
-        Snowflake identifier matching is case-insensitive.
-        """
-        from fnmatch import fnmatch
-
-        full_name = f"{schema}.{table}"
-        full_name_lower = full_name.lower()
-
-        # If include patterns exist, table must match at least one
-        if self.include:
-            included = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.include)
-            if not included:
-                return False
-
-        # If exclude patterns exist, table must not match any
-        if self.exclude:
-            excluded = any(fnmatch(full_name_lower, pattern.lower()) for pattern in self.exclude)
-            if excluded:
-                return False
-
-        return True
-
-    def _schema_matches(self, schema: str) -> bool:
-        """Check if a schema could have any matching tables based on include/exclude patterns."""
-        from fnmatch import fnmatch
-
-        schema_lower = schema.lower()
-
-        if self.include:
-            included = any(fnmatch(schema_lower, p.split(".")[0].lower()) for p in self.include)
-            if not included:
-                return False
-
-        if self.exclude:
-            excluded = any(fnmatch(schema_lower, p.split(".")[0].lower()) for p in self.exclude if p.endswith(".*"))
-            if excluded:
-                return False
-
-        return True
-
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name.upper()]
         list_databases = getattr(conn, "list_databases", None)
         schemas = list_databases() if list_databases else []
-        schemas = [s for s in schemas if s != "INFORMATION_SCHEMA"]
-        return [s for s in schemas if self._schema_matches(s)]
+        return [s for s in schemas if s != "INFORMATION_SCHEMA"]
+
+    def catalog_query(self) -> str:
+        schema_filter = (
+            f"TABLE_SCHEMA = '{self.schema_name.upper()}'"
+            if self.schema_name
+            else "TABLE_SCHEMA <> 'INFORMATION_SCHEMA'"
+        )
+        return f"""
+            SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE, LAST_ALTERED
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE {schema_filter}
+        """
+
+    def fetch_schema_metadata(self, conn: BaseBackend, schema: str) -> SchemaMetadata:
+        return _fetch_snowflake_schema_metadata(conn, schema)
 
-    def create_context(self, conn: BaseBackend, schema: str, table_name: str) -> SnowflakeDatabaseContext:
-        return SnowflakeDatabaseContext(conn, schema, table_name)
+    def create_context(
+        self, conn: BaseBackend, schema: str, table_name: str, metadata: SchemaMetadata | None = None
+    ) -> SnowflakeDatabaseContext:
+        return SnowflakeDatabaseContext(conn, schema, table_name, metadata, **self.context_options())
 
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Snowflake."""
@@ -75,13 +75,16 @@ class TrinoConfig(DatabaseConfig):
         if self.password:
             kwargs["password"] = self.password
 
+        if self.query_timeout_s:
+            kwargs["session_properties"] = {"query_max_run_time": f"{max(int(self.query_timeout_s), 1)}s"}
+
         return ibis.trino.connect(**kwargs)
 
     def get_database_name(self) -> str:
         """Get the database name for Trino."""
         return self.catalog
 
-    def get_schemas(self, conn: BaseBackend) -> list[str]:
+    def list_schemas(self, conn: BaseBackend) -> list[str]:
         if self.schema_name:
             return [self.schema_name]
 
@@ -106,6 +109,19 @@ class TrinoConfig(DatabaseConfig):
 
         return []
 
+    def catalog_query(self) -> str:
+        escaped_catalog = self.catalog.replace('"', '""')
+        if self.schema_name:
+            schema_filter = f"table_schema = '{self.schema_name}'"
+        else:
+            excluded = ", ".join(f"'{s}'" for s in sorted(EXCLUDED_SCHEMAS))
+            schema_filter = f"lower(table_schema) NOT IN ({excluded}) AND NOT starts_with(lower(table_schema), 'pg_')"
+        return f"""
+            SELECT table_schema, table_name, table_type, NULL
+            FROM "{escaped_catalog}".information_schema.tables
+            WHERE {schema_filter}
+        """
+
     def check_connection(self) -> tuple[bool, str]:
         """Test connectivity to Trino."""
         try:
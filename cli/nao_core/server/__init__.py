@@ -0,0 +1,53 @@
+"""Runtime helpers for the FastAPI SQL service.
+
+These utilities keep state across `/execute_sql` requests (parsed configs, warm
+database connections, open result cursors, cached results, metrics, etc.) so
+that agent tool calls don't pay config parsing or the connection handshake on
+every query.
+"""
+
+from .cancellation import QueryCancelledError, QueryHandle, QueryTimeoutError
+from .config_cache import ConfigCache
+from .cursors import CursorNotFoundError, CursorRegistry
+from .executor import QueryExecutor
+from .metrics import METRICS_CONTENT_TYPE, MetricsRegistry
+from .pool import ConnectionPool
+from .result_cache import CachedResponse, ResultCache
+from .serialization import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE,
+    convert_value,
+    dataframe_to_columns,
+    dataframe_to_ndjson,
+    dataframe_to_records,
+    negotiate_media_type,
+    table_to_bytes,
+)
+from .streaming import StreamClosedError, iterate_in_worker
+
+__all__ = [
+    "ARROW_STREAM_MEDIA_TYPE",
+    "METRICS_CONTENT_TYPE",
+    "NDJSON_MEDIA_TYPE",
+    "PARQUET_MEDIA_TYPE",
+    "CachedResponse",
+    "ConfigCache",
+    "ConnectionPool",
+    "CursorNotFoundError",
+    "CursorRegistry",
+    "MetricsRegistry",
+    "QueryCancelledError",
+    "QueryExecutor",
+    "QueryHandle",
+    "QueryTimeoutError",
+    "ResultCache",
+    "StreamClosedError",
+    "convert_value",
+    "dataframe_to_columns",
+    "dataframe_to_ndjson",
+    "dataframe_to_records",
+    "iterate_in_worker",
+    "negotiate_media_type",
+    "table_to_bytes",
+]
@@ -0,0 +1,97 @@
+"""Cancellation of queries running in worker threads."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from ibis import BaseBackend
+
+if TYPE_CHECKING:
+    from nao_core.config.databases.base import DatabaseConfig
+
+
+class QueryCancelledError(Exception):
+    """The query was cancelled before completing (timeout or client disconnect)."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Query cancelled: {reason}")
+        self.reason = reason
+
+
+class QueryTimeoutError(QueryCancelledError):
+    """The query ran longer than the database's `query_timeout_s`."""
+
+    def __init__(self, timeout_s: float):
+        super().__init__(f"exceeded the {timeout_s:g}s query timeout")
+        self.timeout_s = timeout_s
+
+
+class QueryHandle:
+    """Lets the event loop cancel a query running in a worker thread.
+
+    The worker wraps the database calls in `running()`, which registers the
+    connection in use. `cancel()` then asks the database to interrupt the
+    query (see `DatabaseConfig.cancel`), or prevents it from starting if the
+    worker has not reached it yet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._target: tuple[DatabaseConfig, BaseBackend] | None = None
+        self._error: QueryCancelledError | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._error is not None
+
+    def cancel(self, reason: str) -> bool:
+        """Cancel the query. Returns False if the backend could not interrupt it."""
+        return self._cancel(QueryCancelledError(reason))
+
+    @contextmanager
+    def running(self, db_config: DatabaseConfig, conn: BaseBackend) -> Iterator[None]:
+        """Mark `conn` as running this handle's query for the duration of the block.
+
+        Enforces `db_config.query_timeout_s` by cancelling the query when it
+        expires, for backends without a native statement timeout. Errors
+        raised by an interrupted driver are replaced by the cancellation cause.
+        """
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            self._target = (db_config, conn)
+
+        timer = None
+        if db_config.query_timeout_s:
+            timer = threading.Timer(
+                db_config.query_timeout_s, self._cancel, [QueryTimeoutError(db_config.query_timeout_s)]
+            )
+            timer.daemon = True
+            timer.start()
+        try:
+            yield
+        except Exception as e:
+            if self._error is not None and e is not self._error:
+                raise self._error from e
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._target = None
+
+    def _cancel(self, error: QueryCancelledError) -> bool:
+        with self._lock:
+            if self._error is None:
+                self._error = error
+            target = self._target
+        if target is None:
+            return True
+        db_config, conn = target
+        try:
+            return db_config.cancel(conn)
+        except Exception:
+            return False
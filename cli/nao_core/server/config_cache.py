@@ -0,0 +1,69 @@
+"""In-process cache of parsed nao configs for the SQL service."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from nao_core.config import NaoConfig, NaoConfigError
+
+
+@dataclass(frozen=True)
+class _CachedConfig:
+    config: NaoConfig
+    mtime_ns: int
+    size: int
+
+
+class ConfigCache:
+    """Cache of validated NaoConfig objects keyed by project folder.
+
+    Loading a config re-reads nao_config.yaml, substitutes env vars and runs
+    pydantic validation for every database. Steady-state requests only pay a
+    `stat()` of the file: an entry is reused as long as the file's mtime and
+    size are unchanged, and dropped on `invalidate()` (e.g. `/api/refresh`).
+
+    Configs are loaded without changing the process working directory;
+    relative file paths are anchored at the project folder instead.
+    """
+
+    def __init__(self):
+        self._entries: dict[Path, _CachedConfig] = {}
+        self._lock = threading.Lock()
+
+    def get(self, project_path: Path) -> NaoConfig:
+        """Return the config for a project folder, loading it if needed.
+
+        Raises:
+            NaoConfigError: If nao_config.yaml is missing or invalid.
+        """
+        project_path = project_path.resolve()
+        config_file = project_path / "nao_config.yaml"
+
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            self.invalidate(project_path)
+            raise NaoConfigError(f"No nao_config.yaml found in {project_path}")
+
+        with self._lock:
+            cached = self._entries.get(project_path)
+        if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached.config
+
+        config = NaoConfig.try_load(project_path, raise_on_error=True, chdir=False)
+        assert config is not None
+        config = config.resolve_relative_paths(project_path)
+
+        with self._lock:
+            self._entries[project_path] = _CachedConfig(config=config, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        return config
+
+    def invalidate(self, project_path: Path | None = None) -> None:
+        """Drop the cached config of one project folder, or of all of them."""
+        with self._lock:
+            if project_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(project_path.resolve(), None)
@@ -0,0 +1,175 @@
+"""Server-side result cursors for paginated SQL results."""
+
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+
+from nao_core.config.databases.base import ResultCursor
+
+from .pool import ConnectionPool, PooledConnection, PoolKey
+
+
+class CursorNotFoundError(KeyError):
+    """The cursor does not exist, has expired, or is already being read."""
+
+
+@dataclass
+class OpenCursor:
+    """A partially read result, with the pooled connection it is read from."""
+
+    cursor_id: str
+    cursor: ResultCursor
+    lease: PooledConnection
+    page_size: int
+    expires_at: float = 0.0
+    in_use: bool = False
+
+    @property
+    def key(self) -> PoolKey:
+        return self.lease.key
+
+
+class CursorRegistry:
+    """Result cursors kept open between `/execute_sql` requests.
+
+    An open cursor holds its pooled connection until it is exhausted, closed
+    by the client, or left unread for `ttl_s`. At most `max_open` cursors are
+    kept overall, and fewer per database than the pool has connections for
+    it; opening one more closes the least recently used idle cursor. Unless
+    the pool holds a single connection per database, abandoned paginations
+    therefore always leave a connection free for other queries.
+    """
+
+    def __init__(self, pool: ConnectionPool, ttl_s: float = 120.0, max_open: int = 16):
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1")
+        self.pool = pool
+        self.ttl_s = ttl_s
+        self.max_open = max_open
+        self.max_open_per_key = max(pool.max_size - 1, 1)
+
+        self._cursors: dict[str, OpenCursor] = {}
+        self._lock = threading.Lock()
+
+    def register(self, cursor: ResultCursor, lease: PooledConnection, page_size: int) -> str:
+        """Keep a cursor open for later pages. Returns its opaque id."""
+        entry = OpenCursor(
+            cursor_id=secrets.token_urlsafe(16),
+            cursor=cursor,
+            lease=lease,
+            page_size=page_size,
+            expires_at=time.monotonic() + self.ttl_s,
+        )
+        evicted: list[OpenCursor] = []
+        with self._lock:
+            idle = sorted((c for c in self._cursors.values() if not c.in_use), key=lambda c: c.expires_at)
+            # Cursors of the same database first: they hold connections of the same pool
+            same_key = [c for c in idle if c.key == entry.key]
+            open_for_key = sum(1 for c in self._cursors.values() if c.key == entry.key)
+            while open_for_key >= self.max_open_per_key and same_key:
+                stale = same_key.pop(0)
+                idle.remove(stale)
+                evicted.append(self._cursors.pop(stale.cursor_id))
+                open_for_key -= 1
+            while len(self._cursors) >= self.max_open and idle:
+                evicted.append(self._cursors.pop(idle.pop(0).cursor_id))
+            self._cursors[entry.cursor_id] = entry
+        for stale in evicted:
+            self._dispose(stale)
+        return entry.cursor_id
+
+    def key(self, cursor_id: str) -> PoolKey:
+        """Return the (project folder, database name) a cursor reads from.
+
+        Raises:
+            CursorNotFoundError: If the cursor does not exist or has expired.
+        """
+        with self._lock:
+            entry = self._cursors.get(cursor_id)
+            if entry is None:
+                raise CursorNotFoundError(cursor_id)
+            return entry.key
+
+    def checkout(self, cursor_id: str) -> OpenCursor:
+        """Take exclusive use of a cursor to read its next page.
+
+        Raises:
+            CursorNotFoundError: If the cursor does not exist, has expired or is already being read.
+        """
+        with self._lock:
+            entry = self._cursors.get(cursor_id)
+            if entry is None or entry.in_use or entry.expires_at <= time.monotonic():
+                raise CursorNotFoundError(cursor_id)
+            entry.in_use = True
+            return entry
+
+    def checkin(self, entry: OpenCursor) -> None:
+        """Hand a cursor back after reading a page, restarting its TTL."""
+        with self._lock:
+            entry.in_use = False
+            entry.expires_at = time.monotonic() + self.ttl_s
+            closed = self._cursors.get(entry.cursor_id) is not entry
+        if closed:
+            # Closed by the client while the page was being read
+            self._dispose(entry)
+
+    def finish(self, entry: OpenCursor, failed: bool = False) -> None:
+        """Drop a checked-out cursor once exhausted (or broken) and return its connection to the pool."""
+        with self._lock:
+            if self._cursors.get(entry.cursor_id) is entry:
+                del self._cursors[entry.cursor_id]
+        self._dispose(entry, failed=failed)
+
+    def close(self, cursor_id: str) -> bool:
+        """Close a cursor at the client's request, discarding its unread rows.
+
+        Returns:
+            False if no such cursor was open.
+        """
+        with self._lock:
+            entry = self._cursors.pop(cursor_id, None)
+            if entry is None:
+                return False
+            if entry.in_use:
+                # A page is being read: `checkin()` will dispose of it
+                return True
+        self._dispose(entry)
+        return True
+
+    def evict_expired(self) -> int:
+        """Close cursors left unread for longer than the TTL.
+
+        Returns:
+            Number of cursors closed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [c for c in self._cursors.values() if not c.in_use and c.expires_at <= now]
+            for entry in expired:
+                del self._cursors[entry.cursor_id]
+        for entry in expired:
+            self._dispose(entry)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close every cursor. Called on application shutdown."""
+        with self._lock:
+            # Cursors being read are disposed of by `checkin()`
+            entries = [c for c in self._cursors.values() if not c.in_use]
+            self._cursors.clear()
+        for entry in entries:
+            self._dispose(entry)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cursors)
+
+    def _dispose(self, entry: OpenCursor, failed: bool = False) -> None:
+        try:
+            entry.cursor.close()
+        except Exception:
+            failed = True
+        self.pool.release(entry.lease, failed=failed)
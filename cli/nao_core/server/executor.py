@@ -0,0 +1,118 @@
+"""Bounded worker pool running blocking SQL work off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import threading
+from collections.abc import AsyncIterator, Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class QueryExecutor:
+    """Run blocking database calls on a bounded thread pool.
+
+    Database drivers are synchronous: calling them from an `async def`
+    endpoint stalls every other request (including `/health`) until the query
+    returns. This executor moves the work to at most `max_workers` threads and
+    additionally caps how many calls may run at once for the same key
+    (typically a database), so a burst against one slow warehouse cannot take
+    every worker. Callers over the per-key limit wait on the event loop, not in
+    a worker thread. A key's limit is dropped once no call uses it, so keys
+    that come and go (projects, databases) don't accumulate.
+    """
+
+    def __init__(self, max_workers: int = 8, per_key_limit: int = 4):
+        if max_workers < 1 or per_key_limit < 1:
+            raise ValueError("max_workers and per_key_limit must be at least 1")
+        self.max_workers = max_workers
+        self.per_key_limit = per_key_limit
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nao-sql")
+        self._limits: dict[Hashable, _KeyLimit] = {}
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    async def run(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `fn(*args, **kwargs)` in a worker thread, at most `per_key_limit` at a time per key."""
+        loop = asyncio.get_running_loop()
+        ticket = _Ticket()
+        call = functools.partial(self._call, ticket, fn, *args, **kwargs)
+
+        with self._lock:
+            self._queued += 1
+        try:
+            async with self._limit(key):
+                return await loop.run_in_executor(self._pool, call)
+        finally:
+            # The caller gave up (or failed) before a worker picked the call up
+            with self._lock:
+                if not ticket.started:
+                    ticket.abandoned = True
+                    self._queued -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls submitted but not yet running in a worker."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Number of calls currently executing in a worker."""
+        return self._running
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop calls that have not reached a worker yet."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, ticket: _Ticket, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            ticket.started = True
+            if not ticket.abandoned:
+                self._queued -= 1
+            self._running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    @contextlib.asynccontextmanager
+    async def _limit(self, key: Hashable) -> AsyncIterator[None]:
+        # Only touched from the event loop: no lock needed
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = self._limits[key] = _KeyLimit(asyncio.Semaphore(self.per_key_limit))
+        limit.users += 1
+        try:
+            async with limit.semaphore:
+                yield
+        finally:
+            limit.users -= 1
+            if not limit.users:
+                del self._limits[key]
+
+
+class _KeyLimit:
+    """Semaphore of a key, with the number of calls holding or waiting for it."""
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self, semaphore: asyncio.Semaphore):
+        self.semaphore = semaphore
+        self.users = 0
+
+
+class _Ticket:
+    """Tracks whether a submitted call reached a worker, to keep the queue depth exact."""
+
+    __slots__ = ("abandoned", "started")
+
+    def __init__(self):
+        self.started = False
+        self.abandoned = False
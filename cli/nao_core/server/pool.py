@@ -0,0 +1,249 @@
+"""Long-lived Ibis connection pool for the SQL service."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ibis import BaseBackend
+
+if TYPE_CHECKING:
+    from nao_core.config.databases.base import DatabaseConfig
+
+PoolKey = tuple[str, str]
+"""(project folder, database name)"""
+
+
+@dataclass
+class PooledConnection:
+    """An Ibis backend owned by the pool."""
+
+    conn: BaseBackend
+    key: PoolKey
+    db_config: DatabaseConfig
+    fingerprint: str
+    generation: int
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _KeyPool:
+    """Connections for a single (project folder, database name) pair."""
+
+    fingerprint: str
+    idle: list[PooledConnection] = field(default_factory=list)
+    in_use: int = 0
+
+
+class ConnectionPool:
+    """Thread-safe pool of warm Ibis connections.
+
+    Connections are keyed by (project folder, database name). A checkout is
+    exclusive: a connection is never shared by two queries at the same time,
+    since most DB-API drivers are not safe for concurrent use.
+
+    - At most `max_size` connections exist per key; extra callers wait up to
+      `acquire_timeout_s` for one to be released.
+    - Idle connections are closed once unused for `idle_timeout_s`, or as soon
+      as they are released for databases that must not keep them open (DuckDB).
+    - Connections idle for longer than `health_check_interval_s` are pinged
+      before reuse, and replaced if the ping fails.
+    - Editing a database entry in nao_config.yaml changes its fingerprint, which
+      retires every connection opened with the previous settings.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4,
+        idle_timeout_s: float = 300.0,
+        health_check_interval_s: float = 30.0,
+        acquire_timeout_s: float = 30.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_timeout_s = idle_timeout_s
+        self.health_check_interval_s = health_check_interval_s
+        self.acquire_timeout_s = acquire_timeout_s
+
+        self._pools: dict[PoolKey, _KeyPool] = {}
+        self._generation = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def connection(self, project_folder: str, db_config: DatabaseConfig) -> Iterator[BaseBackend]:
+        """Check out a connection for the duration of the `with` block.
+
+        If the block raises and the connection no longer answers a ping, the
+        connection is discarded so the next checkout reconnects.
+        """
+        entry = self.acquire(project_folder, db_config)
+        try:
+            yield entry.conn
+        except BaseException:
+            self.release(entry, failed=True)
+            raise
+        else:
+            self.release(entry)
+
+    def acquire(self, project_folder: str, db_config: DatabaseConfig) -> PooledConnection:
+        """Check out a connection until `release()` is called.
+
+        Prefer `connection()`; this is for checkouts that must outlive a block,
+        such as a result cursor kept open between requests.
+        """
+        return self._acquire((project_folder, db_config.name), db_config)
+
+    def release(self, entry: PooledConnection, failed: bool = False) -> None:
+        """Return a connection checked out with `acquire()`.
+
+        After a failure the connection is only kept if it still answers a ping.
+        """
+        self._release(entry.key, entry, healthy=not failed or _ping(entry.db_config, entry.conn))
+
+    def clear(self) -> None:
+        """Close all idle connections and retire the ones currently checked out."""
+        with self._cond:
+            self._generation += 1
+            to_close = [entry for pool in self._pools.values() for entry in pool.idle]
+            for pool in self._pools.values():
+                pool.idle.clear()
+            self._cond.notify_all()
+        for entry in to_close:
+            _disconnect(entry.conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection. Called on application shutdown."""
+        self.clear()
+        with self._cond:
+            self._pools = {key: pool for key, pool in self._pools.items() if pool.in_use}
+
+    def evict_idle(self) -> int:
+        """Close connections that have been idle for longer than `idle_timeout_s`.
+
+        Returns:
+            Number of connections closed.
+        """
+        with self._cond:
+            expired = self._pop_expired(time.monotonic())
+        for entry in expired:
+            _disconnect(entry.conn)
+        return len(expired)
+
+    def stats(self) -> dict[PoolKey, dict[str, int]]:
+        """Return the number of idle and checked-out connections per key."""
+        with self._cond:
+            return {key: {"idle": len(pool.idle), "in_use": pool.in_use} for key, pool in self._pools.items()}
+
+    def _acquire(self, key: PoolKey, db_config: DatabaseConfig) -> PooledConnection:
+        fingerprint = config_fingerprint(db_config)
+        deadline = time.monotonic() + self.acquire_timeout_s
+
+        while True:
+            stale: list[PooledConnection] = []
+            entry: PooledConnection | None = None
+
+            with self._cond:
+                stale.extend(self._pop_expired(time.monotonic()))
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = self._pools[key] = _KeyPool(fingerprint=fingerprint)
+                elif pool.fingerprint != fingerprint:
+                    # The database settings changed: drop connections opened with the old ones
+                    stale.extend(pool.idle)
+                    pool.idle.clear()
+                    pool.fingerprint = fingerprint
+
+                if pool.idle:
+                    # Reuse the most recently used connection, it is the most likely to still be alive
+                    entry = pool.idle.pop()
+                    pool.in_use += 1
+                elif pool.in_use < self.max_size:
+                    pool.in_use += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Timed out waiting for a connection to '{db_config.name}' ({self.max_size} already in use)"
+                        )
+                    self._cond.wait(remaining)
+                    continue
+
+                generation = self._generation
+
+            for stale_entry in stale:
+                _disconnect(stale_entry.conn)
+
+            if entry is not None:
+                idle_for = time.monotonic() - entry.last_used_at
+                if idle_for < self.health_check_interval_s or _ping(db_config, entry.conn):
+                    return entry
+                # Stale session (server-side timeout, dropped tunnel, ...): replace it
+                _disconnect(entry.conn)
+
+            try:
+                conn = db_config.connect()
+            except BaseException:
+                with self._cond:
+                    pool.in_use -= 1
+                    self._cond.notify()
+                raise
+
+            return PooledConnection(
+                conn=conn, key=key, db_config=db_config, fingerprint=fingerprint, generation=generation
+            )
+
+    def _release(self, key: PoolKey, entry: PooledConnection, healthy: bool) -> None:
+        close = not healthy or not entry.db_config.keep_connections_open
+        with self._cond:
+            pool = self._pools.get(key)
+            if pool is None:
+                close = True
+            else:
+                pool.in_use -= 1
+                if entry.generation != self._generation or entry.fingerprint != pool.fingerprint:
+                    close = True
+                if not close:
+                    entry.last_used_at = time.monotonic()
+                    pool.idle.append(entry)
+            self._cond.notify()
+        if close:
+            _disconnect(entry.conn)
+
+    def _pop_expired(self, now: float) -> list[PooledConnection]:
+        """Remove idle connections past their idle timeout. Must hold the lock."""
+        expired: list[PooledConnection] = []
+        for pool in self._pools.values():
+            keep = []
+            for entry in pool.idle:
+                if now - entry.last_used_at >= self.idle_timeout_s:
+                    expired.append(entry)
+                else:
+                    keep.append(entry)
+            pool.idle = keep
+        return expired
+
+
+def config_fingerprint(db_config: DatabaseConfig) -> str:
+    """Hash of a database entry's settings, changing whenever nao_config.yaml edits them."""
+    return hashlib.sha256(db_config.model_dump_json().encode()).hexdigest()
+
+
+def _ping(db_config: DatabaseConfig, conn: BaseBackend) -> bool:
+    try:
+        return db_config.ping(conn)
+    except Exception:
+        return False
+
+
+def _disconnect(conn: BaseBackend) -> None:
+    try:
+        conn.disconnect()
+    except Exception:
+        pass
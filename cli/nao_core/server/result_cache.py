@@ -0,0 +1,119 @@
+"""LRU cache of query results for the SQL service."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .pool import config_fingerprint
+
+if TYPE_CHECKING:
+    from nao_core.config.databases.base import DatabaseConfig
+
+# Quoted literals and identifiers are kept verbatim when normalizing SQL
+_QUOTED = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`)""")
+_WHITESPACE = re.compile(r"\s+")
+_READ_QUERY = re.compile(r"^\(*\s*(select|with|values|show|describe|desc)\b", re.IGNORECASE)
+# Writes can hide in a read-looking statement: data-modifying CTEs, `SELECT ... INTO`
+_WRITE_KEYWORD = re.compile(
+    r"\b(insert|update|delete|merge|into|create|drop|alter|truncate|grant|revoke|copy|call)\b", re.IGNORECASE
+)
+
+CacheKey = tuple[Hashable, ...]
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace outside quotes and drop trailing semicolons."""
+    parts = _QUOTED.split(sql)
+    normalized = "".join(part if i % 2 else _WHITESPACE.sub(" ", part) for i, part in enumerate(parts))
+    return normalized.strip().rstrip(";").rstrip()
+
+
+def is_read_query(sql: str) -> bool:
+    """Whether a (normalized) statement only reads data and is safe to serve from cache."""
+    unquoted = " ".join(_QUOTED.split(sql)[::2])
+    return bool(_READ_QUERY.match(sql)) and ";" not in unquoted and not _WRITE_KEYWORD.search(unquoted)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """An encoded HTTP response. Cached instead of a response object, which can only be sent once."""
+
+    body: bytes
+    media_type: str | None
+    headers: dict[str, str]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class ResultCache:
+    """Size-bounded LRU of query results with a per-entry TTL.
+
+    Keys combine the project folder, the database name and settings, the
+    normalized SQL and any response options (`variant`), so an edited
+    database entry never serves results from its previous settings. Only
+    read queries are cached, and only for databases with a
+    `query_cache_ttl_s` set in nao_config.yaml.
+    """
+
+    def __init__(self, max_entries: int = 256, max_entry_rows: int = 10_000):
+        self.max_entries = max_entries
+        self.max_entry_rows = max_entry_rows
+
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self, project_folder: str, db_config: DatabaseConfig, sql: str, variant: Hashable = None
+    ) -> CacheKey | None:
+        """Return the cache key of a query, or None if its result must not be cached."""
+        if self.max_entries <= 0 or not db_config.query_cache_ttl_s:
+            return None
+        normalized = normalize_sql(sql)
+        if not is_read_query(normalized):
+            return None
+        return (project_folder, db_config.name, config_fingerprint(db_config), normalized, variant)
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return a cached result, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: CacheKey, value: Any, ttl_s: float, rows: int = 0) -> None:
+        """Cache a result for `ttl_s` seconds. Results over `max_entry_rows` rows are not cached."""
+        if ttl_s <= 0 or rows > self.max_entry_rows:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + ttl_s)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result (e.g. after a context refresh)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
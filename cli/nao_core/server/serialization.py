@@ -0,0 +1,174 @@
+"""JSON serialization of query results for the SQL service.
+
+Results are converted one column at a time: the column dtype decides how its
+values are normalized (NaN/NaT/NA -> None, Decimal -> float, datetimes ->
+ISO strings, ...), so the common cases never go through a per-cell chain of
+isinstance checks. `convert_value` remains the per-cell fallback for object
+columns holding mixed or unusual values.
+
+Clients that can read Arrow get the result as an Arrow IPC stream (or a
+Parquet file) instead, built straight from the driver's Arrow output. Large
+results can also be streamed as NDJSON, one row object per line.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import infer_dtype
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+BINARY_MEDIA_TYPES = (ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPE)
+_NEGOTIABLE_MEDIA_TYPES = (*BINARY_MEDIA_TYPES, NDJSON_MEDIA_TYPE)
+
+
+def convert_value(v: object):
+    """Convert a DataFrame cell to a JSON-serializable Python type."""
+    if v is None:
+        return None
+
+    # Handle float NaN / Infinity early (common in pandas output)
+    if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
+        return None
+
+    # Handle pandas NA / NaT sentinels
+    if v is pd.NA or v is pd.NaT:
+        return None
+
+    # Numpy scalar types
+    if isinstance(v, np.bool_):
+        return bool(v)
+    if isinstance(v, np.integer):
+        return int(v)
+    if isinstance(v, np.floating):
+        val = float(v)
+        return None if math.isnan(val) or math.isinf(val) else val
+    if isinstance(v, np.ndarray):
+        return np.asarray(v).tolist()
+
+    # Python / DB types that aren't JSON-serializable by default
+    if isinstance(v, Decimal):
+        if v.is_nan() or v.is_infinite():
+            return None
+        return float(v)
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    if isinstance(v, bytes):
+        return v.decode("utf-8", errors="replace")
+
+    # Catch-all for remaining numpy scalars (e.g. np.str_, np.bytes_)
+    item_method = getattr(v, "item", None)
+    if callable(item_method):
+        return item_method()
+
+    return v
+
+
+def column_to_list(series: pd.Series) -> list[Any]:
+    """Convert a DataFrame column to a list of JSON-serializable values."""
+    dtype = series.dtype
+
+    if isinstance(dtype, ExtensionDtype):
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            return _datetimes_to_iso(series)
+        # Nullable ints/bools/strings: NA becomes None, values become Python scalars
+        return _objects_to_list(series.to_numpy(dtype=object, na_value=None))
+
+    kind = dtype.kind
+    if kind in "iub":
+        return series.to_numpy().tolist()
+    if kind == "f":
+        values = series.to_numpy()
+        result = values.tolist()
+        for i in np.flatnonzero(~np.isfinite(values)):
+            result[i] = None
+        return result
+    if kind == "M":
+        return _datetimes_to_iso(series)
+    return _objects_to_list(series.to_numpy(dtype=object))
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert a DataFrame to a list of row dicts with JSON-serializable values."""
+    if df.shape[1] == 0:
+        return [{} for _ in range(len(df))]
+    names = [str(c) for c in df.columns]
+    columns = [column_to_list(df.iloc[:, i]) for i in range(df.shape[1])]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def dataframe_to_columns(df: pd.DataFrame) -> dict[str, list[Any]]:
+    """Convert a DataFrame to a dict of column name -> list of JSON-serializable values."""
+    return {str(df.columns[i]): column_to_list(df.iloc[:, i]) for i in range(df.shape[1])}
+
+
+def dataframe_to_ndjson(df: pd.DataFrame) -> bytes:
+    """Convert a DataFrame to newline-delimited JSON, one row object per line."""
+    # default=str covers values JSON has no type for (UUIDs, intervals, ...)
+    return "".join(json.dumps(row, default=str) + "\n" for row in dataframe_to_records(df)).encode()
+
+
+def negotiate_media_type(accept: str | None) -> str | None:
+    """Return the alternative media type requested by an Accept header, or None for plain JSON.
+
+    Media types are honoured in the order listed; quality values are not weighed.
+    """
+    if not accept:
+        return None
+    for part in accept.split(","):
+        media_type = part.split(";", 1)[0].strip().lower()
+        if media_type in _NEGOTIABLE_MEDIA_TYPES:
+            return media_type
+        if media_type in ("application/json", "*/*", "application/*"):
+            return None
+    return None
+
+
+def table_to_bytes(table: pa.Table, media_type: str) -> bytes:
+    """Encode an Arrow table as an Arrow IPC stream or a Parquet file."""
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    if media_type == PARQUET_MEDIA_TYPE:
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer)
+        return buffer.getvalue()
+    raise ValueError(f"Unsupported media type: {media_type}")
+
+
+def _datetimes_to_iso(series: pd.Series) -> list[str | None]:
+    mask = series.isna().to_numpy()
+    return [None if missing else ts.isoformat() for ts, missing in zip(series, mask)]
+
+
+def _objects_to_list(values: np.ndarray) -> list[Any]:
+    """Normalize an object array, dispatching on the inferred type of its values."""
+    inferred = infer_dtype(values, skipna=True)
+
+    if inferred in ("string", "empty"):
+        return [None if _is_missing(v) else v for v in values]
+    if inferred == "decimal":
+        return [None if _is_missing(v) or not v.is_finite() else float(v) for v in values]
+    if inferred in ("date", "datetime"):
+        return [None if _is_missing(v) else v.isoformat() for v in values]
+    if inferred == "bytes":
+        return [None if _is_missing(v) else v.decode("utf-8", errors="replace") for v in values]
+    return [convert_value(v) for v in values]
+
+
+def _is_missing(v: object) -> bool:
+    return v is None or v is pd.NA or v is pd.NaT or (isinstance(v, float) and math.isnan(v))
@@ -0,0 +1,71 @@
+"""Streaming of results produced by a blocking worker to an async consumer."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import AsyncGenerator, Callable, Hashable
+from typing import Any
+
+from .executor import QueryExecutor
+
+
+class StreamClosedError(Exception):
+    """Raised in the producer when the consumer stopped reading the stream."""
+
+
+async def iterate_in_worker(
+    executor: QueryExecutor,
+    key: Hashable,
+    fn: Callable[..., Any],
+    *args: Any,
+    max_buffered: int = 4,
+    on_close: Callable[[], Any] | None = None,
+) -> AsyncGenerator[Any, None]:
+    """Run `fn(emit, *args)` on the executor and yield every item it passes to `emit`.
+
+    `emit` blocks while `max_buffered` items are waiting to be consumed, so a
+    slow client slows the producer down instead of the whole result piling up
+    in memory. If the consumer stops early, the producer's next `emit` raises
+    `StreamClosedError`, and `on_close` (e.g. cancelling the running query) is
+    called from a separate thread.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_buffered)
+    closed = threading.Event()
+
+    def emit(item: Any) -> None:
+        if closed.is_set():
+            raise StreamClosedError()
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return
+            except concurrent.futures.TimeoutError:
+                if closed.is_set():
+                    future.cancel()
+                    raise StreamClosedError()
+
+    producer = asyncio.ensure_future(executor.run(key, fn, emit, *args))
+    try:
+        while True:
+            get = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({get, producer}, return_when=asyncio.FIRST_COMPLETED)
+            if get in done:
+                yield get.result()
+                continue
+
+            get.cancel()
+            while not queue.empty():
+                yield queue.get_nowait()
+            producer.result()  # Re-raise the producer's error, if any
+            return
+    finally:
+        if not producer.done():
+            closed.set()
+            # Nobody awaits the producer anymore: don't let its error go unretrieved
+            producer.add_done_callback(lambda f: f.cancelled() or f.exception())
+            if on_close is not None:
+                loop.run_in_executor(None, on_close)
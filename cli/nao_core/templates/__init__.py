@@ -16,7 +16,7 @@ Example user template (docs/report.md.j2):
 """
 
 from .context import NaoContext, NotionPage, NotionProvider, create_nao_context
-from .engine import TemplateEngine, get_template_engine
+from .engine import FrozenTemplates, TemplateEngine, get_template_engine
 from .render import (
     TemplateRenderResult,
     discover_templates,
@@ -27,6 +27,7 @@ from .render import (
 __all__ = [
     # Engine
     "TemplateEngine",
+    "FrozenTemplates",
     "get_template_engine",
     # Context
     "NaoContext",
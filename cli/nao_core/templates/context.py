@@ -10,51 +10,105 @@ Example template usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import cached_property
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from nao_core.config.base import NaoConfig
 
 
+@dataclass
+class TemplateInputs:
+    """Provider data read by a template while it renders."""
+
+    config: bool = False
+    """Whether the template read `nao.config`"""
+
+    notion_pages: set[str] = field(default_factory=set)
+    """IDs of the Notion pages the template read"""
+
+
+_current_inputs: ContextVar[TemplateInputs | None] = ContextVar("nao_template_inputs", default=None)
+
+
+@contextmanager
+def track_inputs() -> Iterator[TemplateInputs]:
+    """Record the provider data read through the `nao` context in the current thread."""
+    inputs = TemplateInputs()
+    token = _current_inputs.set(inputs)
+    try:
+        yield inputs
+    finally:
+        _current_inputs.reset(token)
+
+
 @dataclass
 class NotionPage:
-    """Represents a Notion page with lazy-loaded content."""
+    """Represents a Notion page with lazy-loaded content.
+
+    The page is fetched at most once, even when templates rendered
+    concurrently read it at the same time.
+    """
 
     page_url_or_id: str
     api_key: str
     _data: dict[str, Any] | None = None
+    _last_edited_time: str | None = None
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     def _load(self) -> dict[str, Any]:
         """Lazily load page data from Notion API."""
-        if self._data is None:
-            from notion2md.exporter.block import StringExporter
-            from notion_client import Client
-
-            from nao_core.commands.sync.providers.notion.provider import (
-                extract_page_id,
-                get_page_title,
-                strip_images,
-            )
-
-            page_id = extract_page_id(self.page_url_or_id)
-            client = Client(auth=self.api_key)
-            title = get_page_title(client, page_id)
-
-            # Export to markdown
-            md_exporter = StringExporter(block_id=page_id, token=self.api_key)
-            markdown = md_exporter.export()
-            markdown = strip_images(markdown)
-
-            self._data = {
-                "id": page_id,
-                "title": title,
-                "content": markdown,
-                "url": f"https://notion.so/{page_id}",
-            }
+        with self._lock:
+            if self._data is None:
+                # Read before the content, so that edits made while exporting are picked up by the next render
+                self._load_last_edited_time()
+                self._data = self._fetch()
         return self._data
 
+    def _load_last_edited_time(self) -> str:
+        """Lazily load the last edited time of the page from Notion API."""
+        with self._lock:
+            if self._last_edited_time is None:
+                from notion_client import Client
+
+                from nao_core.commands.sync.providers.notion.provider import extract_page_id
+
+                client = Client(auth=self.api_key)
+                page = client.pages.retrieve(page_id=extract_page_id(self.page_url_or_id))
+                self._last_edited_time = str(page["last_edited_time"])  # type: ignore[index]
+        return self._last_edited_time
+
+    def _fetch(self) -> dict[str, Any]:
+        """Fetch the page from the Notion API and export it to markdown."""
+        from notion2md.exporter.block import StringExporter
+        from notion_client import Client
+
+        from nao_core.commands.sync.providers.notion.provider import (
+            extract_page_id,
+            get_page_title,
+            strip_images,
+        )
+
+        page_id = extract_page_id(self.page_url_or_id)
+        client = Client(auth=self.api_key)
+        title = get_page_title(client, page_id)
+
+        # Export to markdown
+        md_exporter = StringExporter(block_id=page_id, token=self.api_key)
+        markdown = md_exporter.export()
+        markdown = strip_images(markdown)
+
+        return {
+            "id": page_id,
+            "title": title,
+            "content": markdown,
+            "url": f"https://notion.so/{page_id}",
+        }
+
     @property
     def id(self) -> str:
         """The Notion page ID."""
@@ -70,6 +124,11 @@ class NotionPage:
         """The page content as markdown (without frontmatter)."""
         return self._load()["content"]
 
+    @property
+    def last_edited_time(self) -> str:
+        """When the page was last edited, as returned by the Notion API."""
+        return self._load_last_edited_time()
+
     @property
     def url(self) -> str:
         """The Notion page URL."""
@@ -81,11 +140,25 @@ class NotionPage:
 
 
 class NotionProvider:
-    """Provider interface for accessing Notion data in templates."""
+    """Provider interface for accessing Notion data in templates.
+
+    Pages are cached by page ID, so a page referenced by several templates,
+    by URL or by ID, is fetched once per render.
+    """
 
     def __init__(self, config: NaoConfig):
         self._config = config
         self._page_cache: dict[str, NotionPage] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(page_url_or_id: str) -> str:
+        from nao_core.commands.sync.providers.notion.provider import extract_page_id
+
+        try:
+            return extract_page_id(page_url_or_id)
+        except ValueError:
+            return page_url_or_id
 
     def _get_api_key_for_page(self, page_url_or_id: str) -> str:
         """Find the API key that can access a given page.
@@ -127,13 +200,18 @@ class NotionProvider:
             {{ nao.notion.page('https://notion.so/My-Page-abc123').content }}
             {{ nao.notion.page('abc123def456...').title }}
         """
-        if page_url_or_id not in self._page_cache:
-            api_key = self._get_api_key_for_page(page_url_or_id)
-            self._page_cache[page_url_or_id] = NotionPage(
-                page_url_or_id=page_url_or_id,
-                api_key=api_key,
-            )
-        return self._page_cache[page_url_or_id]
+        key = self._cache_key(page_url_or_id)
+        inputs = _current_inputs.get()
+        if inputs is not None:
+            inputs.notion_pages.add(key)
+        with self._lock:
+            if key not in self._page_cache:
+                api_key = self._get_api_key_for_page(page_url_or_id)
+                self._page_cache[key] = NotionPage(
+                    page_url_or_id=page_url_or_id,
+                    api_key=api_key,
+                )
+            return self._page_cache[key]
 
 
 class NaoContext:
@@ -150,15 +228,17 @@ class NaoContext:
 
     def __init__(self, config: NaoConfig):
         self._config = config
+        # Created upfront, so that templates rendered concurrently share a single page cache
+        self._notion = NotionProvider(config)
 
-    @cached_property
+    @property
     def notion(self) -> NotionProvider:
         """Access Notion pages and databases.
 
         Example:
             {{ nao.notion.page('https://notion.so/...').content }}
         """
-        return NotionProvider(self._config)
+        return self._notion
 
     @property
     def config(self) -> NaoConfig:
@@ -167,6 +247,9 @@ class NaoContext:
         Example:
             {{ nao.config.project_name }}
         """
+        inputs = _current_inputs.get()
+        if inputs is not None:
+            inputs.config = True
         return self._config
 
     # Future providers can be added here:
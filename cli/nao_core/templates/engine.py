@@ -3,11 +3,56 @@
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateError, select_autoescape
 
 # Path to the default templates shipped with nao
 DEFAULT_TEMPLATES_DIR = Path(__file__).parent / "defaults"
 
+# Compiled templates cached across runs
+TEMPLATE_CACHE_DIR = Path.home() / ".nao" / "cache" / "templates"
+
+
+class FrozenTemplates:
+    """Templates resolved and compiled once, to be rendered many times.
+
+    The environment they are compiled in never checks the template files
+    for changes, so rendering (including `{% include %}` and `{% extends %}`)
+    doesn't touch the filesystem.
+    """
+
+    def __init__(self, env: Environment, template_names: list[str]):
+        self.env = env
+        self._templates: dict[str, Template] = {}
+        for template_name in template_names:
+            try:
+                self._templates[template_name] = env.get_template(template_name)
+            except TemplateError:
+                # Raised again by render, where template errors are reported
+                pass
+
+    def render(self, template_name: str, **context: Any) -> str:
+        """Render a template with the given context.
+
+        Args:
+            template_name: Name of the template file (e.g., 'databases/preview.md.j2')
+            **context: Variables to pass to the template
+
+        Returns:
+            Rendered template string
+        """
+        template = self._templates.get(template_name) or self.env.get_template(template_name)
+        return template.render(**context)
+
+
+def _bytecode_cache(directory: Path | None) -> FileSystemBytecodeCache | None:
+    if directory is None:
+        return None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(directory))
+
 
 class TemplateEngine:
     """Jinja2 template engine with support for user overrides.
@@ -84,6 +129,37 @@ class TemplateEngine:
         template = self.env.get_template(template_name)
         return template.render(**context)
 
+    def freeze(self, template_names: list[str], bytecode_cache_dir: Path | None = None) -> FrozenTemplates:
+        """Compile templates once, for a run rendering them for many items.
+
+        Args:
+            template_names: Names of the templates to compile
+            bytecode_cache_dir: Directory where compiled templates are cached
+                                across runs (no cache if None or not writable)
+
+        Returns:
+            The compiled templates, isolated from later changes to the template files
+        """
+        env = self.env.overlay(
+            auto_reload=False,
+            # A cache of its own, so included templates are also compiled in this environment
+            cache_size=-1,
+            bytecode_cache=_bytecode_cache(bytecode_cache_dir),
+        )
+        return FrozenTemplates(env, template_names)
+
+    def get_source(self, template_name: str) -> str:
+        """Return the source of a template (the user override if any).
+
+        Args:
+            template_name: Name of the template
+
+        Returns:
+            The template source
+        """
+        source, _, _ = self.env.loader.get_source(self.env, template_name)  # type: ignore[union-attr]
+        return source
+
     def has_template(self, template_name: str) -> bool:
         """Check if a template exists.
 
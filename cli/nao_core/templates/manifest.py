@@ -0,0 +1,69 @@
+"""Persisted state of user template renders, used to skip templates whose inputs did not change."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+RENDER_STATE_FILENAME = ".nao-render-state"
+"""Manifest file, stored at the root of the project"""
+
+_MANIFEST_VERSION = 1
+
+
+@dataclass
+class TemplateManifest:
+    """Inputs of a template when it was last rendered."""
+
+    source: str
+    """Hash of the template source and of the templates it includes, extends or imports"""
+
+    config: str | None = None
+    """Hash of the nao configuration, if the template read `nao.config`"""
+
+    notion: dict[str, str] = field(default_factory=dict)
+    """Dict mapping the IDs of the Notion pages the template read to their last edited time"""
+
+
+class RenderManifest:
+    """The `.nao-render-state` file: one `TemplateManifest` per rendered template."""
+
+    def __init__(self, path: Path, templates: dict[str, TemplateManifest] | None = None):
+        self.path = path
+        self.templates = templates or {}
+
+    @classmethod
+    def load(cls, project_path: Path) -> RenderManifest:
+        """Load the manifest of `project_path`. A missing or unreadable manifest is empty."""
+        path = project_path / RENDER_STATE_FILENAME
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") != _MANIFEST_VERSION:
+                return cls(path)
+            templates = {
+                name: TemplateManifest(source=entry["source"], config=entry["config"], notion=entry["notion"])
+                for name, entry in data["templates"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(path)
+        return cls(path, templates)
+
+    def get(self, template_path: Path) -> TemplateManifest | None:
+        return self.templates.get(template_path.as_posix())
+
+    def set(self, template_path: Path, manifest: TemplateManifest) -> None:
+        self.templates[template_path.as_posix()] = manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        from nao_core.commands.sync.files import write_if_changed
+
+        data = {
+            "version": _MANIFEST_VERSION,
+            "templates": {
+                name: {"source": entry.source, "config": entry.config, "notion": entry.notion}
+                for name, entry in sorted(self.templates.items())
+            },
+        }
+        write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
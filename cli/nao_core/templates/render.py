@@ -9,19 +9,31 @@ For example: `docs/report.md.j2` → `docs/report.md`
 
 from __future__ import annotations
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader, TemplateError
+from jinja2 import Environment, FileSystemLoader, TemplateError, meta
 
-from .context import create_nao_context
+from nao_core import __version__
+
+from .context import NaoContext, TemplateInputs, create_nao_context, track_inputs
+from .manifest import RenderManifest, TemplateManifest
 
 if TYPE_CHECKING:
     from rich.console import Console
 
     from nao_core.config.base import NaoConfig
 
+# Maximum number of user templates rendered at the same time
+DEFAULT_RENDER_CONCURRENCY = 8
+
+# Output directories of sync providers: large, and never holding user templates
+SYNCED_DIRS = {"databases", "repos"}
+
 
 @dataclass
 class TemplateRenderResult:
@@ -31,15 +43,18 @@ class TemplateRenderResult:
     templates_failed: int
     rendered_files: list[str]
     errors: list[str]
+    templates_unchanged: int = 0
 
     def get_summary(self) -> str:
         """Get a human-readable summary of the render result."""
-        if self.templates_rendered == 0 and self.templates_failed == 0:
+        if self.templates_rendered == 0 and self.templates_failed == 0 and self.templates_unchanged == 0:
             return "No templates found"
 
         parts = []
         if self.templates_rendered > 0:
             parts.append(f"{self.templates_rendered} rendered")
+        if self.templates_unchanged > 0:
+            parts.append(f"{self.templates_unchanged} unchanged")
         if self.templates_failed > 0:
             parts.append(f"{self.templates_failed} failed")
         return ", ".join(parts)
@@ -51,6 +66,9 @@ def discover_templates(
 ) -> list[Path]:
     """Discover all `.j2` template files in the project.
 
+    Excluded directories, and the output directories of sync providers at the
+    root of the project, are pruned without being listed.
+
     Args:
         project_path: Path to the nao project root.
         exclude_dirs: Directory names to exclude (default: templates, .git, node_modules, etc.)
@@ -71,34 +89,27 @@ def discover_templates(
 
     templates: list[Path] = []
 
-    for path in project_path.rglob("*.j2"):
+    for root, dirs, files in os.walk(project_path):
+        root_path = Path(root)
+
         # Skip excluded directories
-        if any(excluded in path.parts for excluded in exclude_dirs):
-            continue
+        skipped = exclude_dirs | SYNCED_DIRS if root_path == project_path else exclude_dirs
+        dirs[:] = [d for d in dirs if d not in skipped]
 
         # Store relative path
-        templates.append(path.relative_to(project_path))
+        templates.extend((root_path / f).relative_to(project_path) for f in files if f.endswith(".j2"))
 
     return sorted(templates)
 
 
-def render_template(
-    template_path: Path,
-    project_path: Path,
-    config: NaoConfig,
-) -> Path:
-    """Render a single template file.
+def create_environment(project_path: Path) -> Environment:
+    """Create the Jinja environment used to render the templates of a project.
 
     Args:
-        template_path: Path to the template file (relative to project_path).
         project_path: Path to the nao project root.
-        config: The nao configuration.
 
     Returns:
-        Path to the rendered output file.
-
-    Raises:
-        TemplateError: If template rendering fails.
+        An environment loading templates relative to the project root.
     """
     # Create Jinja environment with project as the loader path
     env = Environment(
@@ -114,8 +125,37 @@ def render_template(
 
     env.filters["to_json"] = lambda v, indent=None: json.dumps(v, indent=indent, default=str)
 
+    return env
+
+
+def render_template(
+    template_path: Path,
+    project_path: Path,
+    config: NaoConfig,
+    env: Environment | None = None,
+    nao: NaoContext | None = None,
+) -> Path:
+    """Render a single template file.
+
+    Args:
+        template_path: Path to the template file (relative to project_path).
+        project_path: Path to the nao project root.
+        config: The nao configuration.
+        env: Jinja environment to render with (created for this template if None).
+        nao: The `nao` context (created for this template if None).
+
+    Returns:
+        Path to the rendered output file.
+
+    Raises:
+        TemplateError: If template rendering fails.
+    """
+    if env is None:
+        env = create_environment(project_path)
+
     # Create the nao context
-    nao = create_nao_context(config)
+    if nao is None:
+        nao = create_nao_context(config)
 
     # Load and render the template
     template = env.get_template(str(template_path))
@@ -133,17 +173,113 @@ def render_template(
     return output_path
 
 
+def _source_hash(env: Environment, template_path: Path) -> str | None:
+    """Hash the source of a template and of the templates it depends on.
+
+    Returns None if the dependencies can't be resolved statically (e.g. a
+    template name computed at render time): the template is then always rendered.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    pending = [str(template_path)]
+    seen: set[str] = set()
+    try:
+        while pending:
+            template_name = pending.pop()
+            if template_name in seen:
+                continue
+            seen.add(template_name)
+            source, _, _ = env.loader.get_source(env, template_name)  # type: ignore[union-attr]
+            digest.update(template_name.encode())
+            digest.update(source.encode())
+            for referenced in meta.find_referenced_templates(env.parse(source)):
+                if referenced is None:
+                    return None
+                pending.append(referenced)
+    except TemplateError:
+        return None
+    return digest.hexdigest()
+
+
+def _config_hash(config: NaoConfig) -> str:
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()
+
+
+def _is_unchanged(
+    previous: TemplateManifest, source: str | None, config_hash: str, nao: NaoContext, output_path: Path
+) -> bool:
+    """Check whether the inputs of a template are the same as when it was last rendered."""
+    if source is None or previous.source != source or not output_path.exists():
+        return False
+    if previous.config is not None and previous.config != config_hash:
+        return False
+    try:
+        return all(
+            nao.notion.page(page_id).last_edited_time == last_edited_time
+            for page_id, last_edited_time in previous.notion.items()
+        )
+    except Exception:
+        return False
+
+
+def _record(source: str | None, config_hash: str, nao: NaoContext, inputs: TemplateInputs) -> TemplateManifest | None:
+    """Record the inputs of a rendered template, or None if they can't all be checked by the next render."""
+    if source is None:
+        return None
+    try:
+        notion = {page_id: nao.notion.page(page_id).last_edited_time for page_id in sorted(inputs.notion_pages)}
+    except Exception:
+        return None
+    return TemplateManifest(source=source, config=config_hash if inputs.config else None, notion=notion)
+
+
+def _render_if_changed(
+    template_path: Path,
+    project_path: Path,
+    config: NaoConfig,
+    env: Environment,
+    nao: NaoContext,
+    previous: TemplateManifest | None,
+    config_hash: str,
+) -> tuple[Path, TemplateManifest | None, bool]:
+    """Render a template unless its inputs did not change since `previous`.
+
+    Returns:
+        The output path, the inputs to record for the template, and whether it was rendered.
+    """
+    source = _source_hash(env, template_path)
+    output_path = project_path / str(template_path)[:-3]
+    if previous is not None and _is_unchanged(previous, source, config_hash, nao, output_path):
+        return output_path, previous, False
+
+    with track_inputs() as inputs:
+        output_path = render_template(template_path, project_path, config, env, nao)
+    return output_path, _record(source, config_hash, nao, inputs), True
+
+
 def render_all_templates(
     project_path: Path,
     config: NaoConfig,
     console: "Console | None" = None,
+    concurrency: int = DEFAULT_RENDER_CONCURRENCY,
+    full: bool = False,
 ) -> TemplateRenderResult:
     """Discover and render all user templates in the project.
 
+    Templates are rendered by `concurrency` threads, sharing one Jinja
+    environment and one `nao` context: a Notion page read by several
+    templates is fetched once.
+
+    Renders are incremental: `.nao-render-state` records the inputs of each
+    template (its source and the templates it includes, the Notion pages it
+    read and their last edited time, the configuration if it read it), and
+    templates whose inputs did not change since the previous render are skipped.
+
     Args:
         project_path: Path to the nao project root.
         config: The nao configuration.
         console: Optional Rich console for output.
+        concurrency: Maximum number of templates rendered at the same time.
+        full: Render every template, even those whose inputs did not change.
 
     Returns:
         TemplateRenderResult with statistics about what was rendered.
@@ -165,31 +301,66 @@ def render_all_templates(
 
     rendered_files: list[str] = []
     errors: list[str] = []
+    unchanged = 0
 
-    for template_path in templates:
-        try:
-            output_path = render_template(template_path, project_path, config)
-            rendered_files.append(str(output_path.relative_to(project_path)))
-            console.print(f"  [dim]→[/dim] {template_path} [dim]→[/dim] {output_path.name}")
-        except TemplateError as e:
-            error_msg = f"{template_path}: {e}"
-            errors.append(error_msg)
-            console.print(f"  [red]✗[/red] {template_path}: {e}")
-        except Exception as e:
-            error_msg = f"{template_path}: {type(e).__name__}: {e}"
-            errors.append(error_msg)
-            console.print(f"  [red]✗[/red] {template_path}: {e}")
+    env = create_environment(project_path)
+    nao = create_nao_context(config)
+    config_hash = _config_hash(config)
+    previous = RenderManifest.load(project_path)
+    manifest = RenderManifest(previous.path)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(templates))), thread_name_prefix="nao-render"
+    ) as executor:
+        futures = [
+            executor.submit(
+                _render_if_changed,
+                template_path,
+                project_path,
+                config,
+                env,
+                nao,
+                None if full else previous.get(template_path),
+                config_hash,
+            )
+            for template_path in templates
+        ]
+        # Results are reported in discovery order, whichever template finishes first
+        for template_path, future in zip(templates, futures):
+            try:
+                output_path, entry, rendered = future.result()
+                if entry is not None:
+                    manifest.set(template_path, entry)
+                if not rendered:
+                    unchanged += 1
+                    continue
+                rendered_files.append(str(output_path.relative_to(project_path)))
+                console.print(f"  [dim]→[/dim] {template_path} [dim]→[/dim] {output_path.name}")
+            except TemplateError as e:
+                error_msg = f"{template_path}: {e}"
+                errors.append(error_msg)
+                console.print(f"  [red]✗[/red] {template_path}: {e}")
+            except Exception as e:
+                error_msg = f"{template_path}: {type(e).__name__}: {e}"
+                errors.append(error_msg)
+                console.print(f"  [red]✗[/red] {template_path}: {e}")
+
+    if unchanged:
+        console.print(f"  [dim]{unchanged} unchanged templates skipped[/dim]")
+    manifest.save()
 
     return TemplateRenderResult(
         templates_rendered=len(rendered_files),
         templates_failed=len(errors),
         rendered_files=rendered_files,
         errors=errors,
+        templates_unchanged=unchanged,
     )
 
 
 __all__ = [
     "TemplateRenderResult",
+    "create_environment",
     "discover_templates",
     "render_template",
     "render_all_templates",
@@ -7,6 +7,7 @@ that inherits from `BaseSyncIntegrationTests` to get all shared assertions for f
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -122,7 +123,8 @@ class BaseSyncIntegrationTests:
         content = self._read_table_file(output, config, spec, spec.users_table, "description.md")
 
         assert "## Table Metadata" in content
-        assert "| **Row Count** | 3 |" in content
+        # Estimated from catalog statistics (and marked as such) on warehouses that have them
+        assert re.search(r"\| \*\*Row Count\*\* \| 3( \(approximate\))? \|", content)
         assert "| **Column Count** | 4 |" in content
 
         if spec.users_table_description:
@@ -134,7 +136,7 @@ class BaseSyncIntegrationTests:
         _, output, config = synced
         content = self._read_table_file(output, config, spec, spec.orders_table, "description.md")
 
-        assert "| **Row Count** | 2 |" in content
+        assert re.search(r"\| \*\*Row Count\*\* \| 2( \(approximate\))? \|", content)
         assert "| **Column Count** | 3 |" in content
 
         if spec.orders_table_description:
@@ -181,6 +183,38 @@ class BaseSyncIntegrationTests:
         assert spec.users_table in state.synced_tables[spec.primary_schema]
         assert spec.orders_table in state.synced_tables[spec.primary_schema]
 
+    def test_parallel_sync_matches_sequential(self, synced, tmp_path_factory, spec):
+        """Rendering tables on several threads writes the same files as a sequential sync."""
+        state, output, config = synced
+
+        parallel_output = tmp_path_factory.mktemp(f"{spec.db_type}_parallel")
+        with Progress(transient=True) as progress:
+            parallel_state = sync_database(config, parallel_output, progress, jobs=4)
+
+        assert parallel_state.synced_tables == state.synced_tables
+        files = sorted(p.relative_to(output) for p in output.rglob("*") if p.is_file())
+        assert files == sorted(p.relative_to(parallel_output) for p in parallel_output.rglob("*") if p.is_file())
+        # Previews are left out: row order is not guaranteed on every warehouse
+        for file in files:
+            if file.name != "preview.md":
+                assert (parallel_output / file).read_text() == (output / file).read_text()
+
+    def test_async_engine_matches_threads(self, synced, tmp_path_factory, spec):
+        """The async engine writes the same files as the threads engine."""
+        state, output, config = synced
+
+        async_output = tmp_path_factory.mktemp(f"{spec.db_type}_async")
+        with Progress(transient=True) as progress:
+            async_state = sync_database(config, async_output, progress, jobs=4, sync_engine="async")
+
+        assert async_state.synced_tables == state.synced_tables
+        files = sorted(p.relative_to(output) for p in output.rglob("*") if p.is_file())
+        assert files == sorted(p.relative_to(async_output) for p in async_output.rglob("*") if p.is_file())
+        # Previews are left out: row order is not guaranteed on every warehouse
+        for file in files:
+            if file.name != "preview.md":
+                assert (async_output / file).read_bytes() == (output / file).read_bytes()
+
     # ── execute_sql ────────────────────────────────────────────────────
 
     def test_execute_sql_returns_dataframe(self, db_config, spec):
@@ -206,6 +240,14 @@ class BaseSyncIntegrationTests:
         assert len(df) == 1
         assert int(df.iloc[0, 0]) == 3
 
+    def test_execute_arrow_returns_table(self, db_config, spec):
+        """execute_arrow should return an Arrow table with the same shape as execute_sql."""
+        schema = spec.primary_schema
+        table = spec.users_table
+        result = db_config.execute_arrow(f"SELECT * FROM {schema}.{table} ORDER BY 1")
+        assert result.num_rows == 3
+        assert result.num_columns == 4
+
     # ── include / exclude filters ────────────────────────────────────
 
     def test_include_filter(self, tmp_path_factory, db_config, spec):
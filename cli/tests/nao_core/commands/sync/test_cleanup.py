@@ -10,6 +10,8 @@ from nao_core.commands.sync.cleanup import (
     cleanup_stale_paths,
     cleanup_stale_repos,
 )
+from nao_core.commands.sync.manifest import DatabaseManifest, PathManifest, SyncManifest
+from nao_core.commands.sync.providers.notion.provider import cleanup_stale_pages
 from nao_core.config.repos import RepoConfig
 
 
@@ -214,6 +216,71 @@ class TestCleanupStalePaths:
         assert not table_path.exists()
 
 
+class TestManifestCleanup:
+    """Tests for cleanup driven by the manifest of the previous sync."""
+
+    def test_removes_only_recorded_paths_missing_from_state(self, tmp_path: Path):
+        """Recorded schemas and tables that were not synced are removed; unrecorded directories are not listed."""
+        db_path = tmp_path / "type=duckdb" / "database=test"
+        schema_path = db_path / "schema=public"
+        for table in ("users", "dropped", "unrecorded"):
+            (schema_path / f"table={table}").mkdir(parents=True)
+        (db_path / "schema=old" / "table=events").mkdir(parents=True)
+        previous = DatabaseManifest(render_key="key", synced={"public": ["users", "dropped"], "old": ["events"]})
+
+        state = DatabaseSyncState(db_path=db_path)
+        state.add_schema("public")
+        state.add_table("public", "users")
+
+        removed = cleanup_stale_paths(state, previous=previous)
+
+        assert removed == 2
+        assert not (schema_path / "table=dropped").exists()
+        assert not (db_path / "schema=old").exists()
+        assert (schema_path / "table=users").exists()
+        assert (schema_path / "table=unrecorded").exists()
+
+    def test_removes_recorded_databases_missing_from_config(self, tmp_path: Path):
+        """Databases recorded by the sync manifest but no longer configured are removed and forgotten."""
+        manifest = SyncManifest.load(tmp_path)
+        for db_dir in ("type=duckdb/database=valid", "type=duckdb/database=old", "type=postgres/database=prod"):
+            (tmp_path / db_dir).mkdir(parents=True)
+            manifest.set(tmp_path / db_dir, DatabaseManifest(render_key="key", synced={}))
+        manifest.save()
+
+        cleanup_stale_databases([DBConfig(type="duckdb", path="/tmp/valid.duckdb")], tmp_path)
+
+        assert (tmp_path / "type=duckdb" / "database=valid").exists()
+        assert not (tmp_path / "type=duckdb" / "database=old").exists()
+        assert not (tmp_path / "type=postgres").exists()
+        assert list(SyncManifest.load(tmp_path).databases) == ["type=duckdb/database=valid"]
+
+    def test_removes_recorded_repos_missing_from_config(self, tmp_path: Path):
+        """Recorded repositories no longer configured are removed and forgotten."""
+        create_repo_dir(tmp_path, "repo1")
+        create_repo_dir(tmp_path, "old_repo")
+        PathManifest.load(tmp_path, "repos").save({"repo1", "old_repo", "deleted_by_hand"})
+
+        cleanup_stale_repos([RepoConfig(name="repo1", url="https://example.com/repo1.git")], tmp_path)
+
+        assert (tmp_path / "repo1").exists()
+        assert not (tmp_path / "old_repo").exists()
+        assert PathManifest.load(tmp_path, "repos").names == {"repo1"}
+
+    def test_removes_recorded_pages_not_synced(self, tmp_path: Path):
+        """Notion pages of the previous sync that were not synced again are removed."""
+        for name in ("kept.md", "stale.md", "notes.md"):
+            (tmp_path / name).write_text("page")
+        PathManifest.load(tmp_path, "notion").save({"kept.md", "stale.md"})
+
+        removed = cleanup_stale_pages({"kept.md", "new.md"}, tmp_path)
+
+        assert removed == 1
+        assert not (tmp_path / "stale.md").exists()
+        assert (tmp_path / "notes.md").exists()
+        assert PathManifest.load(tmp_path, "notion").names == {"kept.md", "new.md"}
+
+
 class TestCleanupStaleDatabases:
     """Tests for cleanup_stale_databases function."""
 
@@ -1,10 +1,14 @@
 """Unit tests for DatabaseContext."""
 
+import threading
 from unittest.mock import MagicMock
 
+import ibis
 import pandas as pd
+import pytest
 
 from nao_core.commands.sync.providers.databases.context import DatabaseContext
+from nao_core.config.databases.context import SchemaMetadata, dataframe_to_rows, memoize
 
 
 class TestDatabaseContext:
@@ -48,6 +52,33 @@ class TestDatabaseContext:
         mock_table.count.return_value.execute.return_value = 42
 
         assert ctx.row_count() == 42
+        assert ctx.row_count_is_approximate() is False
+
+    def test_row_count_uses_catalog_statistics(self):
+        mock_conn = MagicMock()
+        metadata = SchemaMetadata(row_counts={"big_table": 3_000_000_000})
+        ctx = DatabaseContext(mock_conn, "schema", "big_table", metadata)
+
+        assert ctx.row_count() == 3_000_000_000
+        assert ctx.row_count_is_approximate() is True
+        mock_conn.table.assert_not_called()
+
+    def test_exact_row_count_is_opt_in(self):
+        mock_conn = MagicMock()
+        mock_conn.table.return_value.count.return_value.execute.return_value = 2_999_999_999
+        metadata = SchemaMetadata(row_counts={"big_table": 3_000_000_000})
+        ctx = DatabaseContext(mock_conn, "schema", "big_table", metadata, exact_row_count=True)
+
+        assert ctx.row_count() == 2_999_999_999
+        assert ctx.row_count_is_approximate() is False
+
+    def test_row_count_without_statistics_counts_rows(self):
+        mock_conn = MagicMock()
+        mock_conn.table.return_value.count.return_value.execute.return_value = 7
+        ctx = DatabaseContext(mock_conn, "schema", "view", SchemaMetadata(row_counts={}))
+
+        assert ctx.row_count() == 7
+        assert ctx.row_count_is_approximate() is False
 
     def test_column_count(self):
         ctx, _ = self._make_context()
@@ -72,3 +103,116 @@ class TestDatabaseContext:
         _ = ctx.table
         _ = ctx.table
         mock_conn.table.assert_called_once()
+
+    def test_accessors_are_memoized(self):
+        ctx, mock_table = self._make_context()
+        mock_table.count.return_value.execute.return_value = 42
+        mock_table.limit.return_value.execute.return_value = pd.DataFrame({"id": [1]})
+
+        assert ctx.row_count() == ctx.row_count() == 42
+        ctx.columns()
+        ctx.columns()
+        ctx.preview()
+        ctx.preview(limit=10)
+        ctx.preview(5)
+
+        mock_table.count.assert_called_once()
+        mock_table.schema.assert_called_once()
+        # preview() and preview(limit=10) share a cache entry, preview(5) has its own
+        assert [c.args for c in mock_table.limit.call_args_list] == [(10,), (5,)]
+
+    def test_errors_are_not_memoized(self):
+        ctx, mock_table = self._make_context()
+        mock_table.count.return_value.execute.side_effect = [RuntimeError("timeout"), 42]
+
+        with pytest.raises(RuntimeError):
+            ctx.row_count()
+        assert ctx.row_count() == 42
+
+    def test_memoized_override_can_call_super(self):
+        class CustomContext(DatabaseContext):
+            @memoize
+            def columns(self):
+                return [{**col, "description": "custom"} for col in super().columns()]
+
+        mock_conn = MagicMock()
+        mock_conn.table.return_value.schema.return_value.items.return_value = [("id", "int64")]
+        ctx = CustomContext(mock_conn, "schema", "table")
+
+        assert ctx.columns()[0]["description"] == "custom"
+        assert ctx.columns() is ctx.columns()
+        mock_conn.table.return_value.schema.assert_called_once()
+
+
+class TestPreviewStrategies:
+    @pytest.fixture
+    def conn(self):
+        conn = ibis.duckdb.connect()
+        conn.raw_sql(
+            "CREATE TABLE events AS SELECT i AS id, DATE '2024-01-01' + (i % 3)::INT AS day FROM range(100000) t(i)"
+        )
+        yield conn
+        conn.disconnect()
+
+    def test_tablesample_returns_a_sample(self, conn):
+        metadata = SchemaMetadata(row_counts={"events": 100000})
+        ctx = DatabaseContext(conn, "main", "events", metadata, preview_strategy="tablesample")
+
+        rows = ctx.preview(limit=5)
+
+        assert 0 < len(rows) <= 5
+
+    def test_tablesample_without_statistics_uses_limit(self):
+        mock_conn = MagicMock()
+        mock_conn.table.return_value.limit.return_value.execute.return_value = pd.DataFrame({"id": [1]})
+        ctx = DatabaseContext(mock_conn, "main", "events", preview_strategy="tablesample")
+
+        assert ctx.preview(limit=5) == [{"id": 1}]
+        mock_conn.table.return_value.sample.assert_not_called()
+
+    def test_partition_pruned_reads_latest_partition(self, conn):
+        class PartitionedContext(DatabaseContext):
+            def partition_columns(self):
+                return ["day"]
+
+        ctx = PartitionedContext(conn, "main", "events", preview_strategy="partition-pruned")
+
+        rows = ctx.preview(limit=5)
+
+        assert len(rows) == 5
+        assert {row["day"] for row in rows} == {"2024-01-03 00:00:00"}
+
+    def test_preview_timeout_cancels_query(self):
+        mock_conn = MagicMock()
+        cancel = MagicMock(return_value=True)
+        interrupted = threading.Event()
+
+        def slow_execute():
+            interrupted.wait(5)
+            raise RuntimeError("INTERRUPT")
+
+        cancel.side_effect = lambda conn: interrupted.set() or True
+        mock_conn.table.return_value.limit.return_value.execute.side_effect = slow_execute
+        ctx = DatabaseContext(mock_conn, "main", "events", preview_timeout_s=0.05, cancel=cancel)
+
+        with pytest.raises(TimeoutError, match="0.05s preview timeout"):
+            ctx.preview()
+        cancel.assert_called_once_with(mock_conn)
+
+
+def test_dataframe_to_rows_keeps_json_types():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "amount": [9.5, float("nan")],
+            "active": [True, False],
+            "email": ["a@example.com", None],
+            "created_at": pd.to_datetime(["2024-01-01", None]),
+        }
+    )
+
+    assert dataframe_to_rows(df) == [
+        {"id": 1, "amount": 9.5, "active": True, "email": "a@example.com", "created_at": "2024-01-01 00:00:00"},
+        {"id": 2, "amount": None, "active": False, "email": None, "created_at": None},
+    ]
+    assert type(dataframe_to_rows(df)[0]["id"]) is int
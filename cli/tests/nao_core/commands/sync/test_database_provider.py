@@ -1,8 +1,12 @@
 """Unit tests for the database sync provider."""
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from nao_core.commands.sync.cleanup import DatabaseSyncState
+from nao_core.commands.sync.providers.base import SyncOptions
 from nao_core.commands.sync.providers.databases.provider import DatabaseSyncProvider
 from nao_core.config.base import NaoConfig
 
@@ -58,3 +62,51 @@ class TestDatabaseSyncProvider:
         mock_config.databases = []
 
         assert provider.should_sync(mock_config) is False
+
+    @patch("nao_core.commands.sync.providers.databases.provider.cleanup_stale_paths", return_value=0)
+    @patch("nao_core.commands.sync.providers.databases.provider.Progress")
+    @patch("nao_core.commands.sync.providers.databases.provider.console")
+    def test_sync_runs_databases_concurrently(self, mock_console, mock_progress, mock_cleanup, tmp_path: Path):
+        provider = DatabaseSyncProvider()
+        databases = []
+        for name in ("postgres", "bigquery", "snowflake"):
+            db = MagicMock()
+            db.name = name
+            db.accessors = []
+            databases.append(db)
+        active = 0
+        max_active = 0
+        engines = []
+        lock = threading.Lock()
+
+        def fake_sync_database(
+            db, output_path, progress, project_path, jobs=None, manifest=None, sync_engine="threads", engine=None
+        ):
+            nonlocal active, max_active
+            with lock:
+                engines.append(engine)
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.1)
+            with lock:
+                active -= 1
+            if db.name == "bigquery":
+                raise RuntimeError("auth failed")
+            state = DatabaseSyncState(db_path=output_path / db.name)
+            state.add_schema("main")
+            state.add_table("main", "users")
+            return state
+
+        with patch("nao_core.commands.sync.providers.databases.provider.sync_database", side_effect=fake_sync_database):
+            result = provider.sync(databases, tmp_path, options=SyncOptions(database_concurrency=2))
+
+        assert max_active == 2
+        assert result.items_synced == 2
+        # Every database renders with the template engine created before the threads started
+        assert engines[0] is not None
+        assert all(engine is engines[0] for engine in engines)
+        # Stale paths are cleaned up for each database that synced, in config order
+        cleaned = [call.args[0].db_path.name for call in mock_cleanup.call_args_list]
+        assert cleaned == ["postgres", "snowflake"]
+        printed = [call.args[0] for call in mock_console.print.call_args_list if call.args]
+        assert any("Failed to sync bigquery" in line for line in printed)
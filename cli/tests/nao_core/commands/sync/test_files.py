@@ -0,0 +1,60 @@
+"""Tests for sync output file writing."""
+
+import os
+import stat
+
+from nao_core.commands.sync.files import write_if_changed, write_text_atomic
+
+
+def test_write_text_atomic_replaces_content(tmp_path):
+    path = tmp_path / "out.md"
+    path.write_text("old")
+
+    write_text_atomic(path, "new")
+
+    assert path.read_text() == "new"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_text_atomic_keeps_permissions(tmp_path):
+    created = tmp_path / "created.md"
+    existing = tmp_path / "existing.md"
+    existing.write_text("old")
+    existing.chmod(0o640)
+
+    write_text_atomic(created, "new")
+    write_text_atomic(existing, "new")
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(created.stat().st_mode) == 0o666 & ~umask
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+
+def test_write_text_atomic_follows_current_umask(tmp_path):
+    path = tmp_path / "out.md"
+
+    previous = os.umask(0o077)
+    try:
+        write_text_atomic(path, "new")
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "out.md"
+
+    assert write_if_changed(path, "hello") is True
+    mtime = path.stat().st_mtime_ns
+    assert write_if_changed(path, "hello") is False
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_write_if_changed_rewrites_same_size_content(tmp_path):
+    path = tmp_path / "out.md"
+    path.write_text("aaaa")
+
+    assert write_if_changed(path, "bbbb") is True
+    assert path.read_text() == "bbbb"
@@ -0,0 +1,117 @@
+"""Tests for the sync manifest and incremental database sync."""
+
+from unittest.mock import MagicMock, patch
+
+from nao_core.commands.sync.manifest import SYNC_STATE_FILENAME, DatabaseManifest, SyncManifest
+from nao_core.commands.sync.providers.databases.provider import sync_database
+from nao_core.config.databases.base import DatabaseAccessor
+from nao_core.config.databases.context import SchemaMetadata
+
+
+class TestSyncManifest:
+    def test_round_trip(self, tmp_path):
+        db_path = tmp_path / "type=duckdb" / "database=main"
+        db_path.mkdir(parents=True)
+        manifest = SyncManifest.load(tmp_path)
+        entry = DatabaseManifest(render_key="key")
+        entry.set_fingerprint("public", "users", "fp")
+        manifest.set(db_path, entry)
+        manifest.save()
+
+        loaded = SyncManifest.load(tmp_path).get(db_path)
+
+        assert loaded is not None
+        assert loaded.render_key == "key"
+        assert loaded.fingerprint("public", "users") == "fp"
+        assert loaded.fingerprint("public", "orders") is None
+
+    def test_missing_or_corrupt_manifest_is_empty(self, tmp_path):
+        assert SyncManifest.load(tmp_path).databases == {}
+
+        (tmp_path / SYNC_STATE_FILENAME).write_text("{not json")
+        assert SyncManifest.load(tmp_path).databases == {}
+
+    def test_save_drops_removed_databases(self, tmp_path):
+        manifest = SyncManifest.load(tmp_path)
+        manifest.set(tmp_path / "type=duckdb" / "database=gone", DatabaseManifest(render_key="key"))
+        manifest.save()
+
+        assert SyncManifest.load(tmp_path).databases == {}
+
+
+def _mock_db_config(fingerprints):
+    db_config = MagicMock()
+    db_config.name = "warehouse"
+    db_config.type = "snowflake"
+    db_config.accessors = [DatabaseAccessor.COLUMNS]
+    db_config.sync_concurrency = None
+    db_config.get_database_name.return_value = "prod"
+    db_config.get_schemas.return_value = ["public"]
+    db_config.matches_pattern.return_value = True
+    db_config.list_catalog.return_value = None
+    db_config.connect.return_value.list_tables.return_value = ["orders", "users", "users_view"]
+    db_config.fetch_schema_metadata.side_effect = lambda conn, schema: SchemaMetadata(fingerprints=dict(fingerprints))
+    return db_config
+
+
+def _sync(db_config, tmp_path, manifest):
+    engine = MagicMock()
+    engine.list_templates.return_value = ["databases/columns.md.j2"]
+    engine.get_source.return_value = "{{ db.columns() }}"
+    engine.render.side_effect = lambda template, **kw: f"columns of {kw['table_name']}"
+    engine.freeze.return_value = engine
+    with (
+        patch("nao_core.commands.sync.providers.databases.provider.console"),
+        patch("nao_core.commands.sync.providers.databases.provider.get_template_engine", return_value=engine),
+    ):
+        state = sync_database(db_config, tmp_path, MagicMock(), None, manifest=manifest)
+    rendered = sorted(call.kwargs["table_name"] for call in engine.render.call_args_list)
+    return state, rendered
+
+
+class TestIncrementalSync:
+    def test_unchanged_tables_are_skipped(self, tmp_path):
+        db_config = _mock_db_config({"orders": "1", "users": "1"})
+        manifest = SyncManifest.load(tmp_path)
+
+        state, rendered = _sync(db_config, tmp_path, manifest)
+        assert rendered == ["orders", "users", "users_view"]
+        manifest.set(state.db_path, state.manifest)
+
+        db_config = _mock_db_config({"orders": "2", "users": "1"})
+        state, rendered = _sync(db_config, tmp_path, manifest)
+
+        # users is unchanged, views have no fingerprint
+        assert rendered == ["orders", "users_view"]
+        assert state.tables_synced == 3
+        assert state.tables_unchanged == 1
+        assert state.synced_tables["public"] == {"orders", "users", "users_view"}
+        assert state.manifest.tables == {
+            "public": {"orders": fingerprint_of("orders", "2"), "users": fingerprint_of("users", "1")}
+        }
+
+    def test_without_manifest_every_table_is_rendered(self, tmp_path):
+        db_config = _mock_db_config({"orders": "1", "users": "1"})
+        manifest = SyncManifest.load(tmp_path)
+        state, _ = _sync(db_config, tmp_path, manifest)
+        manifest.set(state.db_path, state.manifest)
+
+        state, rendered = _sync(db_config, tmp_path, None)
+
+        assert rendered == ["orders", "users", "users_view"]
+        assert state.tables_unchanged == 0
+
+    def test_deleted_output_is_rendered_again(self, tmp_path):
+        db_config = _mock_db_config({"orders": "1", "users": "1"})
+        manifest = SyncManifest.load(tmp_path)
+        state, _ = _sync(db_config, tmp_path, manifest)
+        manifest.set(state.db_path, state.manifest)
+        (state.db_path / "schema=public" / "table=users" / "columns.md").unlink()
+
+        _, rendered = _sync(db_config, tmp_path, manifest)
+
+        assert rendered == ["users", "users_view"]
+
+
+def fingerprint_of(table, value):
+    return SchemaMetadata(fingerprints={table: value}).fingerprint(table)
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from nao_core.commands.sync.providers.databases.provider import sync_database
-from nao_core.config.databases.base import DatabaseAccessor
+from nao_core.config.databases.base import CatalogTable, DatabaseAccessor
 
 
 @pytest.fixture
@@ -36,27 +36,36 @@ def create_mock_db_config(
     mock_config.get_database_name.return_value = database_name
     mock_config.get_schemas.return_value = schemas
     mock_config.matches_pattern.return_value = True
+    mock_config.sync_concurrency = None
+    mock_config.fetch_schema_metadata.return_value = None
+    mock_config.list_catalog.return_value = None
     mock_conn.list_tables.return_value = tables
 
     return mock_config
 
 
+def _raise(error):
+    raise error
+
+
 def create_mock_engine(templates, render_behavior):
     """Create a mock template engine with customizable behavior."""
     mock = MagicMock()
     mock.list_templates.return_value = templates
     mock.render.side_effect = render_behavior
+    mock.get_source.return_value = ""
+    mock.freeze.return_value = mock
     return mock
 
 
-def run_sync_with_mocks(db_config, engine, tmp_path, progress):
+def run_sync_with_mocks(db_config, engine, tmp_path, progress, jobs=None, sync_engine="threads"):
     """Run sync_database with patched console and engine, return state and console mock."""
     with patch("nao_core.commands.sync.providers.databases.provider.console") as mock_console:
         with patch(
             "nao_core.commands.sync.providers.databases.provider.get_template_engine",
             return_value=engine,
         ):
-            state = sync_database(db_config, tmp_path, progress, None)
+            state = sync_database(db_config, tmp_path, progress, None, jobs=jobs, sync_engine=sync_engine)
     return state, mock_console
 
 
@@ -162,3 +171,129 @@ class TestSyncDatabaseErrorLogging:
         assert "ANALYTICS.CUSTOMERS" in error_msg
         # Should have the actual error message
         assert "Test error message" in error_msg
+
+    def test_context_creation_error_only_fails_its_table(self, tmp_path, mock_progress):
+        """Test that a table whose context can't be created gets error stubs while the others still sync."""
+        db_config = create_mock_db_config(tables=["good", "bad"])
+        db_config.create_context.side_effect = lambda conn, schema, table, metadata: (
+            _raise(RuntimeError("no such table")) if table == "bad" else MagicMock()
+        )
+        engine = create_mock_engine(
+            templates=["databases/columns.md.j2", "databases/preview.md.j2"],
+            render_behavior=lambda *a, **kw: "ok",
+        )
+
+        state, mock_console = run_sync_with_mocks(db_config, engine, tmp_path, mock_progress)
+
+        all_output = [call.args[0] for call in mock_console.print.call_args_list if call.args]
+        error_lines = [line for line in all_output if "[bold red]✗[/bold red]" in line]
+        assert len(error_lines) == 1
+        assert "test_schema.bad" in error_lines[0]
+        assert "no such table" in error_lines[0]
+        assert any("2 total errors" in line for line in all_output)
+        assert state.tables_synced == 2
+
+        schema_path = tmp_path / "type=duckdb" / "database=test_database" / "schema=test_schema"
+        assert (schema_path / "table=good" / "columns.md").read_text() == "ok"
+        for filename in ("columns.md", "preview.md"):
+            content = (schema_path / "table=bad" / filename).read_text()
+            assert content == "# bad\n\nError generating content: no such table"
+
+    def test_parallel_sync_counts_every_error(self, tmp_path, mock_progress):
+        """Test that errors from tables rendered on worker threads are all counted."""
+        tables = [f"table_{i}" for i in range(8)]
+        db_config = create_mock_db_config(tables=tables)
+        engine = create_mock_engine(
+            templates=["databases/columns.md.j2", "databases/preview.md.j2"],
+            render_behavior=RuntimeError("boom"),
+        )
+
+        state, mock_console = run_sync_with_mocks(db_config, engine, tmp_path, mock_progress, jobs=4)
+
+        all_output = [call.args[0] for call in mock_console.print.call_args_list if call.args]
+        error_lines = [line for line in all_output if "[bold red]✗[/bold red]" in line]
+        assert len(error_lines) == 16
+        assert any("(16 errors)" in line for line in all_output)
+        assert any("16 total errors" in line for line in all_output)
+        assert state.tables_synced == 8
+        # Each worker thread renders with its own connection
+        assert 1 <= db_config.connect_for_thread.call_count <= 4
+        table_advances = [c for c in mock_progress.update.call_args_list if c.kwargs.get("advance") == 1]
+        # One advance per table, plus one for the schema
+        assert len(table_advances) == 9
+
+    def test_async_engine_counts_every_error(self, tmp_path, mock_progress):
+        """Test that the async engine renders every table and skips schemas that can't be listed."""
+        db_config = create_mock_db_config(schemas=["a", "b", "broken"], tables=[f"table_{i}" for i in range(4)])
+        listed = db_config.connect.return_value.list_tables
+        listed.side_effect = lambda database: (
+            _raise(RuntimeError("no access")) if database == "broken" else [f"table_{i}" for i in range(4)]
+        )
+        engine = create_mock_engine(templates=["databases/columns.md.j2"], render_behavior=RuntimeError("boom"))
+        db_config.connect_for_thread.return_value = db_config.connect.return_value
+
+        state, mock_console = run_sync_with_mocks(
+            db_config, engine, tmp_path, mock_progress, jobs=3, sync_engine="async"
+        )
+
+        all_output = [call.args[0] for call in mock_console.print.call_args_list if call.args]
+        assert any("Skipping schema" in line and "broken" in line for line in all_output)
+        assert any("8 total errors" in line for line in all_output)
+        assert state.tables_synced == 8
+        assert state.synced_schemas == {"a", "b"}
+        # The first connection is the one of the sync, the others are opened when needed
+        assert db_config.connect_for_thread.call_count <= 2
+
+    def test_schema_metadata_is_fetched_once_per_schema(self, tmp_path, mock_progress):
+        """Test that every table of a schema shares the metadata prefetched for that schema."""
+        db_config = create_mock_db_config(schemas=["a", "b"], tables=["t1", "t2", "t3"])
+        metadata = {schema: MagicMock(name=f"metadata_{schema}") for schema in ("a", "b")}
+        for schema_metadata in metadata.values():
+            schema_metadata.fingerprint.return_value = None
+        db_config.fetch_schema_metadata.side_effect = lambda conn, schema: metadata[schema]
+        engine = create_mock_engine(templates=["databases/columns.md.j2"], render_behavior=lambda *a, **kw: "ok")
+
+        run_sync_with_mocks(db_config, engine, tmp_path, mock_progress, jobs=2)
+
+        assert db_config.fetch_schema_metadata.call_count == 2
+        for call in db_config.create_context.call_args_list:
+            _, schema, _, schema_metadata = call.args
+            assert schema_metadata is metadata[schema]
+
+    def test_tables_are_listed_from_the_catalog(self, tmp_path, mock_progress):
+        """Test that a catalog listing replaces listing schemas and tables one schema at a time."""
+        db_config = create_mock_db_config()
+        db_config.list_catalog.return_value = [
+            CatalogTable("sales", "orders", "table"),
+            CatalogTable("sales", "orders_view", "view"),
+            CatalogTable("scratch", "tmp", "table"),
+        ]
+        db_config.schema_matches.side_effect = lambda schema: schema != "scratch"
+        engine = create_mock_engine(templates=["databases/columns.md.j2"], render_behavior=lambda *a, **kw: "ok")
+
+        state, _ = run_sync_with_mocks(db_config, engine, tmp_path, mock_progress)
+
+        assert state.synced_tables == {"sales": {"orders", "orders_view"}}
+        db_config.get_schemas.assert_not_called()
+        db_config.connect.return_value.list_tables.assert_not_called()
+        metadata = db_config.create_context.call_args.args[3]
+        assert metadata.table_types == {"orders": "table", "orders_view": "view"}
+
+    def test_unchanged_files_are_not_rewritten(self, tmp_path, mock_progress):
+        """Test that a re-sync leaves files with identical content untouched."""
+        db_config = create_mock_db_config(tables=["t1", "t2"])
+        contents = {"databases/columns.md.j2": "columns", "databases/preview.md.j2": "preview"}
+        engine = create_mock_engine(
+            templates=list(contents), render_behavior=lambda template, *a, **kw: contents[template]
+        )
+
+        first, _ = run_sync_with_mocks(db_config, engine, tmp_path, mock_progress)
+        columns_file = next(tmp_path.rglob("columns.md"))
+        mtime = columns_file.stat().st_mtime_ns
+        contents["databases/preview.md.j2"] = "new preview"
+        second, _ = run_sync_with_mocks(db_config, engine, tmp_path, mock_progress)
+
+        assert (first.files_written, first.files_unchanged) == (4, 0)
+        assert (second.files_written, second.files_unchanged) == (2, 2)
+        assert columns_file.stat().st_mtime_ns == mtime
+        assert {p.read_text() for p in tmp_path.rglob("preview.md")} == {"new preview"}
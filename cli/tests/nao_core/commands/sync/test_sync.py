@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from nao_core.commands.sync import sync
-from nao_core.commands.sync.providers import ProviderSelection, SyncProvider, SyncResult
+from nao_core.commands.sync.providers import ProviderSelection, SyncOptions, SyncProvider, SyncResult
 
 
 def _make_provider(
@@ -70,6 +70,43 @@ class TestSyncCommand:
         call_args = selection.provider.sync.call_args
         assert str(call_args[0][1]) == custom_output
 
+    def test_sync_passes_jobs_to_providers(self, create_config):
+        create_config()
+        selection = _make_provider(items=["item1"], items_synced=1)
+
+        with patch("nao_core.commands.sync.console"):
+            sync(jobs=4, _providers=[selection])
+
+        assert selection.provider.sync.call_args.kwargs["options"] == SyncOptions(jobs=4)
+
+    def test_sync_full_disables_incremental_sync(self, create_config):
+        create_config()
+        selection = _make_provider(items=["item1"], items_synced=1)
+
+        with patch("nao_core.commands.sync.console"):
+            sync(full=True, _providers=[selection])
+
+        assert selection.provider.sync.call_args.kwargs["options"].full is True
+
+    def test_sync_passes_engine_to_providers(self, create_config):
+        create_config()
+        selection = _make_provider(items=["item1"], items_synced=1)
+
+        with patch("nao_core.commands.sync.console"):
+            sync(engine="async", _providers=[selection])
+
+        assert selection.provider.sync.call_args.kwargs["options"].engine == "async"
+
+    def test_sync_rejects_invalid_jobs(self, create_config):
+        create_config()
+        selection = _make_provider()
+
+        with patch("nao_core.commands.sync.console"):
+            with pytest.raises(SystemExit):
+                sync(jobs=0, _providers=[selection])
+
+        selection.provider.sync.assert_not_called()
+
     def test_sync_skips_provider_when_should_sync_false(self, create_config):
         create_config()
         selection = _make_provider(should_sync=False)
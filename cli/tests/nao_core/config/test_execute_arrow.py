@@ -0,0 +1,87 @@
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+
+from nao_core.config.databases.postgres import PostgresConfig
+
+
+class DBAPICursor:
+    """Cursor of a driver without native Arrow support."""
+
+    def __init__(self, description, rows):
+        self.description = description
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+def _config() -> PostgresConfig:
+    return PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+
+
+def _conn(cursor) -> MagicMock:
+    conn = MagicMock()
+    conn.raw_sql.return_value = cursor
+    return conn
+
+
+def test_execute_arrow_builds_table_from_rows():
+    cursor = DBAPICursor([("id",), ("amount",)], [(1, Decimal("1.50")), (2, None)])
+
+    table = _config().execute_arrow("SELECT 1", conn=_conn(cursor))
+
+    assert table.column_names == ["id", "amount"]
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("amount").to_pylist() == [Decimal("1.50"), None]
+
+
+def test_execute_arrow_handles_mixed_type_columns():
+    cursor = DBAPICursor([("value",)], [(1,), ("a",)])
+
+    table = _config().execute_arrow("SELECT 1", conn=_conn(cursor))
+
+    assert table.column("value").to_pylist() == ["1", "a"]
+
+
+def test_execute_arrow_uses_native_fetch():
+    expected = pa.table({"id": [1]})
+    cursor = MagicMock(spec=["fetch_arrow_all", "description"])
+    cursor.fetch_arrow_all.return_value = expected
+
+    assert _config().execute_arrow("SELECT 1", conn=_conn(cursor)) is expected
+
+
+def test_execute_arrow_native_fetch_empty_result():
+    cursor = MagicMock(spec=["fetch_arrow_all", "description"])
+    cursor.fetch_arrow_all.return_value = None
+    cursor.description = [("id",)]
+
+    table = _config().execute_arrow("SELECT 1", conn=_conn(cursor))
+
+    assert table.column_names == ["id"]
+    assert table.num_rows == 0
+
+
+def test_open_cursor_uses_fetchmany():
+    cursor = MagicMock(spec=["description", "fetchmany", "close"])
+    cursor.description = [("id",)]
+    cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    result = _config().open_cursor("SELECT 1", conn=_conn(cursor), batch_size=2)
+
+    assert result.fetch(10)["id"].tolist() == [1, 2, 3]
+    result.close()
+    cursor.close.assert_called_once()
+
+
+def test_execute_arrow_statement_without_result_set():
+    cursor = MagicMock(spec=["description", "fetchall"])
+    cursor.description = None
+    cursor.fetchall.side_effect = RuntimeError("no results to fetch")
+
+    table = _config().execute_arrow("CREATE TABLE t (id INT)", conn=_conn(cursor))
+
+    assert table.num_columns == 0
+    assert table.num_rows == 0
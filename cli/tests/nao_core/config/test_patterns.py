@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+from nao_core.config.databases import DuckDBConfig, SnowflakeConfig
+from nao_core.config.databases.patterns import TablePatterns
+
+
+def test_include_and_exclude_patterns():
+    """Test that a table must match an include pattern and no exclude pattern."""
+    patterns = TablePatterns(include=["prod_*.*", "analytics.dim_*"], exclude=["*.backup_*"])
+
+    assert patterns.matches("prod_sales", "orders")
+    assert patterns.matches("analytics", "dim_users")
+    assert not patterns.matches("analytics", "fact_orders")
+    assert not patterns.matches("prod_sales", "backup_orders")
+    assert not patterns.matches("dev", "orders")
+
+
+def test_no_patterns_match_everything():
+    """Test that empty include and exclude lists keep every table."""
+    patterns = TablePatterns(include=[], exclude=[])
+
+    assert patterns.matches("any", "table")
+    assert patterns.matches_schema("any")
+
+
+def test_matching_is_case_sensitive_by_default():
+    """Test that patterns only ignore case when asked to."""
+    assert not TablePatterns(include=["ANALYTICS.*"], exclude=[]).matches("analytics", "users")
+    assert TablePatterns(include=["ANALYTICS.*"], exclude=[], ignore_case=True).matches("analytics", "users")
+
+
+def test_schema_pruning():
+    """Test that only schemas which can't hold a matching table are pruned."""
+    patterns = TablePatterns(include=["prod_*.*", "analytics.dim_*", "stage*"], exclude=["prod_tmp.*", "*.tmp_*"])
+
+    assert patterns.matches_schema("prod_sales")
+    assert patterns.matches_schema("analytics")
+    # A wildcard in a pattern without a dot may span the schema/table separator
+    assert patterns.matches_schema("stage_2024")
+    assert not patterns.matches_schema("dev")
+    assert not patterns.matches_schema("prod_tmp")
+
+
+def test_get_schemas_prunes_excluded_schemas():
+    """Test that get_schemas leaves out schemas excluded by the patterns, for every backend."""
+    config = DuckDBConfig(name="db", path=":memory:", exclude=["scratch.*"])
+    conn = MagicMock()
+    conn.list_databases.return_value = ["main", "scratch"]
+
+    assert config.get_schemas(conn) == ["main"]
+
+
+def test_snowflake_patterns_ignore_case():
+    """Test that Snowflake patterns match identifiers case-insensitively."""
+    config = SnowflakeConfig(
+        name="sf", username="u", account_id="acc", password="p", database="db", include=["analytics.*"]
+    )
+    conn = MagicMock()
+    conn.list_databases.return_value = ["ANALYTICS", "RAW", "INFORMATION_SCHEMA"]
+
+    assert config.get_schemas(conn) == ["ANALYTICS"]
+    assert config.matches_pattern("ANALYTICS", "USERS")
+    assert config.patterns is config.patterns
+
+
+def test_copies_recompile_their_patterns():
+    """Test that a copy with other patterns doesn't reuse the compiled patterns of the original."""
+    config = DuckDBConfig(name="db", path=":memory:")
+    assert config.matches_pattern("main", "orders")
+
+    copy = config.model_copy(update={"exclude": ["main.orders"]})
+
+    assert not copy.matches_pattern("main", "orders")
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+
+from nao_core.config.databases import DatabricksConfig, PostgresConfig, SnowflakeConfig, TrinoConfig
+
+
+def test_postgres_sets_statement_timeout():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p", query_timeout_s=2.5)
+
+    with patch("ibis.postgres.connect") as connect:
+        config.connect()
+
+    assert connect.call_args.kwargs["options"] == "-c statement_timeout=2500"
+
+
+def test_postgres_without_timeout():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p")
+
+    with patch("ibis.postgres.connect") as connect:
+        config.connect()
+
+    assert "options" not in connect.call_args.kwargs
+
+
+def test_snowflake_sets_session_timeout():
+    config = SnowflakeConfig(name="sf", username="u", account_id="acc", password="p", database="db", query_timeout_s=30)
+
+    with patch("ibis.snowflake.connect") as connect:
+        config.connect()
+
+    assert connect.call_args.kwargs["session_parameters"] == {"STATEMENT_TIMEOUT_IN_SECONDS": 30}
+
+
+def test_trino_sets_query_max_run_time():
+    config = TrinoConfig(name="trino", host="h", user="u", catalog="c", query_timeout_s=45)
+
+    with patch("ibis.trino.connect") as connect:
+        config.connect()
+
+    assert connect.call_args.kwargs["session_properties"] == {"query_max_run_time": "45s"}
+
+
+def test_databricks_sets_statement_timeout():
+    config = DatabricksConfig(name="dbx", server_hostname="h", http_path="/p", access_token="t", query_timeout_s=60)
+
+    with patch("ibis.databricks.connect") as connect:
+        config.connect()
+
+    assert connect.call_args.kwargs["session_configuration"] == {"STATEMENT_TIMEOUT": "60"}
+
+
+def test_postgres_cancel_uses_driver_cancel():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p")
+    conn = MagicMock()
+
+    assert config.cancel(conn) is True
+    conn.con.cancel.assert_called_once()
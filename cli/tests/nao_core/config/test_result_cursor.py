@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from nao_core.config.databases import DuckDBConfig, base
+from nao_core.config.databases.base import ResultCursor
+from nao_core.config.databases.postgres import PostgresConfig
+
+
+def _cursor(*sizes: int) -> ResultCursor:
+    start = 0
+    batches = []
+    for size in sizes:
+        batches.append(pd.DataFrame({"id": range(start, start + size)}))
+        start += size
+    return ResultCursor(["id"], iter(batches))
+
+
+def test_fetch_spans_and_splits_batches():
+    cursor = _cursor(3, 0, 4)
+
+    first = cursor.fetch(5)
+    assert first["id"].tolist() == [0, 1, 2, 3, 4]
+    assert cursor.has_more()
+
+    second = cursor.fetch(5)
+    assert second["id"].tolist() == [5, 6]
+    assert second.index.tolist() == [0, 1]
+    assert not cursor.has_more()
+
+
+def test_fetch_empty_result_keeps_columns():
+    cursor = _cursor()
+
+    result = cursor.fetch(10)
+
+    assert list(result.columns) == ["id"]
+    assert len(result) == 0
+    assert not cursor.has_more()
+
+
+def test_open_cursor_reads_duckdb_incrementally():
+    config = DuckDBConfig(name="duck", path=":memory:")
+    conn = config.connect()
+
+    cursor = config.open_cursor("SELECT range AS id FROM range(5000)", conn=conn)
+    page = cursor.fetch(3000)
+
+    assert page["id"].tolist() == list(range(3000))
+    assert cursor.has_more()
+    assert cursor.fetch(3000)["id"].tolist() == list(range(3000, 5000))
+    assert not cursor.has_more()
+
+
+def test_execute_arrow_limit_duckdb():
+    config = DuckDBConfig(name="duck", path=":memory:")
+
+    table = config.execute_arrow("SELECT range AS id FROM range(5000)", limit=2500)
+
+    assert table.num_rows == 2500
+
+
+def test_execute_sql_reads_dbapi_cursor_in_batches(monkeypatch):
+    class Cursor:
+        description = [("id",)]
+
+        def __init__(self):
+            self._rows = [(i,) for i in range(5)]
+            self.calls = 0
+
+        def fetchmany(self, size):
+            self.calls += 1
+            rows, self._rows = self._rows[:size], self._rows[size:]
+            return rows
+
+    monkeypatch.setattr(base, "FETCH_BATCH_SIZE", 2)
+    cursor = Cursor()
+    conn = MagicMock()
+    conn.raw_sql.return_value = cursor
+    config = PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+
+    df = config.execute_sql("SELECT id", conn=conn)
+
+    assert df["id"].tolist() == [0, 1, 2, 3, 4]
+    assert df.index.tolist() == [0, 1, 2, 3, 4]
+    assert cursor.calls == 4
+
+
+def test_ping_closes_dbapi_cursor():
+    conn = MagicMock()
+    config = PostgresConfig(name="pg", host="localhost", database="db", user="u", password="p")
+
+    assert config.ping(conn)
+    conn.raw_sql.return_value.close.assert_called_once()
+
+
+def test_ping_keeps_duckdb_connection_open():
+    config = DuckDBConfig(name="duck", path=":memory:")
+    conn = config.connect()
+
+    assert config.ping(conn)
+    assert config.execute_sql("SELECT 1 AS one", conn=conn)["one"].tolist() == [1]
@@ -0,0 +1,200 @@
+from unittest.mock import MagicMock
+
+import ibis
+
+from nao_core.config.databases import (
+    BigQueryConfig,
+    DatabricksConfig,
+    DuckDBConfig,
+    PostgresConfig,
+    RedshiftConfig,
+    SnowflakeConfig,
+)
+from nao_core.config.databases.base import CatalogTable
+from nao_core.config.databases.context import SchemaMetadata
+
+
+def _conn_returning(*results):
+    """Connection whose successive raw_sql calls return `results` (iterable and via fetchall)."""
+    conn = MagicMock()
+    cursors = []
+    for rows in results:
+        cursor = MagicMock()
+        cursor.fetchall.return_value = rows
+        cursor.__iter__.side_effect = lambda rows=rows: iter(rows)
+        cursors.append(cursor)
+    conn.raw_sql.side_effect = cursors
+    return conn
+
+
+def test_postgres_prefetches_descriptions_in_one_query():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p")
+    conn = _conn_returning(
+        [
+            ("users", 0, None, " App users "),
+            ("users", 1, "id", "Primary key"),
+            ("orders", 2, "amount", "Total in cents"),
+            ("orders", 0, None, ""),
+        ],
+        [("users", 10.0, 10, 0, 0, "abc")],
+    )
+
+    metadata = config.fetch_schema_metadata(conn, "public")
+
+    assert metadata.descriptions == {"users": "App users"}
+    assert metadata.column_descriptions == {"users": {"id": "Primary key"}, "orders": {"amount": "Total in cents"}}
+    assert metadata.fingerprints == {"users": "10.0|10|0|0|abc"}
+    assert metadata.row_counts == {"users": 10}
+
+    ctx = config.create_context(conn, "public", "orders", metadata)
+    assert ctx.description() is None
+    assert ctx._fetch_column_descriptions() == {"amount": "Total in cents"}
+    assert conn.raw_sql.call_count == 2
+
+
+def test_snowflake_prefetches_comments_and_clustering_keys():
+    config = SnowflakeConfig(name="sf", username="u", account_id="acc", password="p", database="db")
+    conn = _conn_returning(
+        [
+            ("EVENTS", "Raw events", 'LINEAR(EVENT_DATE, "USER_ID")', "BASE TABLE", "2024-01-01", 10, 512),
+            ("USERS", None, None, "VIEW", "2024-01-01", None, None),
+        ],
+        [("EVENTS", "EVENT_DATE", "Day of the event")],
+    )
+
+    metadata = config.fetch_schema_metadata(conn, "ANALYTICS")
+
+    events = config.create_context(conn, "ANALYTICS", "EVENTS", metadata)
+    users = config.create_context(conn, "ANALYTICS", "USERS", metadata)
+    assert events.description() == "Raw events"
+    assert events.partition_columns() == ["EVENT_DATE", "USER_ID"]
+    assert events._fetch_column_descriptions() == {"EVENT_DATE": "Day of the event"}
+    assert users.description() is None
+    assert users.partition_columns() == []
+    assert users._fetch_column_descriptions() == {}
+    assert metadata.fingerprints == {"EVENTS": "2024-01-01|10|512"}
+    assert events.row_count() == 10
+    assert events.row_count_is_approximate() is True
+    assert conn.raw_sql.call_count == 2
+
+
+def test_bigquery_prefetches_partitioning_before_clustering():
+    config = BigQueryConfig(name="bq", project_id="proj")
+    conn = _conn_returning(
+        [("events", '"Raw events"')],
+        [("events", "user_id", "Who")],
+        [
+            ("events", "country", "NO", 2),
+            ("events", "day", "YES", None),
+            ("events", "user_id", "NO", 1),
+            ("daily", "day", "YES", 1),
+        ],
+        [("events", 1700000000000, 42, 1024)],
+    )
+
+    metadata = config.fetch_schema_metadata(conn, "dataset")
+
+    assert metadata.descriptions == {"events": "Raw events"}
+    assert metadata.column_descriptions == {"events": {"user_id": "Who"}}
+    assert metadata.partition_columns == {"events": ["day", "user_id", "country"], "daily": ["day"]}
+    assert config.create_context(conn, "dataset", "other", metadata).partition_columns() == []
+    assert metadata.fingerprints == {"events": "1700000000000|42|1024"}
+    assert metadata.row_counts == {"events": 42}
+    assert conn.raw_sql.call_count == 4
+
+
+def test_redshift_columns_use_prefetched_rows():
+    config = RedshiftConfig(name="rs", host="h", database="db", user="u", password="p")
+    conn = _conn_returning(
+        [("users", 1, "id", "Primary key")],
+        [
+            ("users", "id", "integer", "NO", None, 32, 0),
+            ("users", "email", "character varying", "YES", 256, None, None),
+        ],
+        [("users", 100, 98, 5)],
+    )
+
+    metadata = config.fetch_schema_metadata(conn, "public")
+    columns = config.create_context(conn, "public", "users", metadata).columns()
+
+    assert columns == [
+        {"name": "id", "type": "int32 NOT NULL", "nullable": False, "description": "Primary key"},
+        {"name": "email", "type": "string", "nullable": True, "description": None},
+    ]
+    assert metadata.fingerprints == {"users": "100|98|5"}
+    assert metadata.row_counts == {"users": 98}
+    assert conn.raw_sql.call_count == 3
+
+
+def test_context_queries_per_table_without_metadata():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p")
+    conn = _conn_returning([("id", "Primary key")])
+
+    ctx = config.create_context(conn, "public", "users", SchemaMetadata())
+
+    assert ctx._fetch_column_descriptions() == {"id": "Primary key"}
+    assert conn.raw_sql.call_count == 1
+
+
+def test_fingerprint_changes_with_table_metadata():
+    metadata = SchemaMetadata(fingerprints={"users": "2024-01-01|10"}, descriptions={"users": "Users"})
+    fingerprint = metadata.fingerprint("users")
+
+    assert metadata.fingerprint("users_view") is None
+    metadata.descriptions = {"users": "App users"}
+    assert metadata.fingerprint("users") != fingerprint
+
+
+def test_fingerprints_are_optional():
+    config = PostgresConfig(name="pg", host="h", database="db", user="u", password="p")
+    conn = MagicMock()
+    conn.raw_sql.side_effect = [MagicMock(fetchall=MagicMock(return_value=[])), RuntimeError("permission denied")]
+
+    metadata = config.fetch_schema_metadata(conn, "public")
+
+    assert metadata.fingerprints is None
+    assert metadata.fingerprint("users") is None
+
+
+def test_databricks_row_count_from_table_statistics():
+    config = DatabricksConfig(name="dbx", server_hostname="h", http_path="/sql", access_token="t", catalog="main")
+    conn = _conn_returning([("id", "bigint", None), ("Statistics", "1024 bytes, 42 rows", "")])
+
+    ctx = config.create_context(conn, "sales", "orders")
+
+    assert ctx.row_count() == 42
+    assert ctx.row_count_is_approximate() is True
+
+
+def test_duckdb_lists_catalog_in_one_query():
+    config = DuckDBConfig(name="db")
+    conn = ibis.duckdb.connect()
+    conn.raw_sql("CREATE TABLE users (id INT); CREATE VIEW active_users AS SELECT * FROM users")
+    conn.raw_sql("CREATE SCHEMA staging; CREATE TABLE staging.events (id INT)")
+
+    catalog = config.list_catalog(conn)
+
+    assert catalog is not None
+    assert sorted(catalog, key=lambda t: (t.schema, t.table)) == [
+        CatalogTable("main", "active_users", "view"),
+        CatalogTable("main", "users", "table"),
+        CatalogTable("staging", "events", "table"),
+    ]
+
+
+def test_catalog_table_types_are_normalized():
+    config = SnowflakeConfig(name="sf", username="u", account_id="acc", password="p", database="db")
+    conn = _conn_returning(
+        [
+            ("PUBLIC", "ORDERS", "BASE TABLE", "2024-01-01"),
+            ("PUBLIC", "DAILY", "MATERIALIZED VIEW", None),
+            ("PUBLIC", "ACTIVE", "VIEW", None),
+        ]
+    )
+
+    catalog = config.list_catalog(conn)
+
+    assert catalog is not None
+    assert [t.table_type for t in catalog] == ["table", "materialized view", "view"]
+    assert catalog[0].last_altered == "2024-01-01"
+    assert "INFORMATION_SCHEMA.TABLES" in conn.raw_sql.call_args.args[0]
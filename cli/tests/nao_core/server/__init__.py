@@ -0,0 +1 @@
+"""Tests for the SQL service runtime helpers."""
@@ -0,0 +1,53 @@
+"""Unit tests for cancelling queries running in worker threads."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nao_core.config.databases import DuckDBConfig
+from nao_core.server.cancellation import QueryCancelledError, QueryHandle, QueryTimeoutError
+
+SLOW_SQL = "SELECT sum(a.range * b.range) FROM range(100000000) a, range(100000) b"
+
+
+def test_timeout_interrupts_duckdb_query():
+    config = DuckDBConfig(name="duck", path=":memory:", query_timeout_s=0.2)
+    conn = config.connect()
+
+    with pytest.raises(QueryTimeoutError, match="0.2s query timeout"):
+        with QueryHandle().running(config, conn):
+            config.execute_sql(SLOW_SQL, conn=conn)
+
+    # The connection stays usable after the interrupt
+    assert config.ping(conn)
+
+
+def test_cancel_before_start_prevents_query():
+    config = MagicMock(query_timeout_s=None)
+    handle = QueryHandle()
+
+    assert handle.cancel("client disconnected") is True
+    with pytest.raises(QueryCancelledError, match="client disconnected"):
+        with handle.running(config, MagicMock()):
+            pytest.fail("query should not start")
+
+
+def test_cancel_running_query_uses_backend_cancel():
+    config = MagicMock(query_timeout_s=None)
+    conn = MagicMock()
+    handle = QueryHandle()
+
+    with pytest.raises(QueryCancelledError):
+        with handle.running(config, conn):
+            handle.cancel("client disconnected")
+            raise RuntimeError("interrupted by the driver")
+
+    config.cancel.assert_called_once_with(conn)
+
+
+def test_errors_pass_through_when_not_cancelled():
+    config = MagicMock(query_timeout_s=None)
+
+    with pytest.raises(RuntimeError, match="syntax error"):
+        with QueryHandle().running(config, MagicMock()):
+            raise RuntimeError("syntax error")
@@ -0,0 +1,81 @@
+"""Unit tests for the SQL service config cache."""
+
+import os
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from nao_core.config import NaoConfig, NaoConfigError
+from nao_core.config.databases import DuckDBConfig
+from nao_core.server.config_cache import ConfigCache
+
+CONFIG = """project_name: test-project
+databases:
+  - name: local
+    type: duckdb
+    path: warehouse.duckdb
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "nao_config.yaml").write_text(CONFIG)
+    return tmp_path
+
+
+def _touch_later(path: Path, content: str) -> None:
+    """Rewrite a file and bump its mtime so the change is visible even on coarse filesystems."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigCache:
+    def test_returns_cached_config_while_file_is_unchanged(self, project):
+        cache = ConfigCache()
+
+        with patch.object(NaoConfig, "load", wraps=NaoConfig.load) as mock_load:
+            first = cache.get(project)
+            second = cache.get(project)
+
+        assert first is second
+        mock_load.assert_called_once()
+
+    def test_reloads_when_file_changes(self, project):
+        cache = ConfigCache()
+        first = cache.get(project)
+
+        _touch_later(project / "nao_config.yaml", CONFIG.replace("test-project", "renamed"))
+        second = cache.get(project)
+
+        assert first.project_name == "test-project"
+        assert second.project_name == "renamed"
+
+    def test_invalidate_forces_reload(self, project):
+        cache = ConfigCache()
+        first = cache.get(project)
+
+        cache.invalidate()
+
+        assert cache.get(project) is not first
+
+    def test_does_not_change_working_directory(self, project, tmp_path_factory, monkeypatch):
+        cwd = tmp_path_factory.mktemp("elsewhere")
+        monkeypatch.chdir(cwd)
+
+        ConfigCache().get(project)
+
+        assert Path.cwd() == cwd
+
+    def test_anchors_relative_paths_at_project(self, project):
+        config = ConfigCache().get(project)
+
+        database = config.databases[0]
+        assert isinstance(database, DuckDBConfig)
+        assert database.path == str(project.resolve() / "warehouse.duckdb")
+
+    def test_raises_when_config_is_missing(self, tmp_path):
+        with pytest.raises(NaoConfigError, match=re.escape(str(tmp_path.resolve()))):
+            ConfigCache().get(tmp_path)
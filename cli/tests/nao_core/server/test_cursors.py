@@ -0,0 +1,107 @@
+"""Unit tests for the SQL service result cursors."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from nao_core.server.cursors import CursorNotFoundError, CursorRegistry
+from nao_core.server.pool import ConnectionPool
+
+from .test_pool import FakeDatabaseConfig
+
+
+@pytest.fixture
+def pool():
+    return ConnectionPool()
+
+
+def _open(registry: CursorRegistry, pool: ConnectionPool, name: str = "db"):
+    cursor = MagicMock()
+    lease = pool.acquire("/project", FakeDatabaseConfig(name=name))
+    return registry.register(cursor, lease, page_size=10), cursor
+
+
+class TestCursorRegistry:
+    def test_checkout_and_checkin(self, pool):
+        registry = CursorRegistry(pool)
+        cursor_id, cursor = _open(registry, pool)
+
+        entry = registry.checkout(cursor_id)
+
+        assert entry.cursor is cursor
+        assert entry.page_size == 10
+        assert registry.key(cursor_id) == ("/project", "db")
+        with pytest.raises(CursorNotFoundError):
+            registry.checkout(cursor_id)  # Already being read
+
+        registry.checkin(entry)
+        assert registry.checkout(cursor_id) is entry
+
+    def test_finish_returns_connection_to_pool(self, pool):
+        registry = CursorRegistry(pool)
+        cursor_id, cursor = _open(registry, pool)
+
+        registry.finish(registry.checkout(cursor_id))
+
+        cursor.close.assert_called_once()
+        assert len(registry) == 0
+        assert pool.stats() == {("/project", "db"): {"idle": 1, "in_use": 0}}
+
+    def test_close_unknown_cursor(self, pool):
+        registry = CursorRegistry(pool)
+
+        assert registry.close("missing") is False
+        with pytest.raises(CursorNotFoundError):
+            registry.key("missing")
+
+    def test_close_while_reading_defers_disposal(self, pool):
+        registry = CursorRegistry(pool)
+        cursor_id, cursor = _open(registry, pool)
+
+        entry = registry.checkout(cursor_id)
+        assert registry.close(cursor_id) is True
+        cursor.close.assert_not_called()
+
+        registry.checkin(entry)
+
+        cursor.close.assert_called_once()
+        assert pool.stats()[("/project", "db")]["in_use"] == 0
+
+    def test_evicts_expired_cursors(self, pool):
+        registry = CursorRegistry(pool, ttl_s=0.01)
+        cursor_id, cursor = _open(registry, pool)
+
+        time.sleep(0.02)
+        with pytest.raises(CursorNotFoundError):
+            registry.checkout(cursor_id)
+
+        assert registry.evict_expired() == 1
+        cursor.close.assert_called_once()
+        assert pool.stats()[("/project", "db")]["in_use"] == 0
+
+    def test_max_open_closes_least_recently_used(self, pool):
+        registry = CursorRegistry(pool, max_open=2)
+        first_id, first = _open(registry, pool, name="a")
+        second_id, _ = _open(registry, pool, name="b")
+        registry.checkin(registry.checkout(first_id))
+
+        _open(registry, pool, name="c")
+
+        assert len(registry) == 2
+        registry.key(first_id)
+        with pytest.raises(CursorNotFoundError):
+            registry.key(second_id)
+
+    def test_open_cursors_leave_a_connection_for_other_queries(self):
+        pool = ConnectionPool(max_size=2, acquire_timeout_s=0.1)
+        registry = CursorRegistry(pool)
+        first_id, first = _open(registry, pool)
+        _open(registry, pool)
+
+        # The oldest idle cursor of the database was closed to stay below the pool size
+        first.close.assert_called_once()
+        with pytest.raises(CursorNotFoundError):
+            registry.key(first_id)
+        with pool.connection("/project", FakeDatabaseConfig()):
+            pass
@@ -0,0 +1,106 @@
+"""Unit tests for the SQL service query executor."""
+
+import asyncio
+import threading
+import time
+
+from nao_core.server.executor import QueryExecutor
+
+
+class ConcurrencyTracker:
+    """Blocking callable recording how many calls overlap."""
+
+    def __init__(self, duration: float = 0.05):
+        self.duration = duration
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.duration)
+        with self._lock:
+            self.active -= 1
+        return threading.current_thread().name
+
+
+class TestQueryExecutor:
+    def test_runs_call_in_worker_thread(self):
+        executor = QueryExecutor()
+
+        thread_name = asyncio.run(executor.run("db", lambda: threading.current_thread().name))
+
+        assert thread_name.startswith("nao-sql")
+        executor.shutdown()
+
+    def test_propagates_exceptions(self):
+        executor = QueryExecutor()
+
+        def fail():
+            raise ValueError("boom")
+
+        async def main():
+            try:
+                await executor.run("db", fail)
+            except ValueError as e:
+                return str(e)
+
+        assert asyncio.run(main()) == "boom"
+        assert executor.running == 0
+        assert executor.queue_depth == 0
+        executor.shutdown()
+
+    def test_limits_concurrency_per_key(self):
+        executor = QueryExecutor(max_workers=4, per_key_limit=1)
+        tracker = ConcurrencyTracker()
+
+        async def main():
+            await asyncio.gather(*(executor.run("db", tracker) for _ in range(3)))
+
+        asyncio.run(main())
+
+        assert tracker.max_active == 1
+        executor.shutdown()
+
+    def test_different_keys_run_concurrently(self):
+        executor = QueryExecutor(max_workers=4, per_key_limit=1)
+        tracker = ConcurrencyTracker(duration=0.1)
+
+        async def main():
+            await asyncio.gather(executor.run("db-a", tracker), executor.run("db-b", tracker))
+
+        asyncio.run(main())
+
+        assert tracker.max_active == 2
+        executor.shutdown()
+
+    def test_drops_limits_of_unused_keys(self):
+        executor = QueryExecutor(max_workers=2, per_key_limit=1)
+        tracker = ConcurrencyTracker()
+
+        async def main():
+            await asyncio.gather(*(executor.run(f"db-{i}", tracker) for i in range(3)), executor.run("db-0", tracker))
+
+        asyncio.run(main())
+
+        assert executor._limits == {}
+        executor.shutdown()
+
+    def test_reports_queue_depth(self):
+        executor = QueryExecutor(max_workers=1, per_key_limit=1)
+        tracker = ConcurrencyTracker(duration=0.1)
+        depths = []
+
+        async def main():
+            tasks = [asyncio.ensure_future(executor.run("db", tracker)) for _ in range(3)]
+            await asyncio.sleep(0.02)
+            depths.append((executor.running, executor.queue_depth))
+            await asyncio.gather(*tasks)
+            depths.append((executor.running, executor.queue_depth))
+
+        asyncio.run(main())
+
+        assert depths == [(1, 2), (0, 0)]
+        executor.shutdown()
@@ -0,0 +1,61 @@
+"""Unit tests for the SQL service metrics registry."""
+
+import pytest
+
+from nao_core.server.metrics import MetricsRegistry
+
+
+def test_counter_renders_per_label_values():
+    registry = MetricsRegistry()
+    rows = registry.counter("rows_total", "Rows returned", ["database"])
+
+    rows.inc(3, database="warehouse")
+    rows.inc(database="warehouse")
+    rows.inc(2, database='quoted "db"')
+
+    assert registry.render() == (
+        "# HELP rows_total Rows returned\n"
+        "# TYPE rows_total counter\n"
+        'rows_total{database="quoted \\"db\\""} 2\n'
+        'rows_total{database="warehouse"} 4\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ["database"], buckets=[0.1, 1])
+
+    latency.observe(0.05, database="db")
+    latency.observe(0.5, database="db")
+    latency.observe(5, database="db")
+
+    lines = registry.render().splitlines()[2:]
+    assert lines == [
+        'latency_seconds_bucket{database="db",le="0.1"} 1',
+        'latency_seconds_bucket{database="db",le="1"} 2',
+        'latency_seconds_bucket{database="db",le="+Inf"} 3',
+        'latency_seconds_sum{database="db"} 5.55',
+        'latency_seconds_count{database="db"} 3',
+    ]
+
+
+def test_collected_metrics_are_computed_at_render_time():
+    registry = MetricsRegistry()
+    state = {"in_use": 1}
+    registry.gauge("connections", "Connections", ["state"], collect=lambda: {("in_use",): state["in_use"]})
+
+    state["in_use"] = 2
+
+    assert 'connections{state="in_use"} 2' in registry.render()
+
+
+def test_rejects_invalid_usage():
+    registry = MetricsRegistry()
+    counter = registry.counter("errors_total", "Errors", ["exception"])
+
+    with pytest.raises(ValueError):
+        counter.inc(database="db")
+    with pytest.raises(ValueError):
+        counter.inc(-1, exception="ValueError")
+    with pytest.raises(ValueError):
+        registry.gauge("errors_total", "Duplicate")
@@ -0,0 +1,219 @@
+"""Unit tests for the SQL service connection pool."""
+
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import duckdb
+import pytest
+from ibis import BaseBackend
+from pydantic import Field
+
+from nao_core.config.databases.base import DatabaseConfig
+from nao_core.config.databases.duckdb import DuckDBConfig
+from nao_core.server.pool import ConnectionPool
+
+
+class FakeDatabaseConfig(DatabaseConfig):
+    """Minimal DatabaseConfig that records opened connections."""
+
+    name: str = "db"
+    type: str = "fake"
+    settings: str = "v1"
+    alive: bool = Field(default=True, exclude=True)
+    opened: list[Any] = Field(default_factory=list, exclude=True)
+
+    @classmethod
+    def promptConfig(cls) -> "FakeDatabaseConfig":
+        return cls()
+
+    def connect(self) -> BaseBackend:
+        conn = MagicMock(spec=BaseBackend)
+        self.opened.append(conn)
+        return conn
+
+    def ping(self, conn: BaseBackend) -> bool:
+        return self.alive
+
+    def get_database_name(self) -> str:
+        return self.name
+
+    def opened_mock(self, index: int) -> MagicMock:
+        """The `index`-th connection opened, typed as the mock it is."""
+        return self.opened[index]
+
+
+class TestConnectionPool:
+    def test_reuses_connection_across_checkouts(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config) as first:
+            pass
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is second
+        assert len(config.opened) == 1
+        assert pool.stats() == {("/project", "db"): {"idle": 1, "in_use": 0}}
+
+    def test_keys_by_project_and_database(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project-a", config):
+            pass
+        with pool.connection("/project-b", config):
+            pass
+
+        assert len(config.opened) == 2
+
+    def test_concurrent_checkouts_get_distinct_connections(self):
+        pool = ConnectionPool(max_size=2)
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config) as first:
+            with pool.connection("/project", config) as second:
+                assert first is not second
+
+    def test_waits_then_times_out_when_pool_is_exhausted(self):
+        pool = ConnectionPool(max_size=1, acquire_timeout_s=0.05)
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config):
+            with pytest.raises(TimeoutError):
+                with pool.connection("/project", config):
+                    pass
+
+    def test_waiting_caller_gets_released_connection(self):
+        pool = ConnectionPool(max_size=1, acquire_timeout_s=5)
+        config = FakeDatabaseConfig()
+        acquired = []
+
+        def worker():
+            with pool.connection("/project", config) as conn:
+                acquired.append(conn)
+
+        with pool.connection("/project", config) as conn:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            time.sleep(0.05)
+            assert acquired == []
+
+        thread.join(timeout=5)
+        assert acquired == [conn]
+        assert len(config.opened) == 1
+
+    def test_evicts_idle_connections(self):
+        pool = ConnectionPool(idle_timeout_s=0)
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config):
+            pass
+
+        assert pool.evict_idle() == 1
+        config.opened_mock(0).disconnect.assert_called_once()
+
+    def test_reconnects_when_health_check_fails(self):
+        pool = ConnectionPool(health_check_interval_s=0)
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config) as first:
+            pass
+        config.alive = False
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is not second
+        config.opened_mock(0).disconnect.assert_called_once()
+
+    def test_discards_dead_connection_after_failed_query(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pytest.raises(RuntimeError):
+            with pool.connection("/project", config) as first:
+                config.alive = False
+                raise RuntimeError("server closed the connection unexpectedly")
+
+        config.alive = True
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is not second
+
+    def test_keeps_healthy_connection_after_failed_query(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pytest.raises(ValueError):
+            with pool.connection("/project", config) as first:
+                raise ValueError("syntax error")
+
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is second
+
+    def test_config_change_retires_old_connections(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config) as first:
+            pass
+        config.settings = "v2"
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is not second
+        config.opened_mock(0).disconnect.assert_called_once()
+
+    def test_clear_retires_checked_out_connections(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        with pool.connection("/project", config):
+            pool.clear()
+
+        config.opened_mock(0).disconnect.assert_called_once()
+        assert pool.stats() == {("/project", "db"): {"idle": 0, "in_use": 0}}
+
+    def test_acquire_holds_connection_until_released(self):
+        pool = ConnectionPool(max_size=1, acquire_timeout_s=0.05)
+        config = FakeDatabaseConfig()
+
+        lease = pool.acquire("/project", config)
+        with pytest.raises(TimeoutError):
+            pool.acquire("/project", config)
+        pool.release(lease)
+
+        with pool.connection("/project", config) as conn:
+            assert conn is lease.conn
+
+    def test_release_after_failure_discards_dead_connection(self):
+        pool = ConnectionPool()
+        config = FakeDatabaseConfig()
+
+        lease = pool.acquire("/project", config)
+        config.alive = False
+        pool.release(lease, failed=True)
+
+        config.opened_mock(0).disconnect.assert_called_once()
+        assert pool.stats() == {("/project", "db"): {"idle": 0, "in_use": 0}}
+
+    def test_closes_duckdb_connections_on_release(self, tmp_path):
+        """DuckDB connections are not kept open, so they never hold the database file lock while idle."""
+        path = str(tmp_path / "db.duckdb")
+        duckdb.connect(path).close()
+        pool = ConnectionPool()
+        config = DuckDBConfig(name="db", path=path)
+
+        with pool.connection("/project", config) as first:
+            pass
+        with pool.connection("/project", config) as second:
+            pass
+
+        assert first is not second
+        assert pool.stats() == {("/project", "db"): {"idle": 0, "in_use": 0}}
+        duckdb.connect(path).close()
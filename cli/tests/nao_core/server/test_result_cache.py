@@ -0,0 +1,107 @@
+"""Unit tests for the SQL service result cache."""
+
+import time
+
+import pytest
+
+from nao_core.config.databases import DuckDBConfig
+from nao_core.server.result_cache import CacheKey, ResultCache, is_read_query, normalize_sql
+
+
+def _config(ttl: float = 60, path: str = ":memory:") -> DuckDBConfig:
+    return DuckDBConfig(name="duck", path=path, query_cache_ttl_s=ttl)
+
+
+def _key(cache: ResultCache, sql: str) -> CacheKey:
+    key = cache.key("/project", _config(), sql)
+    assert key is not None
+    return key
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("  SELECT  *\n  FROM t ;", "SELECT * FROM t"),
+        ("select 'a  b' ;;", "select 'a  b'"),
+        ('select "My  Column" from t', 'select "My  Column" from t'),
+    ],
+)
+def test_normalize_sql(sql, expected):
+    assert normalize_sql(sql) == expected
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT 1", True),
+        ("with x as (select 1) select * from x", True),
+        ("(select 1) union (select 2)", True),
+        ("select ';' as s", True),
+        ("INSERT INTO t VALUES (1)", False),
+        ("select 1; drop table t", False),
+        ("explain analyze delete from t", False),
+        ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", False),
+        ("select * into new_t from t", False),
+        ("select 'insert into t' as s, updated_at from t", True),
+    ],
+)
+def test_is_read_query(sql, expected):
+    assert is_read_query(sql) is expected
+
+
+class TestResultCache:
+    def test_hit_for_equivalent_sql(self):
+        cache = ResultCache()
+        key = _key(cache, "SELECT 1")
+        cache.put(key, "result", ttl_s=60)
+
+        assert cache.get(_key(cache, "  SELECT 1;\n")) == "result"
+        assert cache.hits == 1
+
+    def test_key_depends_on_database_settings_and_variant(self):
+        cache = ResultCache()
+        key = cache.key("/project", _config(), "SELECT 1", variant="records")
+
+        assert key != cache.key("/project", _config(path="other.duckdb"), "SELECT 1", variant="records")
+        assert key != cache.key("/project", _config(), "SELECT 1", variant="columns")
+        assert key != cache.key("/other", _config(), "SELECT 1", variant="records")
+
+    def test_no_key_when_disabled_or_not_a_read(self):
+        cache = ResultCache()
+
+        assert cache.key("/project", _config(ttl=0), "SELECT 1") is None
+        assert cache.key("/project", _config(), "DELETE FROM t") is None
+
+    def test_entries_expire(self):
+        cache = ResultCache()
+        key = _key(cache, "SELECT 1")
+        cache.put(key, "result", ttl_s=0.01)
+
+        time.sleep(0.02)
+
+        assert cache.get(key) is None
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(max_entries=2)
+        keys = [_key(cache, f"SELECT {i}") for i in range(3)]
+        cache.put(keys[0], 0, ttl_s=60)
+        cache.put(keys[1], 1, ttl_s=60)
+        cache.get(keys[0])
+
+        cache.put(keys[2], 2, ttl_s=60)
+
+        assert cache.get(keys[0]) == 0
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == 2
+
+    def test_skips_large_results_and_clear(self):
+        cache = ResultCache(max_entry_rows=10)
+        key = _key(cache, "SELECT 1")
+
+        cache.put(key, "large", ttl_s=60, rows=11)
+        assert cache.get(key) is None
+
+        cache.put(key, "small", ttl_s=60, rows=10)
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,139 @@
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from nao_core.server.serialization import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE,
+    column_to_list,
+    convert_value,
+    dataframe_to_columns,
+    dataframe_to_ndjson,
+    dataframe_to_records,
+    negotiate_media_type,
+    table_to_bytes,
+)
+
+
+def _per_cell_records(df: pd.DataFrame) -> list[dict]:
+    return [{k: convert_value(v) for k, v in row.items()} for row in df.to_dict(orient="records")]
+
+
+@pytest.mark.parametrize(
+    "series, expected",
+    [
+        (pd.Series([1, 2, 3], dtype="int32"), [1, 2, 3]),
+        (pd.Series([True, False]), [True, False]),
+        (pd.Series([1.5, np.nan, np.inf, -np.inf]), [1.5, None, None, None]),
+        (pd.Series([1, None], dtype="Int64"), [1, None]),
+        (pd.Series([True, None], dtype="boolean"), [True, None]),
+        (pd.Series(["a", None], dtype="string"), ["a", None]),
+        (pd.Series(["a", None, np.nan], dtype=object), ["a", None, None]),
+        (pd.Series([Decimal("1.25"), Decimal("NaN"), None]), [1.25, None, None]),
+        (pd.Series([date(2024, 1, 2), None]), ["2024-01-02", None]),
+        (pd.Series([b"abc", None]), ["abc", None]),
+        (pd.Series([None, None], dtype=object), [None, None]),
+    ],
+)
+def test_column_to_list_normalizes_values(series, expected):
+    assert column_to_list(series) == expected
+
+
+def test_column_to_list_formats_datetimes():
+    naive = pd.Series(pd.to_datetime(["2024-01-01 10:00:00.123456", None]))
+    aware = naive.dt.tz_localize("UTC")
+
+    assert column_to_list(naive) == ["2024-01-01T10:00:00.123456", None]
+    assert column_to_list(aware) == ["2024-01-01T10:00:00.123456+00:00", None]
+
+
+def test_column_to_list_returns_python_scalars():
+    values = column_to_list(pd.Series([1, 2], dtype="int64")) + column_to_list(pd.Series([0.5], dtype="float32"))
+
+    assert all(type(v) in (int, float) for v in values)
+
+
+def test_mixed_object_column_falls_back_to_per_cell_conversion():
+    series = pd.Series([1, "a", Decimal("2.5"), datetime(2024, 1, 1), np.array([1, 2]), float("nan")], dtype=object)
+
+    assert column_to_list(series) == [1, "a", 2.5, "2024-01-01T00:00:00", [1, 2], None]
+
+
+def test_records_match_per_cell_conversion():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "score": [1.5, np.nan, np.inf],
+            "nullable": pd.Series([1, None, 3], dtype="Int64"),
+            "name": ["a", None, "c"],
+            "amount": [Decimal("1.10"), None, Decimal("Infinity")],
+            "created_at": pd.to_datetime(["2024-01-01", None, "2024-03-01 12:30:00"], format="ISO8601"),
+            "day": [date(2024, 1, 1), None, date(2024, 1, 3)],
+            "raw": [b"x", None, b"z"],
+        }
+    )
+
+    records = dataframe_to_records(df)
+
+    assert records == _per_cell_records(df)
+    json.dumps(records, allow_nan=False)
+
+
+def test_dataframe_to_columns():
+    df = pd.DataFrame({"id": [1, 2], "score": [0.5, np.nan]})
+
+    assert dataframe_to_columns(df) == {"id": [1, 2], "score": [0.5, None]}
+
+
+def test_dataframe_to_ndjson():
+    df = pd.DataFrame({"id": [1, 2], "score": [0.5, np.nan], "day": [date(2024, 1, 2), None]})
+
+    lines = dataframe_to_ndjson(df).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "score": 0.5, "day": "2024-01-02"},
+        {"id": 2, "score": None, "day": None},
+    ]
+    assert dataframe_to_ndjson(df.iloc[:0]) == b""
+
+
+def test_empty_dataframes():
+    assert dataframe_to_records(pd.DataFrame({"id": pd.Series([], dtype="int64")})) == []
+    assert dataframe_to_columns(pd.DataFrame({"id": pd.Series([], dtype="int64")})) == {"id": []}
+    assert dataframe_to_records(pd.DataFrame(index=range(2))) == [{}, {}]
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, None),
+        ("application/json", None),
+        ("*/*", None),
+        (ARROW_STREAM_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE),
+        (f"{PARQUET_MEDIA_TYPE}; q=0.9, application/json", PARQUET_MEDIA_TYPE),
+        (f"application/json, {ARROW_STREAM_MEDIA_TYPE}", None),
+        (NDJSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    assert negotiate_media_type(accept) == expected
+
+
+def test_table_to_bytes_round_trips():
+    table = pa.table({"id": [1, 2], "amount": pa.array([Decimal("1.10"), None], type=pa.decimal128(5, 2))})
+
+    arrow_bytes = table_to_bytes(table, ARROW_STREAM_MEDIA_TYPE)
+    parquet_bytes = table_to_bytes(table, PARQUET_MEDIA_TYPE)
+
+    assert pa.ipc.open_stream(arrow_bytes).read_all().equals(table)
+    assert pq.read_table(io.BytesIO(parquet_bytes)).equals(table)
+    with pytest.raises(ValueError):
+        table_to_bytes(table, "text/csv")
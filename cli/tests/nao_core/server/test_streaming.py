@@ -0,0 +1,70 @@
+"""Unit tests for streaming results out of worker threads."""
+
+import asyncio
+import threading
+
+import pytest
+
+from nao_core.server.executor import QueryExecutor
+from nao_core.server.streaming import StreamClosedError, iterate_in_worker
+
+
+def test_yields_items_in_order():
+    executor = QueryExecutor()
+
+    def produce(emit, count):
+        for i in range(count):
+            emit(i)
+
+    async def main():
+        return [item async for item in iterate_in_worker(executor, "db", produce, 10, max_buffered=2)]
+
+    assert asyncio.run(main()) == list(range(10))
+    executor.shutdown()
+
+
+def test_propagates_producer_errors_after_buffered_items():
+    executor = QueryExecutor()
+
+    def produce(emit):
+        emit("first")
+        raise ValueError("boom")
+
+    async def main():
+        items = []
+        with pytest.raises(ValueError, match="boom"):
+            async for item in iterate_in_worker(executor, "db", produce):
+                items.append(item)
+        return items
+
+    assert asyncio.run(main()) == ["first"]
+    executor.shutdown()
+
+
+def test_early_close_stops_producer_and_calls_on_close():
+    executor = QueryExecutor()
+    stopped = threading.Event()
+    closed = threading.Event()
+    emitted = []
+
+    def produce(emit):
+        try:
+            for i in range(1000):
+                emit(i)
+                emitted.append(i)
+        except StreamClosedError:
+            stopped.set()
+            raise
+
+    async def main():
+        stream = iterate_in_worker(executor, "db", produce, max_buffered=1, on_close=closed.set)
+        first = await anext(stream)
+        await stream.aclose()
+        assert await asyncio.to_thread(stopped.wait, 2)
+        assert await asyncio.to_thread(closed.wait, 2)
+        return first
+
+    assert asyncio.run(main()) == 0
+    # Backpressure: the producer never ran far ahead of the consumer
+    assert len(emitted) < 5
+    executor.shutdown()
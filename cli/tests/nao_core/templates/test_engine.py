@@ -4,6 +4,9 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+from jinja2 import TemplateSyntaxError
+
 from nao_core.templates.engine import (
     DEFAULT_TEMPLATES_DIR,
     TemplateEngine,
@@ -245,6 +248,49 @@ class TestTemplateFilters:
         assert result == "12345"
 
 
+class TestFreeze:
+    """Tests for templates compiled once per run."""
+
+    def test_frozen_templates_ignore_file_changes(self, tmp_path: Path):
+        """Frozen templates, and the templates they include, are not reloaded when their files change."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "test.j2").write_text("Hello {% include 'name.j2' %}")
+        (templates_dir / "name.j2").write_text("{{ name }}")
+
+        frozen = TemplateEngine(project_path=tmp_path).freeze(["test.j2"])
+        assert frozen.render("test.j2", name="World") == "Hello World"
+
+        (templates_dir / "test.j2").write_text("Bye {% include 'name.j2' %}")
+        (templates_dir / "name.j2").write_text("{{ name | upper }}")
+
+        assert frozen.render("test.j2", name="World") == "Hello World"
+
+    def test_frozen_template_errors_are_raised_on_render(self, tmp_path: Path):
+        """A template that fails to compile raises when rendered, not when frozen."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "broken.j2").write_text("{% if %}")
+
+        frozen = TemplateEngine(project_path=tmp_path).freeze(["broken.j2"])
+
+        with pytest.raises(TemplateSyntaxError):
+            frozen.render("broken.j2")
+
+    def test_bytecode_is_cached_on_disk(self, tmp_path: Path):
+        """Compiled templates are written to the bytecode cache directory and reused."""
+        cache_dir = tmp_path / "cache"
+
+        frozen = TemplateEngine().freeze(["databases/columns.md.j2"], bytecode_cache_dir=cache_dir)
+        cached = list(cache_dir.iterdir())
+
+        assert len(cached) == 1
+        warm = TemplateEngine().freeze(["databases/columns.md.j2"], bytecode_cache_dir=cache_dir)
+        assert list(cache_dir.iterdir()) == cached
+        assert warm.env.bytecode_cache is not None
+        assert frozen.env.auto_reload is False
+
+
 class TestGetTemplateEngine:
     """Tests for the get_template_engine function."""
 
@@ -0,0 +1,137 @@
+"""Unit tests for rendering user templates."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from nao_core.config.base import NaoConfig
+from nao_core.config.notion import NotionConfig
+from nao_core.templates.context import NotionPage
+from nao_core.templates.render import discover_templates, render_all_templates
+
+PAGE_ID = "2bfc7a70bc0680978900d1e85ece83a0"
+
+
+def _config() -> NaoConfig:
+    return NaoConfig(project_name="test", notion=NotionConfig(api_key="secret", pages=[PAGE_ID]))
+
+
+def _render(project_path: Path, config: NaoConfig | None = None, **kwargs) -> list[str]:
+    """Render the templates of the project, returning those actually rendered."""
+    result = render_all_templates(project_path, config or _config(), console=MagicMock(), **kwargs)
+    assert result.templates_failed == 0
+    return result.rendered_files
+
+
+class TestDiscoverTemplates:
+    """Tests for the discover_templates function."""
+
+    def test_prunes_excluded_and_synced_directories(self, tmp_path: Path):
+        """Synced output directories are only pruned at the root of the project."""
+        for template in ("report.md.j2", "databases/x.md.j2", "repos/r/x.md.j2", "templates/databases/columns.md.j2"):
+            (tmp_path / template).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / template).write_text("")
+        (tmp_path / "docs" / "databases").mkdir(parents=True)
+        (tmp_path / "docs" / "databases" / "notes.md.j2").write_text("")
+
+        assert discover_templates(tmp_path) == [Path("docs/databases/notes.md.j2"), Path("report.md.j2")]
+
+
+class TestIncrementalRender:
+    """Tests for skipping templates whose inputs did not change."""
+
+    def test_unchanged_templates_are_skipped(self, tmp_path: Path):
+        """Only templates whose source, included templates or output changed are rendered again."""
+        (tmp_path / "a.md.j2").write_text("A")
+        (tmp_path / "b.md.j2").write_text("{% include 'part.txt' %}")
+        (tmp_path / "c.md.j2").write_text("C")
+        (tmp_path / "part.txt").write_text("part")
+        assert _render(tmp_path) == ["a.md", "b.md", "c.md"]
+        assert _render(tmp_path) == []
+
+        (tmp_path / "a.md.j2").write_text("A2")
+        (tmp_path / "part.txt").write_text("part 2")
+        (tmp_path / "c.md").unlink()
+
+        assert _render(tmp_path) == ["a.md", "b.md", "c.md"]
+        assert (tmp_path / "b.md").read_text() == "part 2"
+        assert _render(tmp_path, full=True) == ["a.md", "b.md", "c.md"]
+
+    def test_config_changes_only_render_templates_reading_it(self, tmp_path: Path):
+        """A configuration change renders the templates that read `nao.config`, and only them."""
+        (tmp_path / "name.md.j2").write_text("{{ nao.config.project_name }}")
+        (tmp_path / "static.md.j2").write_text("static")
+        _render(tmp_path)
+
+        config = _config()
+        config.project_name = "renamed"
+
+        assert _render(tmp_path, config) == ["name.md"]
+        assert (tmp_path / "name.md").read_text() == "renamed"
+
+    def test_edited_notion_pages_are_rendered_again(self, tmp_path: Path):
+        """Templates reading a Notion page are rendered again when the page was edited since."""
+        (tmp_path / "page.md.j2").write_text(f"{{{{ nao.notion.page('{PAGE_ID}').content }}}}")
+        (tmp_path / "static.md.j2").write_text("static")
+        page = {"id": PAGE_ID, "title": "Title", "content": "v1", "url": ""}
+        edited = "2024-01-01T00:00:00.000Z"
+
+        with (
+            patch.object(NotionPage, "_fetch", lambda self: dict(page)),
+            patch.object(NotionPage, "_load_last_edited_time", side_effect=lambda: edited),
+        ):
+            assert _render(tmp_path) == ["page.md", "static.md"]
+            assert _render(tmp_path) == []
+
+            page["content"] = "v2"
+            edited = "2024-02-01T00:00:00.000Z"
+
+            assert _render(tmp_path) == ["page.md"]
+        assert (tmp_path / "page.md").read_text() == "v2"
+
+
+class TestRenderAllTemplates:
+    """Tests for the render_all_templates function."""
+
+    def test_renders_templates_in_discovery_order(self, tmp_path: Path):
+        """Every template is rendered and reported in discovery order, with failures reported separately."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md.j2").write_text("{{ nao.config.project_name }}")
+        (tmp_path / "docs" / "b.md.j2").write_text("{% if %}")
+        (tmp_path / "c.md.j2").write_text("{{ nao.config.project_name | upper }}")
+
+        result = render_all_templates(tmp_path, _config(), console=MagicMock())
+
+        assert result.rendered_files == ["c.md", "docs/a.md"]
+        assert result.templates_failed == 1
+        assert result.errors[0].startswith("docs/b.md.j2")
+        assert (tmp_path / "c.md").read_text() == "TEST"
+        assert (tmp_path / "docs" / "a.md").read_text() == "test"
+
+    def test_templates_share_notion_pages(self, tmp_path: Path):
+        """A Notion page read concurrently by several templates, by URL or by ID, is fetched once."""
+        (tmp_path / "by_id.md.j2").write_text(f"{{{{ nao.notion.page('{PAGE_ID}').title }}}}")
+        (tmp_path / "by_url.md.j2").write_text(
+            f"{{{{ nao.notion.page('https://www.notion.so/team/Page-{PAGE_ID}').content }}}}"
+        )
+        fetches = 0
+        lock = threading.Lock()
+
+        def fetch(page):
+            nonlocal fetches
+            with lock:
+                fetches += 1
+            time.sleep(0.1)
+            return {"id": PAGE_ID, "title": "Title", "content": "Content", "url": ""}
+
+        with (
+            patch.object(NotionPage, "_fetch", fetch),
+            patch.object(NotionPage, "_load_last_edited_time", return_value="2024-01-01T00:00:00.000Z"),
+        ):
+            result = render_all_templates(tmp_path, _config(), console=MagicMock())
+
+        assert result.templates_rendered == 2
+        assert fetches == 1
+        assert (tmp_path / "by_id.md").read_text() == "Title"
+        assert (tmp_path / "by_url.md").read_text() == "Content"